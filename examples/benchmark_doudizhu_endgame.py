@@ -0,0 +1,90 @@
+''' Benchmark the Doudizhu endgame solver on positions of random games
+'''
+import argparse
+import time
+
+import numpy as np
+
+from rlcard.games.doudizhu.game import DoudizhuGame
+from rlcard.games.doudizhu.endgame import EndgameSolver
+
+def sample_positions(num_positions, num_cards, seed):
+    ''' Play random games until at most num_cards are left in all the hands
+
+    Returns:
+        (list): The hands, the player to move, the landlord, the cards to
+            beat and the player who played them, as the arguments of
+            `EndgameSolver.solve`
+    '''
+    np_random = np.random.RandomState(seed)
+    game = DoudizhuGame()
+    game.np_random = np_random
+    positions = []
+    while len(positions) < num_positions:
+        state, _ = game.init_game()
+        while not game.is_over() and sum(int(player.hand_counts.sum()) for player in game.players) > num_cards:
+            actions = state['actions']
+            state, _ = game.step(actions[np_random.randint(len(actions))])
+        if game.is_over():
+            continue
+        greater = game.round.greater_player
+        positions.append(([player.hand_counts.copy() for player in game.players],
+                          game.round.current_player, game.round.landlord_id,
+                          None if greater is None else greater.played_cards,
+                          None if greater is None else greater.player_id))
+    return positions
+
+def run(args):
+    positions = sample_positions(args.num_positions, args.num_cards, args.seed)
+
+    # A new solver for every position, so the transposition table does
+    # not carry over between positions of different games
+    num_solved, num_nodes, landlord_wins = 0, 0, 0
+    start = time.perf_counter()
+    for position in positions:
+        solver = EndgameSolver(max_nodes=args.max_nodes, time_limit=args.time_limit)
+        result = solver.solve(*position)
+        num_nodes += result.nodes
+        if result.solved:
+            num_solved += 1
+            landlord_wins += result.value == 1
+    elapsed = time.perf_counter() - start
+
+    print('Positions with at most {} cards left: {}'.format(args.num_cards, len(positions)))
+    print('Solved: {} ({} won by the landlord)'.format(num_solved, landlord_wins))
+    print('Positions solved per second: {:.1f}'.format(num_solved / elapsed))
+    print('Nodes per second: {:.0f}'.format(num_nodes / elapsed))
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser("Doudizhu endgame solver benchmark in RLCard")
+    parser.add_argument(
+        '--num_positions',
+        type=int,
+        default=200,
+    )
+    parser.add_argument(
+        '--num_cards',
+        type=int,
+        default=10,
+        help='The maximum number of cards left in all the hands',
+    )
+    parser.add_argument(
+        '--max_nodes',
+        type=int,
+        default=None,
+    )
+    parser.add_argument(
+        '--time_limit',
+        type=float,
+        default=None,
+        help='The seconds for one position',
+    )
+    parser.add_argument(
+        '--seed',
+        type=int,
+        default=42,
+    )
+
+    args = parser.parse_args()
+
+    run(args)
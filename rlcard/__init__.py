@@ -1,4 +1,4 @@
 name = "rlcard"
 __version__ = "1.2.0"
 
-from rlcard.envs import make
+from rlcard.envs import make, make_vec
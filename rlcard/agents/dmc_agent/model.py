@@ -79,6 +79,24 @@ class DMCAgent:
 
         return action, info
 
+    def step_batch(self, states):
+        ''' Choose the actions of a batch of states for training, with one
+            forward pass
+        '''
+        actions = []
+        for action_keys, values in self.predict_batch(states):
+            if self.exp_epsilon > 0 and np.random.rand() < self.exp_epsilon:
+                actions.append(np.random.choice(action_keys))
+            else:
+                actions.append(action_keys[np.argmax(values)])
+        return actions
+
+    def eval_step_batch(self, states):
+        ''' Choose the actions of a batch of states for evaluation, with one
+            forward pass
+        '''
+        return [action_keys[np.argmax(values)] for action_keys, values in self.predict_batch(states)]
+
     def share_memory(self):
         self.net.share_memory()
 
@@ -89,25 +107,36 @@ class DMCAgent:
         return self.net.parameters()
 
     def predict(self, state):
-        # Prepare obs and actions
-        obs = state['obs'].astype(np.float32)
-        legal_actions = state['legal_actions']
-        action_keys = np.array(list(legal_actions.keys()))
-        action_values = list(legal_actions.values())
-        # One-hot encoding if there is no action features
-        for i in range(len(action_values)):
-            if action_values[i] is None:
-                action_values[i] = np.zeros(self.action_shape[0])
-                action_values[i][action_keys[i]] = 1
-        action_values = np.array(action_values, dtype=np.float32)
-
-        obs = np.repeat(obs[np.newaxis, :], len(action_keys), axis=0)
-
-        # Predict Q values
-        values = self.net.forward(torch.from_numpy(obs).to(self.device),
-                                  torch.from_numpy(action_values).to(self.device))
-
-        return action_keys, values.cpu().detach().numpy()
+        return self.predict_batch([state])[0]
+
+    def predict_batch(self, states):
+        # Prepare the (obs, action) pairs of all the states
+        all_keys, all_obs, all_actions = [], [], []
+        for state in states:
+            obs = state['obs'].astype(np.float32)
+            legal_actions = state['legal_actions']
+            action_keys = np.array(list(legal_actions.keys()))
+            # The environment may gather the features of all the legal actions
+            action_features = state.get('legal_action_features')
+            if action_features is None:
+                action_values = list(legal_actions.values())
+                # One-hot encoding if there is no action features
+                for i in range(len(action_values)):
+                    if action_values[i] is None:
+                        action_values[i] = np.zeros(self.action_shape[0])
+                        action_values[i][action_keys[i]] = 1
+                action_features = action_values
+            all_keys.append(action_keys)
+            all_obs.append(np.repeat(obs[np.newaxis, :], len(action_keys), axis=0))
+            all_actions.append(np.asarray(action_features, dtype=np.float32))
+
+        # Predict Q values in one forward pass
+        values = self.net.forward(torch.from_numpy(np.concatenate(all_obs)).to(self.device),
+                                  torch.from_numpy(np.concatenate(all_actions)).to(self.device))
+        values = values.cpu().detach().numpy()
+        splits = np.cumsum([len(action_keys) for action_keys in all_keys])[:-1]
+
+        return list(zip(all_keys, np.split(values, splits)))
 
     def forward(self, obs, actions):
         return self.net.forward(obs, actions)
@@ -48,10 +48,16 @@ def act_pettingzoo(
     full_queue,
     model,
     buffers,
-    env
+    env,
+    seed=None
 ):
     log.info('Device %s Actor %i started.', str(device), i)
     try:
+        # Every actor gets its own seed, so the actors do not replay the
+        # deals of the pickled environment. The later resets go on from it
+        if seed is not None:
+            env.reset(seed=seed)
+
         done_buf = [[] for _ in range(env.num_agents)]
         episode_return_buf = [[] for _ in range(env.num_agents)]
         target_buf = [[] for _ in range(env.num_agents)]
@@ -24,6 +24,9 @@ import torch
 from torch import multiprocessing as mp
 from torch import nn
 
+from rlcard.envs import EnvFactory
+from rlcard.utils.seeding import spawn_seeds
+
 from .file_writer import FileWriter
 from .model import DMCModel
 from .pettingzoo_model import DMCModelPettingZoo
@@ -104,6 +107,14 @@ class DMCTrainer:
         alpha (float): RMSProp smoothing constant
         momentum (float): RMSProp momentum
         epsilon (float): RMSProp epsilon
+        seed (int): The root seed of the actor environments. Every actor on
+            every device gets an independent seed derived from it, so the
+            actors play reproducible games by default. None for a random
+            root seed
+        context (string): The multiprocessing start method of the actors.
+            None for 'forkserver' where available, else 'spawn'. The
+            forkserver imports torch, rlcard and the game once, and every
+            actor forks from it and makes its environment from an EnvFactory
     """
     def __init__(
         self,
@@ -127,7 +138,9 @@ class DMCTrainer:
         learning_rate=0.0001,
         alpha=0.99,
         momentum=0,
-        epsilon=0.00001
+        epsilon=0.00001,
+        seed=0,
+        context=None
     ):
         self.env = env
 
@@ -158,6 +171,10 @@ class DMCTrainer:
         self.alpha = alpha
         self.momentum = momentum
         self.epsilon = epsilon
+        self.seed = seed
+        if context is None:
+            context = 'forkserver' if 'forkserver' in mp.get_all_start_methods() else 'spawn'
+        self.context = context
 
         self.is_pettingzoo_env = is_pettingzoo_env
         if not self.is_pettingzoo_env:
@@ -220,7 +237,17 @@ class DMCTrainer:
 
         # Initialize queues
         actor_processes = []
-        ctx = mp.get_context('spawn')
+        ctx = mp.get_context(self.context)
+        if not self.is_pettingzoo_env:
+            if EnvFactory.can_make(self.env):
+                env_factory = EnvFactory.from_env(self.env)
+                modules = env_factory.modules
+            else:
+                # Custom environments are pickled to the actors
+                env_factory = self.env
+                modules = [type(self.env).__module__, type(self.env.game).__module__]
+            if self.context == 'forkserver':
+                ctx.set_forkserver_preload(['torch', 'rlcard', 'rlcard.agents.dmc_agent.utils'] + modules)
         free_queue = {}
         full_queue = {}
         for device in self.device_iterator:
@@ -266,12 +293,18 @@ class DMCTrainer:
 
 
         # Starting actor processes
+        actor_seeds = iter(spawn_seeds(self.seed, len(self.device_iterator) * self.num_actors))
         for device in self.device_iterator:
             num_actors = self.num_actors
             for i in range(self.num_actors):
-                actor = ctx.Process(
-                    target=act_pettingzoo if self.is_pettingzoo_env else act,
-                    args=(i, device, self.T, free_queue[device], full_queue[device], models[device], buffers[device], self.env))
+                if self.is_pettingzoo_env:
+                    actor = ctx.Process(
+                        target=act_pettingzoo,
+                        args=(i, device, self.T, free_queue[device], full_queue[device], models[device], buffers[device], self.env, next(actor_seeds)))
+                else:
+                    actor = ctx.Process(
+                        target=act,
+                        args=(i, device, self.T, free_queue[device], full_queue[device], models[device], buffers[device], env_factory, next(actor_seeds)))
                 actor.start()
                 actor_processes.append(actor)
 
@@ -19,6 +19,8 @@ import traceback
 import numpy as np
 import torch
 
+from rlcard.envs import EnvFactory
+
 shandle = logging.StreamHandler()
 shandle.setFormatter(
     logging.Formatter(
@@ -102,13 +104,16 @@ def act(
     full_queue,
     model,
     buffers,
-    env
+    env,
+    seed=None
 ):
     try:
         log.info('Device %s Actor %i started.', str(device), i)
 
         # Configure environment
-        env.seed(i)
+        if isinstance(env, EnvFactory):
+            env = env()
+        env.seed(seed)
         env.set_agents(model.get_agents())
 
         done_buf = [[] for _ in range(env.num_players)]
@@ -130,11 +135,11 @@ def act(
                     episode_return_buf[p].append(float(payoffs[p]))
                     target_buf[p].extend([float(payoffs[p]) for _ in range(diff)])
                     # State and action
+                    actions = env.get_action_features(trajectories[p][1:-1:2])
                     for i in range(0, len(trajectories[p])-2, 2):
                         state = trajectories[p][i]['obs']
-                        action = env.get_action_feature(trajectories[p][i+1])
                         state_buf[p].append(torch.from_numpy(state))
-                        action_buf[p].append(torch.from_numpy(action))
+                        action_buf[p].append(torch.from_numpy(actions[i//2]))
                 
                 while size[p] > T:
                     index = free_queue[p].get()
@@ -0,0 +1,86 @@
+''' A Doudizhu agent that plays endgames exactly
+'''
+from rlcard.games.doudizhu.endgame import EndgameSolver
+from rlcard.games.doudizhu.utils import ACTION_2_ID
+
+
+class DoudizhuEndgameAgent(object):
+    ''' Wraps an agent and plays the moves of the endgame solver instead
+    when at most `card_threshold` cards are left in all the hands. The
+    solver reads the hands from the game of the environment, so this is a
+    perfect information agent, e.g., an oracle baseline for evaluation.
+
+    The wrapped agent plays when the position is not solved within the
+    budget, and when it is lost against perfect play anyway.
+    '''
+
+    def __init__(self, agent, env, card_threshold=10, max_nodes=100000, time_limit=None):
+        ''' Initialize the agent
+
+        Args:
+            agent (object): The agent that plays the rest of the game
+            env (DoudizhuEnv): The environment whose game is solved
+            card_threshold (int): The maximum number of cards left in all
+                the hands to call the solver
+            max_nodes (int): The node budget of one move, None for no limit
+            time_limit (float): The seconds of one move, None for no limit
+        '''
+        self.agent = agent
+        self.env = env
+        self.use_raw = agent.use_raw
+        self.card_threshold = card_threshold
+        self.solver = EndgameSolver(max_nodes=max_nodes, time_limit=time_limit)
+
+    def step(self, state):
+        ''' Predict the action for generating training data
+
+        Args:
+            state (dict): The current state
+
+        Returns:
+            action (int or str): The action
+        '''
+        action, _ = self._solve(state)
+        if action is None:
+            return self.agent.step(state)
+        return action
+
+    def eval_step(self, state):
+        ''' Predict the action for evaluation
+
+        Args:
+            state (dict): The current state
+
+        Returns:
+            action (int or str): The action
+            info (dict): The result of the solver under 'endgame', None if
+                it was not called
+        '''
+        action, result = self._solve(state)
+        if action is None:
+            action, info = self.agent.eval_step(state)
+            info = dict(info) if isinstance(info, dict) else {}
+        else:
+            info = {}
+        info['endgame'] = result
+        return action, info
+
+    def _solve(self, state):
+        ''' Solve the position if few cards are left
+
+        Returns:
+            action (int or str): The winning action, None if the wrapped
+                agent should play
+            result (EndgameResult): The result of the solver, None if it
+                was not called
+        '''
+        if sum(state['raw_obs']['num_cards_left']) > self.card_threshold:
+            return None, None
+        game = self.env.game
+        result = self.solver.solve_game(game)
+        is_landlord = game.round.current_player == game.round.landlord_id
+        if not result.solved or (result.value == 1) != is_landlord:
+            return None, result
+        if self.use_raw:
+            return result.action, result
+        return ACTION_2_ID[result.action], result
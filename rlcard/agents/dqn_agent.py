@@ -33,7 +33,8 @@ import torch.nn as nn
 from collections import namedtuple
 from copy import deepcopy
 
-from rlcard.utils.utils import remove_illegal
+from rlcard.utils.utils import remove_illegal, legal_action_ids
+from rlcard.utils.obs_encoding import decode_obs_batch
 
 Transition = namedtuple('Transition', ['state', 'action', 'reward', 'next_state', 'done', 'legal_actions'])
 
@@ -59,7 +60,8 @@ class DQNAgent(object):
                  learning_rate=0.00005,
                  device=None,
                  save_path=None,
-                 save_every=float('inf'),):
+                 save_every=float('inf'),
+                 obs_encoding='dense'):
 
         '''
         Q-Learning algorithm for off-policy TD control using Function Approximation.
@@ -86,6 +88,9 @@ class DQNAgent(object):
             device (torch.device): whether to use the cpu or gpu
             save_path (str): The path to save the model checkpoints
             save_every (int): Save the model every X training steps
+            obs_encoding (str): 'dense', or 'packed' / 'sparse' to store the
+              'encoded_obs' of the states in the replay memory, for
+              environments made with the same 'obs_encoding' config
         '''
         self.use_raw = False
         self.replay_memory_init_size = replay_memory_init_size
@@ -95,6 +100,7 @@ class DQNAgent(object):
         self.batch_size = batch_size
         self.num_actions = num_actions
         self.train_every = train_every
+        self.obs_encoding = obs_encoding
 
         # Torch device
         if device is None:
@@ -118,7 +124,7 @@ class DQNAgent(object):
             mlp_layers=mlp_layers, device=self.device)
 
         # Create replay memory
-        self.memory = Memory(replay_memory_size, batch_size)
+        self.memory = Memory(replay_memory_size, batch_size, obs_encoding, state_shape)
         
         # Checkpoint saving parameters
         self.save_path = save_path
@@ -133,7 +139,8 @@ class DQNAgent(object):
             ts (list): a list of 5 elements that represent the transition
         '''
         (state, action, reward, next_state, done) = tuple(ts)
-        self.feed_memory(state['obs'], action, reward, next_state['obs'], list(next_state['legal_actions'].keys()), done)
+        key = 'obs' if self.obs_encoding == 'dense' else 'encoded_obs'
+        self.feed_memory(state[key], action, reward, next_state[key], legal_action_ids(next_state), done)
         self.total_t += 1
         tmp = self.total_t - self.replay_memory_init_size
         if tmp>=0 and tmp%self.train_every == 0:
@@ -149,12 +156,27 @@ class DQNAgent(object):
         Returns:
             action (int): an action id
         '''
-        q_values = self.predict(state)
+        return self._explore(state, self.predict(state))
+
+    def step_batch(self, states):
+        ''' Predict the actions of a batch of states for generating training
+            data, with one forward pass
+
+        Args:
+            states (list): A list of states
+
+        Returns:
+            actions (list): The action id of each state
+        '''
+        return [self._explore(state, q_values) for state, q_values in zip(states, self.predict_batch(states))]
+
+    def _explore(self, state, q_values):
+        ''' Choose an epsilon-greedy action from the masked Q-values
+        '''
         epsilon = self.epsilons[min(self.total_t, self.epsilon_decay_steps-1)]
-        legal_actions = list(state['legal_actions'].keys())
+        legal_actions = np.asarray(legal_action_ids(state))
         probs = np.ones(len(legal_actions), dtype=float) * epsilon / len(legal_actions)
-        best_action_idx = legal_actions.index(np.argmax(q_values))
-        probs[best_action_idx] += (1.0 - epsilon)
+        probs[legal_actions == np.argmax(q_values)] += (1.0 - epsilon)
         action_idx = np.random.choice(np.arange(len(probs)), p=probs)
 
         return legal_actions[action_idx]
@@ -177,6 +199,18 @@ class DQNAgent(object):
 
         return best_action, info
 
+    def eval_step_batch(self, states):
+        ''' Predict the actions of a batch of states for evaluation, with one
+            forward pass
+
+        Args:
+            states (list): A list of states
+
+        Returns:
+            actions (list): The action id of each state
+        '''
+        return list(np.argmax(self.predict_batch(states), axis=1))
+
     def predict(self, state):
         ''' Predict the masked Q-values
 
@@ -186,11 +220,22 @@ class DQNAgent(object):
         Returns:
             q_values (numpy.array): a 1-d array where each entry represents a Q value
         '''
-        
-        q_values = self.q_estimator.predict_nograd(np.expand_dims(state['obs'], 0))[0]
-        masked_q_values = -np.inf * np.ones(self.num_actions, dtype=float)
-        legal_actions = list(state['legal_actions'].keys())
-        masked_q_values[legal_actions] = q_values[legal_actions]
+        return self.predict_batch([state])[0]
+
+    def predict_batch(self, states):
+        ''' Predict the masked Q-values of a batch of states
+
+        Args:
+            states (list): A list of states
+
+        Returns:
+            q_values (numpy.array): a 2-d array with the Q values of each state
+        '''
+        q_values = self.q_estimator.predict_nograd(np.stack([state['obs'] for state in states]))
+        masked_q_values = -np.inf * np.ones((len(states), self.num_actions), dtype=float)
+        for i, state in enumerate(states):
+            legal_actions = state['legal_mask'] if 'legal_mask' in state else list(state['legal_actions'].keys())
+            masked_q_values[i, legal_actions] = q_values[i, legal_actions]
 
         return masked_q_values
 
@@ -204,9 +249,8 @@ class DQNAgent(object):
 
         # Calculate best next actions using Q-network (Double DQN)
         q_values_next = self.q_estimator.predict_nograd(next_state_batch)
-        legal_actions = []
-        for b in range(self.batch_size):
-            legal_actions.extend([i + b * self.num_actions for i in legal_actions_batch[b]])
+        legal_actions = np.concatenate([np.asarray(legal_actions_batch[b], dtype=np.int64) + b * self.num_actions
+                                        for b in range(self.batch_size)])
         masked_q_values = -np.inf * np.ones(self.num_actions * self.batch_size, dtype=float)
         masked_q_values[legal_actions] = q_values_next.flatten()[legal_actions]
         masked_q_values = masked_q_values.reshape((self.batch_size, self.num_actions))
@@ -279,7 +323,8 @@ class DQNAgent(object):
             'train_every': self.train_every,
             'device': self.device,
             'save_path': self.save_path,
-            'save_every': self.save_every
+            'save_every': self.save_every,
+            'obs_encoding': self.obs_encoding
         }
 
     @classmethod
@@ -309,6 +354,7 @@ class DQNAgent(object):
             device=checkpoint['device'],
             save_path=checkpoint['save_path'],
             save_every=checkpoint['save_every'],
+            obs_encoding=checkpoint.get('obs_encoding', 'dense'),
         )
         
         agent_instance.total_t = checkpoint['total_t']
@@ -497,13 +543,18 @@ class Memory(object):
     ''' Memory for saving transitions
     '''
 
-    def __init__(self, memory_size, batch_size):
+    def __init__(self, memory_size, batch_size, obs_encoding='dense', state_shape=None):
         ''' Initialize
         Args:
             memory_size (int): the size of the memroy buffer
+            obs_encoding (str): The encoding of the saved states, which are
+                decoded into float32 arrays of state_shape when sampled
+            state_shape (list): The shape of a decoded state
         '''
         self.memory_size = memory_size
         self.batch_size = batch_size
+        self.obs_encoding = obs_encoding
+        self.state_shape = state_shape
         self.memory = []
 
     def save(self, state, action, reward, next_state, legal_actions, done):
@@ -534,6 +585,10 @@ class Memory(object):
         '''
         samples = random.sample(self.memory, self.batch_size)
         samples = tuple(zip(*samples))
+        if self.obs_encoding != 'dense':
+            state_batch, next_state_batch = [decode_obs_batch(batch, self.state_shape, self.obs_encoding, np.float32)
+                                             for batch in (samples[0], samples[3])]
+            samples = (state_batch, ) + samples[1:3] + (next_state_batch, ) + samples[4:]
         return tuple(map(np.array, samples[:-1])) + (samples[-1],)
 
     def checkpoint_attributes(self):
@@ -543,6 +598,8 @@ class Memory(object):
         return {
             'memory_size': self.memory_size,
             'batch_size': self.batch_size,
+            'obs_encoding': self.obs_encoding,
+            'state_shape': self.state_shape,
             'memory': self.memory
         }
             
@@ -558,6 +615,7 @@ class Memory(object):
             instance (Memory): the restored instance
         '''
         
-        instance = cls(checkpoint['memory_size'], checkpoint['batch_size'])
+        instance = cls(checkpoint['memory_size'], checkpoint['batch_size'],
+                       checkpoint.get('obs_encoding', 'dense'), checkpoint.get('state_shape'))
         instance.memory = checkpoint['memory']
         return instance
@@ -2,6 +2,7 @@ import numpy as np
 from collections import OrderedDict
 
 from rlcard.envs import Env
+from rlcard.utils import LazyState
 from rlcard.games.blackjack import Game
 
 DEFAULT_GAME_CONFIG = {
@@ -44,21 +45,27 @@ class BlackjackEnv(Env):
         Returns:
             observation (list): combine the player's score and dealer's observable score for observation
         '''
-        cards = state['state']
-        my_cards = cards[0]
-        dealer_cards = cards[1]
-
-        my_score = get_score(my_cards)
-        dealer_score = get_score(dealer_cards)
-        obs = np.array([my_score, dealer_score])
+        obs = np.zeros(2, dtype=int)
+        self._encode_obs(state, obs)
 
         legal_actions = OrderedDict({i: None for i in range(len(self.actions))})
-        extracted_state = {'obs': obs, 'legal_actions': legal_actions}
+        extracted_state = LazyState({'obs': obs, 'legal_actions': legal_actions})
         extracted_state['raw_obs'] = state
-        extracted_state['raw_legal_actions'] = [a for a in self.actions]
+        extracted_state.set_lazy('raw_legal_actions', lambda: [a for a in self.actions])
         extracted_state['action_record'] = self.action_recorder
         return extracted_state
 
+    def _encode_obs(self, state, out):
+        ''' Write the player's score and dealer's observable score into out
+
+        Args:
+            state (dict): Original state from the game
+            out (numpy.array): The array to write to
+        '''
+        cards = state['state']
+        out[0] = get_score(cards[0])
+        out[1] = get_score(cards[1])
+
     def get_payoffs(self):
         ''' Get the payoff of a game
 
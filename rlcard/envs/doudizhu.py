@@ -1,21 +1,26 @@
-from collections import Counter, OrderedDict
 import numpy as np
 
 from rlcard.envs import Env
+from rlcard.utils import LazyState
 
 
 class DoudizhuEnv(Env):
     ''' Doudizhu Environment
     '''
+    # The legal mask holds the legal action ids of the 27472 actions
+    legal_mask_packed = True
+    binary_obs = True
 
     def __init__(self, config):
-        from rlcard.games.doudizhu.utils import ACTION_2_ID, ID_2_ACTION
+        from rlcard.games.doudizhu.utils import ACTION_2_ID, ID_2_ACTION, ACTION_FEATURES, PASS_ID
         from rlcard.games.doudizhu.utils import cards2str, cards2str_with_suit
         from rlcard.games.doudizhu import Game
         self._cards2str = cards2str
         self._cards2str_with_suit = cards2str_with_suit
         self._ACTION_2_ID = ACTION_2_ID
         self._ID_2_ACTION = ID_2_ACTION
+        self._action_features = ACTION_FEATURES
+        self._PASS_ID = PASS_ID
         
         self.name = 'doudizhu'
         self.game = Game()
@@ -28,68 +33,79 @@ class DoudizhuEnv(Env):
 
         Args:
             state (dict): dict of original state
+
+        Note: 'legal_action_features' holds the features of all the legal
+              actions as one (num_legal_actions, 54) array, in the order of
+              'legal_actions', whose values are its rows
         '''
-        current_hand = _cards2array(state['current_hand'])
-        others_hand = _cards2array(state['others_hand'])
-
-        last_action = ''
-        if len(state['trace']) != 0:
-            if state['trace'][-1][1] == 'pass':
-                last_action = state['trace'][-2][1]
-            else:
-                last_action = state['trace'][-1][1]
-        last_action = _cards2array(last_action)
-
-        last_9_actions = _action_seq2array(_process_action_seq(state['trace']))
-
-        if state['self'] == 0: # landlord
-            landlord_up_played_cards = _cards2array(state['played_cards'][2])
-            landlord_down_played_cards = _cards2array(state['played_cards'][1])
-            landlord_up_num_cards_left = _get_one_hot_array(state['num_cards_left'][2], 17) 
-            landlord_down_num_cards_left = _get_one_hot_array(state['num_cards_left'][1], 17)
-            obs = np.concatenate((current_hand,
-                                  others_hand,
-                                  last_action,
-                                  last_9_actions,
-                                  landlord_up_played_cards,
-                                  landlord_down_played_cards,
-                                  landlord_up_num_cards_left,
-                                  landlord_down_num_cards_left))
-        else:
-            landlord_played_cards = _cards2array(state['played_cards'][0])
-            for i, action in reversed(state['trace']):
-                if i == 0:
-                    last_landlord_action = action
-                    break
-            last_landlord_action = _cards2array(last_landlord_action)
-            landlord_num_cards_left = _get_one_hot_array(state['num_cards_left'][0], 20)
-
-            teammate_id = 3 - state['self']
-            teammate_played_cards = _cards2array(state['played_cards'][teammate_id])
-            last_teammate_action = 'pass'
-            for i, action in reversed(state['trace']):
-                if i == teammate_id:
-                    last_teammate_action = action
-                    break
-            last_teammate_action = _cards2array(last_teammate_action)
-            teammate_num_cards_left = _get_one_hot_array(state['num_cards_left'][teammate_id], 17)
-            obs = np.concatenate((current_hand,
-                                  others_hand,
-                                  last_action,
-                                  last_9_actions,
-                                  landlord_played_cards,
-                                  teammate_played_cards,
-                                  last_landlord_action,
-                                  last_teammate_action,
-                                  landlord_num_cards_left,
-                                  teammate_num_cards_left))
-
-        extracted_state = OrderedDict({'obs': obs, 'legal_actions': self._get_legal_actions()})
+        obs = np.zeros(790 if state['self'] == 0 else 901, dtype=np.int8)
+        self._encode_obs(state, obs)
+
+        action_ids, action_features = self._get_legal_action_features()
+        extracted_state = LazyState({'obs': obs, 'legal_actions': dict(zip(action_ids.tolist(), action_features))})
+        extracted_state['legal_action_features'] = action_features
         extracted_state['raw_obs'] = state
-        extracted_state['raw_legal_actions'] = [a for a in state['actions']]
+        extracted_state.set_lazy('raw_legal_actions', lambda: [a for a in state['actions']])
         extracted_state['action_record'] = self.action_recorder
         return extracted_state
             
+    def _encode_obs(self, state, out):
+        ''' Write the observation into out. The landlord observes 790 features:
+        current hand, others' hand, last action, last 9 actions, cards played
+        by the landlord up and landlord down, and their numbers of cards left.
+        The peasants observe 901 features: current hand, others' hand, last
+        action, last 9 actions, cards played by the landlord and the teammate,
+        their last actions, and their numbers of cards left.
+
+        The features are assembled from the rank counts and the action ids
+        that the round of the game keeps up to date, so state must be a state
+        of the current game.
+
+        Args:
+            state (dict): dict of original state
+            out (numpy.array): The array to write to
+        '''
+        game_round = self.game.round
+        player_id = state['self']
+        hand_counts = [player.hand_counts for player in self.game.players]
+        played_counts = game_round.played_cards
+        action_ids = game_round.action_ids
+        action_features = self._action_features
+
+        out[:] = 0
+        up_id, down_id = (player_id + 1) % 3, (player_id + 2) % 3
+        _encode_counts(hand_counts[player_id], out[0:54])
+        _encode_counts(hand_counts[up_id] + hand_counts[down_id], out[54:108])
+
+        if action_ids:
+            last_action_id = action_ids[-1]
+            if last_action_id == self._PASS_ID and len(action_ids) > 1:
+                last_action_id = action_ids[-2]
+            out[108:162] = action_features[last_action_id]
+
+        # The last 9 actions, the earliest first
+        recent_ids = action_ids[-9:]
+        if recent_ids:
+            out[648-54*len(recent_ids):648] = action_features[recent_ids].ravel()
+
+        if player_id == 0: # landlord
+            _encode_counts(played_counts[2], out[648:702])
+            _encode_counts(played_counts[1], out[702:756])
+            _encode_one_hot(int(hand_counts[2].sum()), out[756:773])
+            _encode_one_hot(int(hand_counts[1].sum()), out[773:790])
+        else:
+            _encode_counts(played_counts[0], out[648:702])
+            teammate_id = 3 - player_id
+            _encode_counts(played_counts[teammate_id], out[702:756])
+            # The last actions of the landlord and the teammate, none before
+            # they have acted
+            for start, seat in ((756, 0), (810, teammate_id)):
+                index = game_round.last_action_index(seat)
+                if index >= 0:
+                    out[start:start+54] = action_features[action_ids[index]]
+            _encode_one_hot(int(hand_counts[0].sum()), out[864:884])
+            _encode_one_hot(int(hand_counts[teammate_id].sum()), out[884:901])
+
     def get_payoffs(self):
         ''' Get the payoffs of players. Must be implemented in the child class.
 
@@ -115,9 +131,28 @@ class DoudizhuEnv(Env):
         Returns:
             legal_actions (list): a list of legal actions' id
         '''
-        legal_actions = self.game.state['actions']
-        legal_actions = {self._ACTION_2_ID[action]: _cards2array(action) for action in legal_actions}
-        return legal_actions
+        action_ids, action_features = self._get_legal_action_features()
+        return dict(zip(action_ids.tolist(), action_features))
+
+    def _get_legal_action_ids(self, extracted_state):
+        ''' The ids of the legal actions for the legal mask, as converted
+        once per step from the actions of the game
+        '''
+        return self._get_legal_action_features()[0]
+
+    def _get_legal_action_features(self):
+        ''' Get the ids and the features of the legal actions, gathered from
+        the precomputed features of all the actions
+
+        Returns:
+            action_ids (numpy.array): the ids of the legal actions
+            action_features (numpy.array): their features, one row per action
+        '''
+        return self._cached('legal_action_features', self._compute_legal_action_features)
+
+    def _compute_legal_action_features(self):
+        action_ids = np.array([self._ACTION_2_ID[action] for action in self.game.state['actions']], dtype=np.int64)
+        return action_ids, self._action_features[action_ids]
 
     def get_perfect_information(self):
         ''' Get the perfect information of the current state
@@ -139,50 +174,28 @@ class DoudizhuEnv(Env):
         Returns:
             (numpy.array): The action features
         '''
-        return _cards2array(self._decode_action(action))
-
-Card2Column = {'3': 0, '4': 1, '5': 2, '6': 3, '7': 4, '8': 5, '9': 6, 'T': 7,
-               'J': 8, 'Q': 9, 'K': 10, 'A': 11, '2': 12}
-
-NumOnes2Array = {0: np.array([0, 0, 0, 0]),
-                 1: np.array([1, 0, 0, 0]),
-                 2: np.array([1, 1, 0, 0]),
-                 3: np.array([1, 1, 1, 0]),
-                 4: np.array([1, 1, 1, 1])}
-
-def _cards2array(cards):
-    if cards == 'pass':
-        return np.zeros(54, dtype=np.int8)
-
-    matrix = np.zeros([4, 13], dtype=np.int8)
-    jokers = np.zeros(2, dtype=np.int8)
-    counter = Counter(cards)
-    for card, num_times in counter.items():
-        if card == 'B':
-            jokers[0] = 1
-        elif card == 'R':
-            jokers[1] = 1
-        else:
-            matrix[:, Card2Column[card]] = NumOnes2Array[num_times]
-    return np.concatenate((matrix.flatten('F'), jokers))
-
-def _get_one_hot_array(num_left_cards, max_num_cards):
-    one_hot = np.zeros(max_num_cards, dtype=np.int8)
-    one_hot[num_left_cards - 1] = 1
-
-    return one_hot
-
-def _action_seq2array(action_seq_list):
-    action_seq_array = np.zeros((len(action_seq_list), 54), np.int8)
-    for row, cards in enumerate(action_seq_list):
-        action_seq_array[row, :] = _cards2array(cards)
-    action_seq_array = action_seq_array.flatten()
-    return action_seq_array
-
-def _process_action_seq(sequence, length=9):
-    sequence = [action[1] for action in sequence[-length:]]
-    if len(sequence) < length:
-        empty_sequence = ['' for _ in range(length - len(sequence))]
-        empty_sequence.extend(sequence)
-        sequence = empty_sequence
-    return sequence
+        return np.array(self._action_features[action])
+
+    def get_action_features(self, actions):
+        ''' Get the features of several actions at once
+
+        Args:
+            actions (list): The action ids
+
+        Returns:
+            (numpy.array): The features, one row per action
+        '''
+        return self._action_features[np.asarray(actions, dtype=np.int64)]
+
+_COPIES = np.arange(4)
+
+def _encode_counts(counts, out):
+    ''' Set the 54 features of cards given by their rank counts. Each rank
+    has 4 features, one for each copy of the card, followed by the black and
+    the red joker
+    '''
+    out[:52] = (counts[:13, np.newaxis] > _COPIES).ravel()
+    out[52:] = counts[13:]
+
+def _encode_one_hot(num_left_cards, out):
+    out[num_left_cards - 1] = 1
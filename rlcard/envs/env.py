@@ -1,4 +1,7 @@
+import copy
+
 from rlcard.utils import *
+from rlcard.utils.obs_encoding import OBS_ENCODINGS
 
 class Env(object):
     '''
@@ -6,6 +9,16 @@ class Env(object):
     we should base on this class and implement as many functions
     as we can.
     '''
+    # True if the optional legal mask holds the legal action ids instead of
+    # a boolean array of length num_actions
+    legal_mask_packed = False
+    # True if all the observation features are 0 or 1, which allows the
+    # 'packed' and 'sparse' observation encodings
+    binary_obs = False
+    # The smallest dtype that holds the observations, used with the config
+    # {'obs_dtype': 'compact'}
+    compact_obs_dtype = np.int8
+
     def __init__(self, config):
         ''' Initialize the environment
 
@@ -15,6 +28,18 @@ class Env(object):
                 'seed' (int) - A environment local random seed.
                 'allow_step_back' (boolean) - True if allowing
                  step_back.
+                'legal_mask' (boolean) - True if adding a fixed-size
+                 'legal_mask' array to every state, see `_make_state`.
+                'rng' (str) - The random number generator of the game,
+                 'random_state' (default) or 'generator' for the faster
+                 np.random.Generator, see `rlcard.utils.seeding.np_random`.
+                'obs_dtype' (str) - The dtype of the observations, None
+                 (default) for the dtype of the game, 'compact' for
+                 `compact_obs_dtype`, or a numpy dtype name.
+                'obs_encoding' (str) - 'dense' (default), or 'packed' or
+                 'sparse' to add an 'encoded_obs' entry to every state,
+                 see `rlcard.utils.obs_encoding`. Only for environments
+                 with `binary_obs`.
                 There can be some game specific configurations, e.g., the
                 number of players in the game. These fields should start with
                 'game_', e.g., 'game_num_players' which specify the number of
@@ -25,7 +50,23 @@ class Env(object):
                 TODO: Support more game configurations in the future.
         '''
         self.allow_step_back = self.game.allow_step_back = config['allow_step_back']
+        self.config = config
+        self.use_legal_mask = config.get('legal_mask', False)
+        self.rng_backend = config.get('rng', 'random_state')
+        self.obs_dtype = config.get('obs_dtype')
+        if self.obs_dtype == 'compact':
+            self.obs_dtype = self.compact_obs_dtype
+        if self.obs_dtype is not None:
+            self.obs_dtype = np.dtype(self.obs_dtype)
+        self.obs_encoding = config.get('obs_encoding', 'dense')
+        if self.obs_encoding not in OBS_ENCODINGS:
+            raise ValueError('Unknown observation encoding: {}'.format(self.obs_encoding))
+        if self.obs_encoding != 'dense' and not self.binary_obs:
+            raise ValueError("The '{}' encoding requires 0/1 observations, which {} does not have".format(self.obs_encoding, self.name))
         self.action_recorder = []
+        self.action_id_recorder = []
+        # Values derived from the current game state, see `_cached`
+        self._step_cache = {}
 
         # Game specific configurations
         # Currently only support blackjack、limit-holdem、no-limit-holdem
@@ -59,8 +100,10 @@ class Env(object):
                 (int): The begining player
         '''
         state, player_id = self.game.init_game()
+        self._clear_cache()
         self.action_recorder = []
-        return self._extract_state(state), player_id
+        self.action_id_recorder = []
+        return self._make_state(state), player_id
 
     def step(self, action, raw_action=False):
         ''' Step forward
@@ -75,6 +118,8 @@ class Env(object):
                 (dict): The next state
                 (int): The ID of the next player
         '''
+        # Record the action id for game logs, None for raw actions
+        self.action_id_recorder.append(None if raw_action else action)
         if not raw_action:
             action = self._decode_action(action)
 
@@ -82,8 +127,9 @@ class Env(object):
         # Record the action for human interface
         self.action_recorder.append((self.get_player_id(), action))
         next_state, player_id = self.game.step(action)
+        self._clear_cache()
 
-        return self._extract_state(next_state), player_id
+        return self._make_state(next_state), player_id
 
     def step_back(self):
         ''' Take one step backward.
@@ -101,12 +147,62 @@ class Env(object):
 
         if not self.game.step_back():
             return False
+        self._clear_cache()
+        self.action_id_recorder.pop()
 
         player_id = self.get_player_id()
         state = self.get_state(player_id)
 
         return state, player_id
 
+    def snapshot(self):
+        ''' Take a snapshot of the current game, including the random state.
+        Unlike `step_back`, a snapshot can be restored from any later state,
+        any number of times.
+
+        Returns:
+            (tuple): An opaque snapshot to be passed to `restore`
+        '''
+        return self.game.snapshot(), list(self.action_recorder), list(self.action_id_recorder), self.timestep
+
+    def restore(self, snapshot):
+        ''' Restore the game to a snapshot taken by `snapshot`
+
+        Args:
+            snapshot (tuple): The snapshot
+
+        Returns:
+            (tuple): Tuple containing:
+
+                (dict): The state of the current player
+                (int): The ID of the current player
+        '''
+        game_snapshot, action_recorder, action_id_recorder, self.timestep = snapshot
+        self.game.restore(game_snapshot)
+        self._clear_cache()
+        self.np_random = self.game.np_random
+        self.action_recorder = list(action_recorder)
+        self.action_id_recorder = list(action_id_recorder)
+
+        player_id = self.get_player_id()
+        return self.get_state(player_id), player_id
+
+    def clone(self):
+        ''' Create an independent copy of the environment in the current
+        game state, with its own random number generator. The agents are
+        shared with the copy.
+
+        Returns:
+            (Env): The copy of the environment
+        '''
+        env = copy.copy(self)
+        env.game = self.game.clone()
+        env.np_random = env.game.np_random
+        env._step_cache = {}
+        env.action_recorder = list(self.action_recorder)
+        env.action_id_recorder = list(self.action_id_recorder)
+        return env
+
     def set_agents(self, agents):
         '''
         Set the agents that will interact with the environment.
@@ -117,12 +213,15 @@ class Env(object):
         '''
         self.agents = agents
 
-    def run(self, is_training=False):
+    def run(self, is_training=False, mode='trajectory'):
         '''
         Run a complete game, either for evaluation or training RL agent.
 
         Args:
             is_training (boolean): True if for training purpose.
+            mode (string): 'trajectory' returns the state dictionaries and actions.
+                'columnar' only records the observations, legal-action masks
+                and action ids of each player into numpy arrays.
 
         Returns:
             (tuple) Tuple containing:
@@ -132,7 +231,15 @@ class Env(object):
 
         Note: The trajectories are 3-dimension list. The first dimension is for different players.
               The second dimension is for different transitions. The third dimension is for the contents of each transiton
+              In 'columnar' mode, each entry of the trajectories is a dictionary of arrays,
+              see `run_many` for the details.
         '''
+        if mode == 'columnar':
+            trajectories, payoffs = self.run_many(1, is_training=is_training)
+            return trajectories, payoffs[0]
+        if mode != 'trajectory':
+            raise ValueError('Unknown run mode: {}'.format(mode))
+
         trajectories = [[] for _ in range(self.num_players)]
         state, player_id = self.reset()
 
@@ -145,7 +252,6 @@ class Env(object):
             else:
                 action = self.agents[player_id].step(state)
 
-            print("Player {}, raw action is {}".format(player_id, action))
             # Environment steps
             next_state, next_player_id = self.step(action, self.agents[player_id].use_raw)
             # Save action
@@ -156,7 +262,7 @@ class Env(object):
             player_id = next_player_id
 
             # Save state.
-            if not self.game.is_over():
+            if not self.is_over():
                 trajectories[player_id].append(state)
 
         # Add a final state to all the players
@@ -169,13 +275,64 @@ class Env(object):
 
         return trajectories, payoffs
 
+    def run_many(self, num_episodes, is_training=False):
+        '''
+        Run several complete games and record them in columnar form. Only the
+        observation, the legal-action mask and the action id of every decision
+        are kept, in preallocated numpy arrays for each player.
+
+        Args:
+            num_episodes (int): The number of games to play.
+            is_training (boolean): True if for training purpose.
+
+        Returns:
+            (tuple) Tuple containing:
+
+                (list): One dictionary for each player with the arrays
+                    'obs' (N, *obs_shape), 'legal_mask' (N, num_actions),
+                    'action' (N,), 'step' (N,) the index of the decision in its
+                    game, and 'episode' (N,) the index of the game.
+                (numpy.array): The payoffs of shape (num_episodes, num_players).
+
+        Note: The agents must output action ids, i.e., raw agents are not supported.
+              With config {'obs_encoding': 'packed'}, 'obs' holds the packed
+              observations, (N, num_bytes). With 'sparse', it is a list of the
+              N index arrays. Decode them with `decode_obs_batch`.
+              If `legal_mask_packed` is True (e.g. for the large action space of
+              Doudizhu), 'legal_mask' is replaced by the sorted legal action ids
+              of all the decisions, 'legal_ids', and 'legal_offsets' (N+1,), so
+              that the ids of decision i are legal_ids[legal_offsets[i]:legal_offsets[i+1]].
+        '''
+        for agent in self.agents:
+            if getattr(agent, 'use_raw', False):
+                raise ValueError('Columnar mode requires agents that output action ids')
+
+        columns = [_ColumnBuffer(self.num_actions, self.obs_encoding, self.legal_mask_packed)
+                   for _ in range(self.num_players)]
+        payoffs = np.zeros((num_episodes, self.num_players))
+        for episode in range(num_episodes):
+            state, player_id = self.reset()
+            step = 0
+            while not self.is_over():
+                if not is_training:
+                    action, _ = self.agents[player_id].eval_step(state)
+                else:
+                    action = self.agents[player_id].step(state)
+                columns[player_id].append(state, action, step, episode)
+                state, player_id = self.step(action)
+                step += 1
+            payoffs[episode] = self.get_payoffs()
+
+        trajectories = [column.to_dict() for column in columns]
+        return trajectories, payoffs
+
     def is_over(self):
         ''' Check whether the curent game is over
 
         Returns:
             (boolean): True if current game is over
         '''
-        return self.game.is_over()
+        return self._cached('is_over', self.game.is_over)
 
     def get_player_id(self):
         ''' Get the current player id
@@ -195,7 +352,24 @@ class Env(object):
         Returns:
             (numpy.array): The observed state of the player
         '''
-        return self._extract_state(self.game.get_state(player_id))
+        return self._make_state(self.game.get_state(player_id))
+
+    def extract_obs_into(self, out, player_id):
+        ''' Write the observation of a player into a preallocated array, e.g.,
+        a row of a vector env or DMC buffer, instead of building the state
+        dictionary and a new observation array
+
+        Args:
+            out (numpy.array): The array to write to, with the shape of the
+                player's observation. A contiguous flat row can be passed as
+                `row.reshape(shape)`
+            player_id (int): The player id
+
+        Returns:
+            (numpy.array): out
+        '''
+        self._encode_obs(self.game.get_state(player_id), out)
+        return out
 
     def get_payoffs(self):
         ''' Get the payoffs of players. Must be implemented in the child class.
@@ -226,11 +400,121 @@ class Env(object):
         feature[action] = 1
         return feature
 
+    def get_action_features(self, actions):
+        ''' Get the features of several actions at once, e.g., of all the
+        actions of a trajectory
+
+        Args:
+            actions (list): The action ids
+
+        Returns:
+            (numpy.array): The features, one row per action
+        '''
+        features = np.zeros((len(actions), self.num_actions), dtype=np.int8)
+        features[np.arange(len(actions)), actions] = 1
+        return features
+
     def seed(self, seed=None):
-        self.np_random, seed = seeding.np_random(seed)
+        ''' Reseed the random number generator of the game
+
+        Args:
+            seed (int): The seed, None for a random seed. Independent seeds for
+                many environments can be derived with `seeding.spawn_seeds`
+
+        Returns:
+            (int): The seed
+        '''
+        self.np_random, seed = seeding.np_random(seed, self.rng_backend)
         self.game.np_random = self.np_random
         return seed
 
+    def _make_state(self, state):
+        ''' Extract the state for the agents and add the optional fields
+        requested in the config
+
+        Args:
+            state (dict): The raw state
+
+        Returns:
+            (dict): The extracted state
+
+        Note: With config {'legal_mask': True}, the state has an extra 'legal_mask'
+              entry: a boolean array of length num_actions, or a sorted array of
+              the legal action ids if `legal_mask_packed` is True (e.g. for the
+              large action space of Doudizhu). Both forms can index action values.
+              With config {'obs_dtype': ...}, the observation is cast to the dtype.
+              With config {'obs_encoding': 'packed'} or 'sparse', the state has an
+              extra 'encoded_obs' entry, computed when it is read.
+        '''
+        extracted_state = self._extract_state(state)
+        if self.obs_dtype is not None:
+            extracted_state['obs'] = np.asarray(extracted_state['obs']).astype(self.obs_dtype, copy=False)
+        if self.obs_encoding != 'dense':
+            obs = extracted_state['obs']
+            extracted_state.set_lazy('encoded_obs', lambda: encode_obs(obs, self.obs_encoding))
+        if self.use_legal_mask:
+            legal_ids = self._get_legal_action_ids(extracted_state)
+            if self.legal_mask_packed:
+                extracted_state['legal_mask'] = np.sort(legal_ids)
+            else:
+                legal_mask = np.zeros(self.num_actions, dtype=bool)
+                legal_mask[legal_ids] = True
+                extracted_state['legal_mask'] = legal_mask
+        return extracted_state
+
+    def _get_legal_action_ids(self, extracted_state):
+        ''' Get the ids of the legal actions of an extracted state for its
+        legal mask. Environments whose game provides the ids as an array
+        should return it instead of the keys of 'legal_actions'
+
+        Args:
+            extracted_state (dict): The extracted state
+
+        Returns:
+            (numpy.array): The legal action ids, in any order
+        '''
+        legal_actions = extracted_state['legal_actions']
+        return np.fromiter(legal_actions, dtype=np.int64, count=len(legal_actions))
+
+    def _cached(self, key, func):
+        ''' Compute a value derived from the current game state at most once
+        per step, e.g., the legal actions that are needed both to extract the
+        state and to decode the next action. The cache is cleared whenever the
+        game state changes through `reset`, `step`, `step_back` or `restore`.
+
+        Args:
+            key (str): The name of the value
+            func (callable): The function without arguments computing it
+
+        Returns:
+            The cached value. It is shared by the callers, so it must not be
+            modified
+
+        Note: The game must only be changed through the Env. Call
+              `_clear_cache` after modifying `self.game` directly.
+        '''
+        try:
+            return self._step_cache[key]
+        except KeyError:
+            value = self._step_cache[key] = func()
+            return value
+
+    def _clear_cache(self):
+        ''' Forget the values computed by `_cached`
+        '''
+        self._step_cache = {}
+
+    def _encode_obs(self, state, out):
+        ''' Encode the observation of a raw state into out, overwriting all of
+        its entries. The child classes encode in place, by default the
+        observation is extracted and copied.
+
+        Args:
+            state (dict): The raw state
+            out (numpy.array): The array to write to
+        '''
+        out[...] = self._extract_state(state)['obs']
+
     def _extract_state(self, state):
         ''' Extract useful information from state for RL. Must be implemented in the child class.
 
@@ -264,3 +548,76 @@ class Env(object):
         Note: Must be implemented in the child class.
         '''
         raise NotImplementedError
+
+
+class _ColumnBuffer(object):
+    ''' Growable numpy columns that record the decisions of one player. With
+    packed_legal, the legal action ids are kept instead of a dense mask
+    '''
+
+    def __init__(self, num_actions, obs_encoding='dense', packed_legal=False, capacity=64):
+        self.num_actions = num_actions
+        self.obs_encoding = obs_encoding
+        self.packed_legal = packed_legal
+        self.capacity = capacity
+        self.size = 0
+        # The sparse observations and the legal action ids vary in length
+        # and are kept in lists
+        self.obs = [] if obs_encoding == 'sparse' else None
+        if packed_legal:
+            self.legal_ids = []
+        else:
+            self.legal_mask = np.zeros((capacity, num_actions), dtype=bool)
+        self.action = np.zeros(capacity, dtype=np.int64)
+        self.step = np.zeros(capacity, dtype=np.int64)
+        self.episode = np.zeros(capacity, dtype=np.int64)
+
+    def append(self, state, action, step, episode):
+        if self.obs_encoding == 'dense':
+            obs = np.asarray(state['obs'])
+        else:
+            obs = state['encoded_obs']
+        if self.obs is None:
+            self.obs = np.zeros((self.capacity, ) + obs.shape, dtype=obs.dtype)
+        if self.size == self.capacity:
+            self._grow()
+        i = self.size
+        if self.obs_encoding == 'sparse':
+            self.obs.append(obs)
+        else:
+            self.obs[i] = obs
+        if self.packed_legal:
+            self.legal_ids.append(np.sort(np.asarray(legal_action_ids(state), dtype=np.int32)))
+        else:
+            self.legal_mask[i, legal_action_ids(state)] = True
+        # Some agents output (action, amount) packs
+        self.action[i] = action[0] if isinstance(action, tuple) else action
+        self.step[i] = step
+        self.episode[i] = episode
+        self.size += 1
+
+    def _grow(self):
+        self.capacity *= 2
+        for key in ['obs', 'legal_mask', 'action', 'step', 'episode']:
+            old = getattr(self, key, None)
+            if old is None or isinstance(old, list):
+                continue
+            new = np.zeros((self.capacity, ) + old.shape[1:], dtype=old.dtype)
+            new[:self.size] = old[:self.size]
+            setattr(self, key, new)
+
+    def to_dict(self):
+        obs = self.obs if self.obs is not None else np.zeros((0, ))
+        columns = {
+            'obs': obs[:self.size],
+            'action': self.action[:self.size],
+            'step': self.step[:self.size],
+            'episode': self.episode[:self.size],
+        }
+        if self.packed_legal:
+            lengths = [len(legal_ids) for legal_ids in self.legal_ids]
+            columns['legal_ids'] = np.concatenate(self.legal_ids) if self.legal_ids else np.zeros(0, dtype=np.int32)
+            columns['legal_offsets'] = np.concatenate(([0], np.cumsum(lengths))).astype(np.int64)
+        else:
+            columns['legal_mask'] = self.legal_mask[:self.size]
+        return columns
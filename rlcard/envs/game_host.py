@@ -0,0 +1,184 @@
+''' An asyncio host that plays many tables concurrently in one process
+'''
+import asyncio
+import itertools
+from collections import namedtuple
+
+TableResult = namedtuple('TableResult', ['table_id', 'env', 'payoffs', 'error'])
+
+
+class TableTimeoutError(Exception):
+    ''' Raised when an agent or a whole table exceeds its time limit
+    '''
+
+
+class AsyncAgent(object):
+    ''' The interface of the agents played by GameHost. `act` is a
+    coroutine, so a slow agent, e.g., a remote bot, a human or a batched
+    inference server, only blocks its own table.
+    '''
+    use_raw = False
+
+    async def act(self, state):
+        ''' Choose an action
+
+        Args:
+            state (dict): The state of the player, as returned by the environment
+
+        Returns:
+            action (int or str): An action id, or a raw action if `use_raw` is True
+        '''
+        raise NotImplementedError
+
+
+class LocalAgent(AsyncAgent):
+    ''' An in-process stand-in that plays a synchronous RLCard agent with
+    `eval_step`, optionally after a delay to mimic a remote agent
+    '''
+
+    def __init__(self, agent, delay=0):
+        ''' Initialize the agent
+
+        Args:
+            agent (object): An agent with `eval_step` and `use_raw`
+            delay (float or callable): The seconds to wait before each action,
+                or a function without arguments returning them
+        '''
+        self.agent = agent
+        self.use_raw = agent.use_raw
+        self.delay = delay
+
+    async def act(self, state):
+        delay = self.delay() if callable(self.delay) else self.delay
+        # Always yield to the event loop so that a table never starves the others
+        await asyncio.sleep(delay)
+        action, _ = self.agent.eval_step(state)
+        return action
+
+
+class GameHost(object):
+    ''' Plays many tables concurrently on one event loop. Every table is an
+    `Env` with one `AsyncAgent` per player and runs the usual
+    `reset` / `step` / `is_over` loop, awaiting the agents' actions.
+
+    At most `max_tables` tables are in play. `submit` waits for a free seat,
+    which applies backpressure to the producer of new tables.
+    '''
+
+    def __init__(self, max_tables=1024, action_timeout=None, table_timeout=None):
+        ''' Initialize the host
+
+        Args:
+            max_tables (int): The maximum number of tables in play
+            action_timeout (float): The seconds an agent may take for one
+                action, None for no limit
+            table_timeout (float): The seconds a whole game may take, None
+                for no limit
+        '''
+        if max_tables < 1:
+            raise ValueError('max_tables must be positive, not {}'.format(max_tables))
+        self.max_tables = max_tables
+        self.action_timeout = action_timeout
+        self.table_timeout = table_timeout
+        self.num_active = 0
+        self._table_ids = itertools.count()
+        self._loop = None
+        self._seats = None
+        self._tasks = set()
+
+    async def play(self, env, agents, table_id=None):
+        ''' Play one game. Timeouts and agent errors end the table and are
+        returned in the result instead of being raised
+
+        Args:
+            env (Env): The environment
+            agents (list): One AsyncAgent per player
+            table_id (int): The id of the table, a new one if None
+
+        Returns:
+            (TableResult): The result. The payoffs are None if the game was
+                not finished
+        '''
+        if table_id is None:
+            table_id = next(self._table_ids)
+        if len(agents) != env.num_players:
+            raise ValueError('Expected {} agents, got {}'.format(env.num_players, len(agents)))
+        self.num_active += 1
+        try:
+            if self.table_timeout is None:
+                await self._play(env, agents)
+            else:
+                try:
+                    await asyncio.wait_for(self._play(env, agents), self.table_timeout)
+                except asyncio.TimeoutError:
+                    raise TableTimeoutError('Table {} exceeded {} seconds'.format(table_id, self.table_timeout))
+        except asyncio.CancelledError:
+            # A subclass of Exception before Python 3.8, but not an agent error
+            raise
+        except Exception as error:
+            return TableResult(table_id, env, None, error)
+        finally:
+            self.num_active -= 1
+        return TableResult(table_id, env, env.get_payoffs(), None)
+
+    async def _play(self, env, agents):
+        state, player_id = env.reset()
+        while not env.is_over():
+            agent = agents[player_id]
+            if self.action_timeout is None:
+                action = await agent.act(state)
+            else:
+                try:
+                    action = await asyncio.wait_for(agent.act(state), self.action_timeout)
+                except asyncio.TimeoutError:
+                    raise TableTimeoutError('Player {} exceeded {} seconds'.format(player_id, self.action_timeout))
+            state, player_id = env.step(action, agent.use_raw)
+
+    async def submit(self, env, agents):
+        ''' Start a table as soon as a seat is free
+
+        Args:
+            env (Env): The environment
+            agents (list): One AsyncAgent per player
+
+        Returns:
+            (asyncio.Task): The task of the table, whose result is a TableResult
+        '''
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._seats = asyncio.Semaphore(self.max_tables)
+        await self._seats.acquire()
+        task = asyncio.ensure_future(self.play(env, agents, next(self._table_ids)))
+        self._tasks.add(task)
+        task.add_done_callback(self._release)
+        return task
+
+    def _release(self, task):
+        self._tasks.discard(task)
+        self._seats.release()
+
+    async def run(self, tables):
+        ''' Play a stream of tables and collect the results
+
+        Args:
+            tables (iterable): (env, agents) pairs, or an async iterable of
+                them. New tables are only taken from it when a seat is free
+
+        Returns:
+            (list): The TableResult of every table in submission order
+        '''
+        tasks = []
+        if hasattr(tables, '__aiter__'):
+            async for env, agents in tables:
+                tasks.append(await self.submit(env, agents))
+        else:
+            for env, agents in tables:
+                tasks.append(await self.submit(env, agents))
+        return list(await asyncio.gather(*tasks))
+
+    async def join(self):
+        ''' Wait for all the submitted tables to finish
+        '''
+        while self._tasks:
+            await asyncio.wait(list(self._tasks))
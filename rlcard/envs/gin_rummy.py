@@ -7,10 +7,12 @@ import numpy as np
 from collections import OrderedDict
 
 from rlcard.envs import Env
+from rlcard.utils import LazyState
 
 class GinRummyEnv(Env):
     ''' GinRummy Environment
     '''
+    binary_obs = True
     def __init__(self, config):
         from rlcard.games.gin_rummy.utils.move import ScoreSouthMove
         from rlcard.games.gin_rummy.utils import utils
@@ -38,31 +40,39 @@ class GinRummyEnv(Env):
                              opponent known cards (likewise)
                              unknown cards (likewise)  # is this needed ??? 200213
         '''
-        if self.game.is_over():
-            obs = np.array([self._utils.encode_cards([]) for _ in range(5)])
-            extracted_state = {'obs': obs, 'legal_actions': self._get_legal_actions()}
-            extracted_state['raw_legal_actions'] = list(self._get_legal_actions().keys())
-            extracted_state['raw_obs'] = obs
-        else:
-            discard_pile = self.game.round.dealer.discard_pile
-            stock_pile = self.game.round.dealer.stock_pile
-            top_discard = [] if not discard_pile else [discard_pile[-1]]
-            dead_cards = discard_pile[:-1]
-            current_player = self.game.get_current_player()
-            opponent = self.game.round.players[(current_player.player_id + 1) % 2]
-            known_cards = opponent.known_cards
-            unknown_cards = stock_pile + [card for card in opponent.hand if card not in known_cards]
-            hand_rep = self._utils.encode_cards(current_player.hand)
-            top_discard_rep = self._utils.encode_cards(top_discard)
-            dead_cards_rep = self._utils.encode_cards(dead_cards)
-            known_cards_rep = self._utils.encode_cards(known_cards)
-            unknown_cards_rep = self._utils.encode_cards(unknown_cards)
-            rep = [hand_rep, top_discard_rep, dead_cards_rep, known_cards_rep, unknown_cards_rep]
-            obs = np.array(rep)
-            extracted_state = {'obs': obs, 'legal_actions': self._get_legal_actions(), 'raw_legal_actions': list(self._get_legal_actions().keys())}
-            extracted_state['raw_obs'] = obs
+        obs = np.zeros((5, 52), dtype=int)
+        self._encode_obs(state, obs)
+        legal_actions = self._get_legal_actions()
+        extracted_state = LazyState({'obs': obs, 'legal_actions': legal_actions})
+        extracted_state.set_lazy('raw_legal_actions', lambda: list(legal_actions.keys()))
+        extracted_state['raw_obs'] = obs
         return extracted_state
 
+    def _encode_obs(self, state, out):
+        ''' Write the 5 * 52 planes of the current player into out, all zeros
+        if the game is over
+
+        Args:
+            state (dict): dict of original state
+            out (numpy.array): The array to write to
+        '''
+        if self.game.is_over():
+            out[:] = 0
+            return
+        discard_pile = self.game.round.dealer.discard_pile
+        stock_pile = self.game.round.dealer.stock_pile
+        top_discard = [] if not discard_pile else [discard_pile[-1]]
+        dead_cards = discard_pile[:-1]
+        current_player = self.game.get_current_player()
+        opponent = self.game.round.players[(current_player.player_id + 1) % 2]
+        known_cards = opponent.known_cards
+        unknown_cards = stock_pile + [card for card in opponent.hand if card not in known_cards]
+        self._utils.encode_cards(current_player.hand, out[0])
+        self._utils.encode_cards(top_discard, out[1])
+        self._utils.encode_cards(dead_cards, out[2])
+        self._utils.encode_cards(known_cards, out[3])
+        self._utils.encode_cards(unknown_cards, out[4])
+
     def get_payoffs(self):
         ''' Get the payoffs of players. Must be implemented in the child class.
 
@@ -95,6 +105,9 @@ class GinRummyEnv(Env):
         Returns:
             legal_actions (list): a list of legal actions' id
         '''
+        return self._cached('legal_actions', self._compute_legal_actions)
+
+    def _compute_legal_actions(self):
         legal_actions = self.game.judge.get_legal_actions()
         legal_actions_ids = {action_event.action_id: None for action_event in legal_actions}
         return OrderedDict(legal_actions_ids)
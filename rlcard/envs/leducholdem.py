@@ -15,6 +15,7 @@ DEFAULT_GAME_CONFIG = {
 class LeducholdemEnv(Env):
     ''' Leduc Hold'em Environment
     '''
+    binary_obs = True
 
     def __init__(self, config):
         ''' Initialize the Limitholdem environment
@@ -49,27 +50,36 @@ class LeducholdemEnv(Env):
         Returns:
             observation (list): combine the player's score and dealer's observable score for observation
         '''
-        extracted_state = {}
+        extracted_state = LazyState()
 
         legal_actions = OrderedDict({self.actions.index(a): None for a in state['legal_actions']})
         extracted_state['legal_actions'] = legal_actions
 
-        public_card = state['public_card']
-        hand = state['hand']
         obs = np.zeros(36)
-        obs[self.card2index[hand]] = 1
-        if public_card:
-            obs[self.card2index[public_card]+3] = 1
-        obs[state['my_chips']+6] = 1
-        obs[sum(state['all_chips'])-state['my_chips']+21] = 1
+        self._encode_obs(state, obs)
         extracted_state['obs'] = obs
 
         extracted_state['raw_obs'] = state
-        extracted_state['raw_legal_actions'] = [a for a in state['legal_actions']]
+        extracted_state.set_lazy('raw_legal_actions', lambda: [a for a in state['legal_actions']])
         extracted_state['action_record'] = self.action_recorder
 
         return extracted_state
 
+    def _encode_obs(self, state, out):
+        ''' Write the one-hot encoding of the cards and chips into out
+
+        Args:
+            state (dict): Original state from the game
+            out (numpy.array): The array to write to
+        '''
+        public_card = state['public_card']
+        out[:] = 0
+        out[self.card2index[state['hand']]] = 1
+        if public_card:
+            out[self.card2index[public_card]+3] = 1
+        out[state['my_chips']+6] = 1
+        out[sum(state['all_chips'])-state['my_chips']+21] = 1
+
     def get_payoffs(self):
         ''' Get the payoff of a game
 
@@ -5,6 +5,7 @@ from collections import OrderedDict
 
 import rlcard
 from rlcard.envs import Env
+from rlcard.utils import LazyState
 from rlcard.games.limitholdem import Game
 from rlcard.games.limitholdem.utils import Action_Enum
 
@@ -17,6 +18,7 @@ ROUND_NUM = 4
 class LimitholdemEnv(Env):
     ''' Limitholdem Environment
     '''
+    binary_obs = True
 
     def __init__(self, config):
         ''' Initialize the Limitholdem environment
@@ -50,29 +52,34 @@ class LimitholdemEnv(Env):
         Returns:
             observation (list): combine the player's score and dealer's observable score for observation
         '''
-        extracted_state = {}
+        extracted_state = LazyState()
 
         extracted_state['legal_actions'] = OrderedDict({a.value:amount for a, amount in state['legal_actions'].items()})
 
-        public_cards = state['public_cards']
-        hand = state['hand']
-        raise_nums = state['raise_nums']
-        cards = public_cards + hand
-        idx = [self.card2index[card] for card in cards]
-        
         # we should add more space here for the generic in case the number of players increase.
         obs = np.zeros(CARD_NUM + ROUND_NUM * (self.num_players+1))
-        obs[idx] = 1
-        for i, num in enumerate(raise_nums):
-            obs[52 + i * (self.num_players+1) + num] = 1
+        self._encode_obs(state, obs)
         extracted_state['obs'] = obs
         extracted_state['raise_amount'] = state['raise_amount']
         extracted_state['raw_obs'] = state
-        extracted_state['raw_legal_actions'] = [a for a in state['legal_actions']]
+        extracted_state.set_lazy('raw_legal_actions', lambda: [a for a in state['legal_actions']])
         extracted_state['action_record'] = self.action_recorder
         extracted_state['avail_raise_amount'] = [self.game.max_player_raise_amount(i) for i in range(self.num_players)]
         return extracted_state
 
+    def _encode_obs(self, state, out):
+        ''' Write the one-hot encoding of the cards and raise numbers into out
+
+        Args:
+            state (dict): Original state from the game
+            out (numpy.array): The array to write to
+        '''
+        idx = [self.card2index[card] for card in state['public_cards'] + state['hand']]
+        out[:] = 0
+        out[idx] = 1
+        for i, num in enumerate(state['raise_nums']):
+            out[52 + i * (self.num_players+1) + num] = 1
+
     def get_payoffs(self):
         ''' Get the payoff of a game
 
@@ -2,6 +2,7 @@ import numpy as np
 from collections import OrderedDict
 
 from rlcard.envs import Env
+from rlcard.utils import LazyState
 from rlcard.games.mahjong import Game
 from rlcard.games.mahjong import Card
 from rlcard.games.mahjong.utils import card_encoding_dict, encode_cards, pile2list
@@ -9,6 +10,7 @@ from rlcard.games.mahjong.utils import card_encoding_dict, encode_cards, pile2li
 class MahjongEnv(Env):
     ''' Mahjong Environment
     '''
+    binary_obs = True
 
     def __init__(self, config):
         self.name = 'mahjong'
@@ -32,31 +34,36 @@ class MahjongEnv(Env):
                              the recent three actions
                              the union of all played cards
         '''
-        players_pile = state['players_pile']
-        hand_rep = encode_cards(state['current_hand'])
-        piles_rep = []
-        for p in players_pile.keys():
-            piles_rep.append(encode_cards(pile2list(players_pile[p])))
-        piles_rep = np.array(piles_rep)
-        table_rep = encode_cards(state['table'])
-        rep = [hand_rep, table_rep]
-        rep.extend(piles_rep)
-        obs = np.array(rep)
-
-        extracted_state = {'obs': obs, 'legal_actions': self._get_legal_actions()}
+        obs = np.zeros((2 + len(state['players_pile']), 34, 4), dtype=int)
+        self._encode_obs(state, obs)
+
+        extracted_state = LazyState({'obs': obs, 'legal_actions': self._get_legal_actions()})
         extracted_state['raw_obs'] = state
-        extracted_state['raw_legal_actions'] = [a for a in state['action_cards']]
+        extracted_state.set_lazy('raw_legal_actions', lambda: [a for a in state['action_cards']])
         extracted_state['action_record'] = self.action_recorder
 
         return extracted_state
 
+    def _encode_obs(self, state, out):
+        ''' Write the hand, the table and the piles of the players into out
+
+        Args:
+            state (dict): dict of original state
+            out (numpy.array): The array to write to
+        '''
+        players_pile = state['players_pile']
+        encode_cards(state['current_hand'], out[0])
+        encode_cards(state['table'], out[1])
+        for i, p in enumerate(players_pile.keys()):
+            encode_cards(pile2list(players_pile[p]), out[2+i])
+
     def get_payoffs(self):
         ''' Get the payoffs of players. Must be implemented in the child class.
 
         Returns:
             payoffs (list): a list of payoffs for each player
         '''
-        _, player, _ = self.game.judger.judge_game(self.game)
+        _, player, _ = self._cached('judge_game', lambda: self.game.judger.judge_game(self.game))
         if player == -1:
             payoffs = [0, 0, 0, 0]
         else:
@@ -75,13 +82,23 @@ class MahjongEnv(Env):
         '''
         action = self.de_action_id[action_id]
         if action_id < 34:
-            candidates = self.game.get_legal_actions(self.game.get_state(self.game.round.current_player))
+            candidates = self._get_game_legal_actions()
             for card in candidates:
                 if card.get_str() == action:
                     action = card
                     break
         return action
 
+    def _get_game_legal_actions(self):
+        ''' Get the legal actions of the current player in the game engine,
+        computed once per step
+
+        Returns:
+            (list): The legal actions, cards or action strings
+        '''
+        return self._cached('game_legal_actions', lambda: self.game.get_legal_actions(
+            self.game.get_state(self.game.round.current_player)))
+
     def _get_legal_actions(self):
         ''' Get all legal actions for current state
 
@@ -93,7 +110,7 @@ class MahjongEnv(Env):
             legal_actions (list): a list of legal actions' id
         '''
         legal_action_id = {}
-        legal_actions = self.game.get_legal_actions(self.game.get_state(self.game.round.current_player))
+        legal_actions = self._get_game_legal_actions()
         if legal_actions:
             for action in legal_actions:
                 if isinstance(action, Card):
@@ -5,6 +5,7 @@ from collections import OrderedDict
 
 import rlcard
 from rlcard.envs import Env
+from rlcard.utils import LazyState
 from rlcard.games.nolimitholdem import Game
 from rlcard.games.nolimitholdem.round import Action
 
@@ -17,6 +18,8 @@ DEFAULT_GAME_CONFIG = {
 class NolimitholdemEnv(Env):
     ''' Limitholdem Environment
     '''
+    # The observation holds the chips
+    compact_obs_dtype = np.float32
 
     def __init__(self, config):
         ''' Initialize the Limitholdem environment
@@ -40,7 +43,7 @@ class NolimitholdemEnv(Env):
         Returns:
             encoded_action_list (list): return encoded legal action list (from str to int)
         '''
-        return self.game.get_legal_actions()
+        return self._cached('legal_actions', self.game.get_legal_actions)
 
     def _extract_state(self, state):
         ''' Extract the state representation from state dictionary for agent
@@ -53,29 +56,34 @@ class NolimitholdemEnv(Env):
         Returns:
             observation (list): combine the player's score and dealer's observable score for observation
         '''
-        extracted_state = {}
+        extracted_state = LazyState()
 
         legal_actions = OrderedDict({action.value: None for action in state['legal_actions']})
         extracted_state['legal_actions'] = legal_actions
 
-        public_cards = state['public_cards']
-        hand = state['hand']
-        my_chips = state['my_chips']
-        all_chips = state['all_chips']
-        cards = public_cards + hand
-        idx = [self.card2index[card] for card in cards]
         obs = np.zeros(54)
-        obs[idx] = 1
-        obs[52] = float(my_chips)
-        obs[53] = float(max(all_chips))
+        self._encode_obs(state, obs)
         extracted_state['obs'] = obs
 
         extracted_state['raw_obs'] = state
-        extracted_state['raw_legal_actions'] = [a for a in state['legal_actions']]
+        extracted_state.set_lazy('raw_legal_actions', lambda: [a for a in state['legal_actions']])
         extracted_state['action_record'] = self.action_recorder
 
         return extracted_state
 
+    def _encode_obs(self, state, out):
+        ''' Write the one-hot encoding of the cards and the chips into out
+
+        Args:
+            state (dict): Original state from the game
+            out (numpy.array): The array to write to
+        '''
+        idx = [self.card2index[card] for card in state['public_cards'] + state['hand']]
+        out[:52] = 0
+        out[idx] = 1
+        out[52] = float(state['my_chips'])
+        out[53] = float(max(state['all_chips']))
+
     def get_payoffs(self):
         ''' Get the payoff of a game
 
@@ -93,7 +101,7 @@ class NolimitholdemEnv(Env):
         Returns:
             action (str): action for the game
         '''
-        legal_actions = self.game.get_legal_actions()
+        legal_actions = self._get_legal_actions()
         if self.actions(action_id) not in legal_actions:
             if Action.CHECK in legal_actions:
                 return Action.CHECK
@@ -4,6 +4,10 @@ import importlib
 DEFAULT_CONFIG = {
         'allow_step_back': False,
         'seed': None,
+        'legal_mask': False,
+        'rng': 'random_state',
+        'obs_dtype': None,
+        'obs_encoding': 'dense',
         }
 
 class EnvSpec(object):
@@ -18,8 +22,19 @@ class EnvSpec(object):
             entry_point (string): A string the indicates the location of the envronment class
         '''
         self.env_id = env_id
-        mod_name, class_name = entry_point.split(':')
-        self._entry_point = getattr(importlib.import_module(mod_name), class_name)
+        self.mod_name, self.class_name = entry_point.split(':')
+        self._entry_point = None
+
+    def load_entry_point(self):
+        ''' Import the environment class. The module is only imported on the
+            first call, and the class is cached afterwards
+
+        Returns:
+            (class): The environment class
+        '''
+        if self._entry_point is None:
+            self._entry_point = getattr(importlib.import_module(self.mod_name), self.class_name)
+        return self._entry_point
 
     def make(self, config=DEFAULT_CONFIG):
         ''' Instantiates an instance of the environment
@@ -28,7 +43,7 @@ class EnvSpec(object):
             env (Env): An instance of the environemnt
             config (dict): A dictionary of the environment settings
         '''
-        env = self._entry_point(config)
+        env = self.load_entry_point()(config)
         return env
 
 class EnvRegistry(object):
@@ -87,3 +102,79 @@ def make(env_id, config={}):
         _config[key] = config[key]
 
     return registry.make(env_id, _config)
+
+class EnvFactory(object):
+    ''' A small picklable recipe of an environment: its id and config.
+    Worker processes receive a factory and make their own environment,
+    instead of unpickling a whole environment with its game.
+    '''
+
+    def __init__(self, env_id, config={}, modules=None):
+        ''' Initialize the factory
+
+        Args:
+            env_id (string): The name of the environment
+            config (dict): A dictionary of the environment settings
+            modules (list): The modules to import ahead of time, e.g., in a
+                forkserver. Defaults to the module of the environment class
+        '''
+        if env_id not in registry.env_specs:
+            raise ValueError('Cannot find env_id: {}'.format(env_id))
+        self.env_id = env_id
+        self.config = dict(config)
+        if modules is None:
+            modules = [registry.env_specs[env_id].mod_name]
+        self.modules = list(modules)
+
+    @staticmethod
+    def can_make(env):
+        ''' Whether `from_env` can make copies of an environment, i.e., it is
+            an instance of the class registered under its name. Custom
+            environments and subclasses have to be passed as objects
+
+        Args:
+            env (Env): The environment
+
+        Returns:
+            (bool): True if the environment can be made by a factory
+        '''
+        spec = registry.env_specs.get(getattr(env, 'name', None))
+        return spec is not None and type(env) is spec.load_entry_point()
+
+    @classmethod
+    def from_env(cls, env):
+        ''' Get the factory of an environment made by `make`. The modules
+            include the game, whose tables are loaded when it is imported
+
+        Args:
+            env (Env): The environment
+
+        Returns:
+            (EnvFactory): The factory
+        '''
+        return cls(env.name, env.config, [type(env).__module__, type(env.game).__module__])
+
+    def __call__(self):
+        ''' Make a new environment
+
+        Returns:
+            (Env): The environment
+        '''
+        return make(self.env_id, self.config)
+
+def make_vec(env_id, num_envs, config={}, num_workers=None, context=None):
+    ''' Create a vector environment that steps several instances in lockstep
+
+    Args:
+        env_id (string): The name of the environment
+        num_envs (int): The number of environment instances
+        config (dict): A dictionary of the environment settings
+        num_workers (int): If given, the games run in this many worker
+            processes that share observation buffers with the caller
+        context (string): The multiprocessing start method of the workers
+    '''
+    if num_workers is None:
+        from rlcard.envs.vec_env import VectorEnv
+        return VectorEnv(env_id, num_envs, config)
+    from rlcard.envs.vec_env import SubprocVectorEnv
+    return SubprocVectorEnv(env_id, num_envs, config, num_workers=num_workers, context=context)
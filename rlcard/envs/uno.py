@@ -2,6 +2,7 @@ import numpy as np
 from collections import OrderedDict
 
 from rlcard.envs import Env
+from rlcard.utils import LazyState
 from rlcard.games.uno import Game
 from rlcard.games.uno.utils import encode_hand, encode_target
 from rlcard.games.uno.utils import ACTION_SPACE, ACTION_LIST
@@ -12,6 +13,7 @@ DEFAULT_GAME_CONFIG = {
         }
 
 class UnoEnv(Env):
+    binary_obs = True
 
     def __init__(self, config):
         self.name = 'uno'
@@ -23,15 +25,19 @@ class UnoEnv(Env):
 
     def _extract_state(self, state):
         obs = np.zeros((4, 4, 15), dtype=int)
-        encode_hand(obs[:3], state['hand'])
-        encode_target(obs[3], state['target'])
+        self._encode_obs(state, obs)
         legal_action_id = self._get_legal_actions()
-        extracted_state = {'obs': obs, 'legal_actions': legal_action_id}
+        extracted_state = LazyState({'obs': obs, 'legal_actions': legal_action_id})
         extracted_state['raw_obs'] = state
-        extracted_state['raw_legal_actions'] = [a for a in state['legal_actions']]
+        extracted_state.set_lazy('raw_legal_actions', lambda: [a for a in state['legal_actions']])
         extracted_state['action_record'] = self.action_recorder
         return extracted_state
 
+    def _encode_obs(self, state, out):
+        out[:] = 0
+        encode_hand(out[:3], state['hand'])
+        encode_target(out[3], state['target'])
+
     def get_payoffs(self):
 
         return np.array(self.game.get_payoffs())
@@ -45,6 +51,9 @@ class UnoEnv(Env):
         return ACTION_LIST[np.random.choice(legal_ids)]
 
     def _get_legal_actions(self):
+        return self._cached('legal_actions', self._compute_legal_actions)
+
+    def _compute_legal_actions(self):
         legal_actions = self.game.get_legal_actions()
         legal_ids = {ACTION_SPACE[action]: None for action in legal_actions}
         return OrderedDict(legal_ids)
@@ -0,0 +1,431 @@
+''' Vectorized environments that step several games in lockstep
+'''
+import multiprocessing as mp
+
+import numpy as np
+
+try:
+    from multiprocessing import shared_memory, resource_tracker
+except ImportError:
+    # Python 3.7, the buffers are passed through the pipes instead
+    shared_memory = None
+
+from rlcard.envs.registration import make, EnvFactory
+from rlcard.utils.utils import legal_action_ids
+from rlcard.utils.seeding import spawn_seeds
+
+
+class VectorEnv(object):
+    ''' A lockstep vector environment. It holds `num_envs` instances of the
+    same registered game and exposes stacked observations, legal-action masks
+    and current players, so that agents can run inference on a whole batch.
+    Finished games are reset automatically.
+    '''
+
+    def __init__(self, env_id, num_envs, config={}):
+        ''' Initialize the vector environment
+
+        Args:
+            env_id (string): The name of the registered environment
+            num_envs (int): The number of environment instances
+            config (dict): A dictionary of the environment settings. If a seed
+                is given, every environment gets an independent seed derived
+                from it so that the instances do not play identical games.
+        '''
+        if num_envs < 1:
+            raise ValueError('num_envs must be positive, not {}'.format(num_envs))
+        self.env_id = env_id
+        self.num_envs = num_envs
+        self.envs = []
+        for seed in _env_seeds(config.get('seed'), num_envs):
+            _config = dict(config)
+            _config['seed'] = seed
+            self.envs.append(make(env_id, _config))
+
+        env = self.envs[0]
+        self.num_players = env.num_players
+        self.num_actions = env.num_actions
+        self.state_shape = env.state_shape
+
+        # If the players observe differently shaped states (e.g., landlord and
+        # peasants in Doudizhu), the observations are flattened and zero padded
+        shapes = [tuple(shape) for shape in self.state_shape]
+        self._pad_obs = len(set(shapes)) > 1
+        if self._pad_obs:
+            self.obs_shape = (max(int(np.prod(shape)) for shape in shapes), )
+        else:
+            self.obs_shape = shapes[0]
+
+        self.obs = None
+        self.legal_mask = np.zeros((num_envs, self.num_actions), dtype=bool)
+        self.player_ids = np.zeros(num_envs, dtype=np.int64)
+        self.payoffs = np.zeros((num_envs, self.num_players), dtype=np.float32)
+        self.dones = np.zeros(num_envs, dtype=bool)
+        self.states = [None for _ in range(num_envs)]
+
+    def reset(self):
+        ''' Start a new game in every environment
+
+        Returns:
+            (tuple): Tuple containing:
+
+                (numpy.array): The stacked observations, (num_envs, *obs_shape)
+                (numpy.array): The stacked legal-action masks, (num_envs, num_actions)
+                (numpy.array): The current player of each environment
+        '''
+        for i, env in enumerate(self.envs):
+            state, player_id = env.reset()
+            self._write(i, state, player_id)
+        self.payoffs[:] = 0
+        self.dones[:] = False
+        return self.obs, self.legal_mask, self.player_ids
+
+    def step(self, actions, raw_action=False):
+        ''' Step every environment with the action of its current player
+
+        Args:
+            actions (list or numpy.array): One action for each environment
+            raw_action (boolean): True if the actions are raw actions
+
+        Returns:
+            (tuple): Tuple containing:
+
+                (numpy.array): The stacked observations, (num_envs, *obs_shape)
+                (numpy.array): The stacked legal-action masks, (num_envs, num_actions)
+                (numpy.array): The current player of each environment
+                (numpy.array): The payoffs, (num_envs, num_players). Only the
+                    rows of the finished games are non-zero
+                (numpy.array): True for the environments whose game finished in
+                    this step. These environments have already been reset
+
+        Note: The returned arrays are reused across steps. Copy them if they
+              need to be kept.
+        '''
+        if len(actions) != self.num_envs:
+            raise ValueError('Expected {} actions, got {}'.format(self.num_envs, len(actions)))
+        self.payoffs[:] = 0
+        self.dones[:] = False
+        for i, env in enumerate(self.envs):
+            state, player_id = env.step(actions[i], raw_action)
+            if env.is_over():
+                self.payoffs[i] = env.get_payoffs()
+                self.dones[i] = True
+                state, player_id = env.reset()
+            self._write(i, state, player_id)
+        return self.obs, self.legal_mask, self.player_ids, self.payoffs, self.dones
+
+    def get_states(self):
+        ''' Get the current state dictionaries, e.g., for agents that need raw
+        observations
+
+        Returns:
+            (list): The current state of each environment
+        '''
+        return self.states
+
+    def seed(self, seed=None):
+        ''' Seed the environments with independent seeds derived from seed
+
+        Returns:
+            (list): The seeds of the environments
+        '''
+        return self._seed_envs(_env_seeds(seed, self.num_envs))
+
+    def _seed_envs(self, seeds):
+        return [env.seed(seed) for env, seed in zip(self.envs, seeds)]
+
+    def _write(self, index, state, player_id):
+        ''' Write a state into the stacked buffers
+        '''
+        obs = np.asarray(state['obs'])
+        if self.obs is None:
+            self.obs = np.zeros((self.num_envs, ) + self.obs_shape, dtype=obs.dtype)
+        if self._pad_obs:
+            row = self.obs[index]
+            row[obs.size:] = 0
+            row[:obs.size] = obs.ravel()
+        else:
+            self.obs[index] = obs
+        mask = self.legal_mask[index]
+        mask[:] = False
+        mask[legal_action_ids(state)] = True
+        self.player_ids[index] = player_id
+        self.states[index] = state
+
+    def __len__(self):
+        return self.num_envs
+
+
+class SubprocVectorEnv(object):
+    ''' A vector environment whose games run in a pool of worker processes.
+    Each worker owns a contiguous slice of the environments and writes the
+    observations, legal-action masks, players, payoffs and dones directly
+    into shared memory, so only a short message is exchanged per step.
+    Actions are also passed through shared memory and must be action ids.
+    Without shared memory (Python 3.7), the actions and buffers are sent
+    through the pipes of the workers.
+    '''
+
+    def __init__(self, env_id, num_envs, config={}, num_workers=None, context=None):
+        ''' Initialize the vector environment and start the workers
+
+        Args:
+            env_id (string): The name of the registered environment
+            num_envs (int): The number of environment instances
+            config (dict): A dictionary of the environment settings. If a seed
+                is given, the environments are seeded as in VectorEnv
+            num_workers (int): The number of worker processes. Defaults to
+                the number of CPUs, capped by num_envs
+            context (string): The multiprocessing start method, e.g. 'fork',
+                'forkserver' or 'spawn'. None uses the platform default
+        '''
+        if num_envs < 1:
+            raise ValueError('num_envs must be positive, not {}'.format(num_envs))
+        if num_workers is None:
+            num_workers = mp.cpu_count()
+        num_workers = max(1, min(num_workers, num_envs))
+        self.env_id = env_id
+        self.num_envs = num_envs
+        self.num_workers = num_workers
+
+        # Probe one instance for the sizes of the shared buffers
+        env = make(env_id, config)
+        self.num_players = env.num_players
+        self.num_actions = env.num_actions
+        self.state_shape = env.state_shape
+        shapes = [tuple(shape) for shape in self.state_shape]
+        if len(set(shapes)) > 1:
+            self.obs_shape = (max(int(np.prod(shape)) for shape in shapes), )
+        else:
+            self.obs_shape = shapes[0]
+        obs_dtype = np.asarray(env.reset()[0]['obs']).dtype
+        modules = EnvFactory.from_env(env).modules
+        del env
+
+        self._specs = {
+            'obs': ((num_envs, ) + self.obs_shape, obs_dtype),
+            'legal_mask': ((num_envs, self.num_actions), np.dtype(bool)),
+            'player_ids': ((num_envs, ), np.dtype(np.int64)),
+            'payoffs': ((num_envs, self.num_players), np.dtype(np.float32)),
+            'dones': ((num_envs, ), np.dtype(bool)),
+            'actions': ((num_envs, ), np.dtype(np.int64)),
+        }
+        self._shared = shared_memory is not None
+        self._shms = {}
+        self._buffers = {}
+        for key, (shape, dtype) in self._specs.items():
+            if self._shared:
+                size = max(1, int(np.prod(shape)) * dtype.itemsize)
+                shm = shared_memory.SharedMemory(create=True, size=size)
+                self._shms[key] = shm
+                self._buffers[key] = np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+                self._buffers[key].fill(0)
+            else:
+                self._buffers[key] = np.zeros(shape, dtype=dtype)
+        self.obs = self._buffers['obs']
+        self.legal_mask = self._buffers['legal_mask']
+        self.player_ids = self._buffers['player_ids']
+        self.payoffs = self._buffers['payoffs']
+        self.dones = self._buffers['dones']
+        self._actions = self._buffers['actions']
+
+        ctx = mp.get_context(context)
+        if ctx.get_start_method() == 'forkserver':
+            # The workers fork from a server that has imported the game once
+            ctx.set_forkserver_preload(modules)
+        shm_specs = None
+        if self._shared:
+            shm_specs = {key: (self._shms[key].name, shape, dtype.str) for key, (shape, dtype) in self._specs.items()}
+        bounds = np.linspace(0, num_envs, num_workers + 1).astype(int)
+        self._bounds = [(int(bounds[w]), int(bounds[w+1])) for w in range(num_workers)]
+        seeds = _env_seeds(config.get('seed'), num_envs)
+        self._conns = []
+        self._processes = []
+        for start, stop in self._bounds:
+            parent_conn, child_conn = ctx.Pipe()
+            process = ctx.Process(
+                target=_subproc_worker,
+                args=(child_conn, env_id, config, start, stop, seeds[start:stop], shm_specs),
+                daemon=True)
+            process.start()
+            child_conn.close()
+            self._conns.append(parent_conn)
+            self._processes.append(process)
+        self.closed = False
+
+    def reset(self):
+        ''' Start a new game in every environment
+
+        Returns:
+            (tuple): Tuple containing:
+
+                (numpy.array): The stacked observations, (num_envs, *obs_shape)
+                (numpy.array): The stacked legal-action masks, (num_envs, num_actions)
+                (numpy.array): The current player of each environment
+        '''
+        self._call('reset')
+        return self.obs, self.legal_mask, self.player_ids
+
+    def step(self, actions):
+        ''' Step every environment with the action id of its current player
+
+        Args:
+            actions (list or numpy.array): One action id for each environment
+
+        Returns:
+            (tuple): The same as VectorEnv.step
+        '''
+        if len(actions) != self.num_envs:
+            raise ValueError('Expected {} actions, got {}'.format(self.num_envs, len(actions)))
+        self._actions[:] = actions
+        self._call('step')
+        return self.obs, self.legal_mask, self.player_ids, self.payoffs, self.dones
+
+    def seed(self, seed=None):
+        ''' Seed the environments with independent seeds derived from seed
+        '''
+        seeds = _env_seeds(seed, self.num_envs)
+        for conn, (start, stop) in zip(self._conns, self._bounds):
+            conn.send(('seed', seeds[start:stop]))
+        for conn in self._conns:
+            self._recv(conn)
+
+    def close(self):
+        ''' Stop the workers and release the shared memory
+        '''
+        if self.closed:
+            return
+        self.closed = True
+        for conn in self._conns:
+            try:
+                conn.send(('close', None))
+            except (BrokenPipeError, EOFError, OSError):
+                pass
+        for process in self._processes:
+            process.join(timeout=5)
+            if process.is_alive():
+                process.terminate()
+        for conn in self._conns:
+            conn.close()
+        self.obs = self.legal_mask = self.player_ids = self.payoffs = self.dones = None
+        self._actions = None
+        self._buffers = {}
+        for shm in self._shms.values():
+            shm.close()
+            shm.unlink()
+        self._shms = {}
+
+    def _call(self, command):
+        for conn, (start, stop) in zip(self._conns, self._bounds):
+            actions = None
+            if command == 'step' and not self._shared:
+                actions = self._actions[start:stop]
+            conn.send((command, actions))
+        for conn, (start, stop) in zip(self._conns, self._bounds):
+            results = self._recv(conn)
+            if results is not None:
+                for key, value in results.items():
+                    self._buffers[key][start:stop] = value
+
+    @staticmethod
+    def _recv(conn):
+        try:
+            status, message = conn.recv()
+        except (EOFError, OSError):
+            raise RuntimeError('Vector env worker exited unexpectedly')
+        if status != 'ready':
+            raise RuntimeError('Vector env worker failed:\n{}'.format(message))
+        return message
+
+    def __len__(self):
+        return self.num_envs
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __del__(self):
+        if not getattr(self, 'closed', True):
+            self.close()
+
+def _env_seeds(seed, num_envs):
+    ''' Derive the seeds of num_envs environments, all None if seed is None
+    '''
+    if seed is None:
+        return [None] * num_envs
+    return spawn_seeds(seed, num_envs)
+
+_RESULT_KEYS = ['obs', 'legal_mask', 'player_ids', 'payoffs', 'dones']
+
+def _attach_shared_memory(name):
+    ''' Attach to a shared memory segment of the parent without registering
+    it with the resource tracker. The tracker is shared with the parent,
+    which unlinks the segment, so a registration by the worker would be
+    reported as leaked or unlinked twice
+    '''
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        # Python < 3.13 registers every attached segment
+        register = resource_tracker.register
+        resource_tracker.register = lambda name, rtype: None
+        try:
+            return shared_memory.SharedMemory(name=name)
+        finally:
+            resource_tracker.register = register
+
+def _subproc_worker(conn, env_id, config, start, stop, seeds, shm_specs):
+    ''' The worker loop of SubprocVectorEnv. It steps the environments
+    [start, stop) through a local VectorEnv whose buffers are views of the
+    shared memory. If shm_specs is None, the actions are received with the
+    step command and the buffers are sent back with every reply.
+    '''
+    import traceback
+
+    shms = []
+    vec_env = views = actions = None
+    try:
+        _config = dict(config)
+        _config['seed'] = None
+        vec_env = VectorEnv(env_id, stop - start, _config)
+        vec_env._seed_envs(seeds)
+        if shm_specs is not None:
+            views = {}
+            for key, (name, shape, dtype) in shm_specs.items():
+                shm = _attach_shared_memory(name)
+                shms.append(shm)
+                views[key] = np.ndarray(shape, dtype=np.dtype(dtype), buffer=shm.buf)[start:stop]
+            for key in _RESULT_KEYS:
+                setattr(vec_env, key, views[key])
+            actions = views['actions']
+    except Exception:
+        conn.send(('error', traceback.format_exc()))
+        vec_env = None
+
+    try:
+        while vec_env is not None:
+            command, data = conn.recv()
+            try:
+                if command == 'reset':
+                    vec_env.reset()
+                elif command == 'step':
+                    vec_env.step(actions if data is None else data)
+                elif command == 'seed':
+                    vec_env._seed_envs(data)
+                elif command == 'close':
+                    break
+                results = None
+                if shm_specs is None and command in ('reset', 'step'):
+                    results = {key: getattr(vec_env, key) for key in _RESULT_KEYS}
+                conn.send(('ready', results))
+            except Exception:
+                conn.send(('error', traceback.format_exc()))
+    except (KeyboardInterrupt, EOFError):
+        pass
+    finally:
+        views = vec_env = actions = None
+        for shm in shms:
+            shm.close()
+        conn.close()
@@ -1,5 +1,9 @@
 ''' Game-related base classes
 '''
+import copy
+
+import numpy as np
+
 class Card:
     '''
     Card stores the suit and rank of a single card
@@ -50,3 +54,94 @@ class Card:
             string: the combination of suit and rank of a card. Eg: 1S, 2H, AD, BJ, RJ...
         '''
         return self.suit+self.rank
+
+
+def _copy_state(value, memo):
+    ''' Copy the containers (lists, dicts, sets and numpy arrays) in a value,
+        keeping other objects by reference. Objects already in `memo` are
+        replaced by their copy, which preserves aliasing between containers
+    '''
+    copied = memo.get(id(value))
+    if copied is not None:
+        return copied
+    if isinstance(value, list):
+        copied = memo[id(value)] = value.copy()
+        for i, v in enumerate(copied):
+            if isinstance(v, _CONTAINER_TYPES) or id(v) in memo:
+                copied[i] = _copy_state(v, memo)
+    elif isinstance(value, dict):
+        copied = memo[id(value)] = value.copy()
+        for k, v in copied.items():
+            if isinstance(v, _CONTAINER_TYPES) or id(v) in memo:
+                copied[k] = _copy_state(v, memo)
+    elif isinstance(value, _CONTAINER_TYPES):
+        copied = memo[id(value)] = value.copy()
+    else:
+        copied = value
+    return copied
+
+_CONTAINER_TYPES = (list, dict, set, np.ndarray)
+
+
+class SnapshotMixin:
+    ''' Snapshot, restore and clone for games
+
+    A snapshot records the attributes of every object that holds mutable
+    game state, as listed by `_snapshot_objects`, together with the state
+    of the random number generator. Only containers are copied, the cards
+    and other immutable objects are shared, so a snapshot is much cheaper
+    than a deepcopy of the game. Cards that change during a game, e.g., the
+    wild cards of Uno taking a colour, must be listed as well.
+
+    Note: The step_back history of the game is copied as a list of its
+    entries, so stepping back from a restored state is only supported
+    when the game has not stepped back past the snapshot in between.
+    '''
+
+    def _snapshot_objects(self):
+        ''' Return the objects that hold the mutable state of the game,
+            including the game itself. Must be implemented in the child class.
+
+        Returns:
+            (list): A list of objects
+        '''
+        raise NotImplementedError
+
+    def snapshot(self):
+        ''' Take a snapshot of the current state of the game
+
+        Returns:
+            (tuple): An opaque snapshot to be passed to `restore`
+        '''
+        memo = {}
+        objects = [(obj, _copy_state(obj.__dict__, memo)) for obj in self._snapshot_objects()]
+        return self.np_random.get_state(legacy=False), objects
+
+    def restore(self, snapshot):
+        ''' Restore the game to a snapshot. A snapshot can be restored
+            any number of times
+
+        Args:
+            snapshot (tuple): A snapshot returned by `snapshot`
+        '''
+        np_random_state, objects = snapshot
+        memo = {}
+        for obj, state in objects:
+            obj.__dict__ = _copy_state(state, memo)
+        self.np_random.set_state(np_random_state)
+
+    def clone(self):
+        ''' Create an independent copy of the game with its own objects and
+            random number generator
+
+        Returns:
+            (object): The copy of the game
+        '''
+        _, objects = self.snapshot()
+        np_random = copy.deepcopy(self.np_random)
+        memo = {id(self.np_random): np_random}
+        for obj, _ in objects:
+            memo[id(obj)] = object.__new__(type(obj))
+        for obj, state in objects:
+            memo[id(obj)].__dict__ = _copy_state(state, memo)
+        return memo[id(self)]
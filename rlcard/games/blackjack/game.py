@@ -4,8 +4,9 @@ import numpy as np
 from rlcard.games.blackjack import Dealer
 from rlcard.games.blackjack import Player
 from rlcard.games.blackjack import Judger
+from rlcard.games.base import SnapshotMixin
 
-class BlackjackGame:
+class BlackjackGame(SnapshotMixin):
 
     def __init__(self, allow_step_back=False):
         ''' Initialize the class Blackjack Game
@@ -26,13 +27,21 @@ class BlackjackGame:
             state (dict): the first state of the game
             player_id (int): current player's id
         '''
-        self.dealer = Dealer(self.np_random, self.num_decks)
+        # Reuse the dealer, players and judger of the last game. They are
+        # created again after reseeding or configuring the game
+        if getattr(self, 'dealer', None) is not None and self.dealer.np_random is self.np_random \
+                and self.dealer.num_decks == self.num_decks and len(self.players) == self.num_players:
+            self.dealer.reset()
+            for player in self.players:
+                player.reset()
+        else:
+            self.dealer = Dealer(self.np_random, self.num_decks)
 
-        self.players = []
-        for i in range(self.num_players):
-            self.players.append(Player(i, self.np_random))
+            self.players = []
+            for i in range(self.num_players):
+                self.players.append(Player(i, self.np_random))
 
-        self.judger = Judger(self.np_random)
+            self.judger = Judger(self.np_random)
 
         for i in range(2):
             for j in range(self.num_players):
@@ -53,6 +62,14 @@ class BlackjackGame:
 
         return self.get_state(self.game_pointer), self.game_pointer
 
+    def _snapshot_objects(self):
+        ''' Return the objects that hold the mutable state of the game
+
+        Returns:
+            (list): A list of objects
+        '''
+        return [self, self.dealer, self.judger] + self.players
+
     def step(self, action):
         ''' Get the next state
 
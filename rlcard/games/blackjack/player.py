@@ -9,6 +9,11 @@ class BlackjackPlayer:
         '''
         self.np_random = np_random
         self.player_id = player_id
+        self.reset()
+
+    def reset(self):
+        ''' Clear the hand for a new game
+        '''
         self.hand = []
         self.status = 'alive'
         self.score = 0
@@ -0,0 +1,95 @@
+'''
+    File name: bridge/determinization.py
+
+    Sampling the hidden hands of bridge
+'''
+
+from typing import List
+
+import numpy as np
+
+from .game import BridgeGame
+from .utils.bridge_card import BridgeCard
+from .utils.move import PlayCardMove
+from rlcard.envs.env import Env
+from rlcard.utils.determinization import sample_deals
+
+
+class BridgeDealSampler:
+
+    '''
+        A player sees the own hand, the hand of the dummy after the opening lead, and the played cards.
+        The other hands hold the rest of the cards, and a player who did not follow suit holds no card of the led suit.
+        A deal is an array of the player id holding every card id, -1 for the played cards.
+        Given an environment, the sampler restores it with Env.restore, so that its cached state follows the deal.
+    '''
+
+    def __init__(self, game: BridgeGame or Env, player_id: int or None = None, np_random=None):
+        ''' Read the public information of the current position and take a snapshot of the game
+        :param game: BridgeGame, or the BridgeEnv of the game
+        :param player_id: the player who sees the position; the current player if None
+        :param np_random: numpy.random.RandomState
+        '''
+        self.env: Env or None = game if isinstance(game, Env) else None
+        if self.env is not None:
+            game = self.env.game
+        game_round = game.round
+        self.game: BridgeGame = game
+        self.player_id: int = game_round.current_player_id if player_id is None else player_id
+        self.np_random = np.random.RandomState() if np_random is None else np_random
+        self._snapshot = game.snapshot() if self.env is None else self.env.snapshot()
+
+        visible_ids = {self.player_id}
+        dummy = game_round.get_dummy()
+        if dummy is not None and game_round.play_card_count > 0:
+            visible_ids.add(dummy.player_id)
+        self.hidden_ids: List[int] = [player_id for player_id in range(4) if player_id not in visible_ids]
+        self.owners = np.full(52, -1, dtype=np.int8)
+        for player in game_round.players:
+            for card in player.hand:
+                self.owners[card.card_id] = player.player_id
+        self.hidden_cards = np.flatnonzero(np.isin(self.owners, self.hidden_ids))
+        self.sizes: List[int] = [len(game_round.players[player_id].hand) for player_id in self.hidden_ids]
+
+        # A player who did not follow the led suit is void in it
+        voids = np.zeros((4, 4), dtype=bool)
+        play_card_moves = [move for move in game_round.move_sheet if isinstance(move, PlayCardMove)]
+        for trick_start in range(0, len(play_card_moves), 4):
+            trick_moves = play_card_moves[trick_start:trick_start + 4]
+            led_suit = trick_moves[0].card.suit
+            for move in trick_moves[1:]:
+                if move.card.suit != led_suit:
+                    voids[move.player.player_id, BridgeCard.suits.index(led_suit)] = True
+        self._allowed = ~voids[self.hidden_ids][:, self.hidden_cards // 13]
+
+    def sample(self, num_samples: int) -> np.ndarray:
+        ''' Sample deals consistent with the public information
+        :param num_samples: the number of deals
+        :return: the player id holding every card id in every deal, of shape (num_samples, 52)
+        '''
+        owners = sample_deals(num_samples, self.sizes, self._allowed, np_random=self.np_random)
+        deals = np.tile(self.owners, (num_samples, 1))
+        deals[:, self.hidden_cards] = np.asarray(self.hidden_ids, dtype=np.int8)[owners]
+        return deals
+
+    def restore(self, deal: np.ndarray or None = None):
+        ''' Restore the game to the position of the sampler, with the hands of a sampled deal
+        :param deal: the player id holding every card id, one of the deals of sample; the actual hands if None
+        :return: the state and the id of the current player if the sampler was given an environment
+        '''
+        if self.env is None:
+            self.game.restore(self._snapshot)
+        else:
+            self.env.restore(self._snapshot)
+        if deal is not None:
+            deal = np.asarray(deal)
+            if not np.array_equal(np.isin(deal, self.hidden_ids), np.isin(self.owners, self.hidden_ids)):
+                raise ValueError('The deal does not hold the hidden cards')
+            for player_id in self.hidden_ids:
+                hand = [BridgeCard.card(card_id) for card_id in np.flatnonzero(deal == player_id).tolist()]
+                self.game.round.players[player_id].hand = hand
+        if self.env is not None:
+            # The cached state was computed from the hands of the snapshot
+            self.env._clear_cache()
+            player_id = self.env.get_player_id()
+            return self.env.get_state(player_id), player_id
@@ -11,9 +11,10 @@ import numpy as np
 from .judger import BridgeJudger
 from .round import BridgeRound
 from .utils.action_event import ActionEvent, CallActionEvent, PlayCardAction
+from rlcard.games.base import SnapshotMixin
 
 
-class BridgeGame:
+class BridgeGame(SnapshotMixin):
     ''' Game class. This class will interact with outer environment.
     '''
 
@@ -40,6 +41,15 @@ class BridgeGame:
         state = self.get_state(player_id=current_player_id)
         return state, current_player_id
 
+    def _snapshot_objects(self):
+        ''' Return the objects that hold the mutable state of the game
+
+        Returns:
+            (list): A list of objects
+        '''
+        # The moves refer to the players, so they are kept for `clone`
+        return [self, self.judger, self.round, self.round.dealer] + self.round.players + self.round.move_sheet
+
     def step(self, action: ActionEvent):
         ''' Perform game action and return next player number, and the state for next player
         '''
@@ -3,8 +3,37 @@
 '''
 import functools
 
+import numpy as np
+
 from rlcard.utils import init_54_deck
-from rlcard.games.doudizhu.utils import cards2str, doudizhu_sort_card
+from rlcard.games.doudizhu.utils import cards2str, doudizhu_sort_card, CARD_RANK
+
+# The sorted deck is built once and shared by all the dealers. The cards are
+# never modified, so a new game only shuffles integer indices into this deck
+SORTED_DECK = init_54_deck()
+SORTED_DECK.sort(key=functools.cmp_to_key(doudizhu_sort_card))
+DECK_STR = cards2str(SORTED_DECK)
+# The rank of every card of the sorted deck, and its string
+_RANK_KEYS = [CARD_RANK.index(card.rank if card.rank != '' else card.suit) for card in SORTED_DECK]
+_CARD_STRS = [cards2str([card]) for card in SORTED_DECK]
+
+def sort_indices(indices):
+    ''' Sort cards given by their indices into the sorted deck. The order is
+        the same as sorting the cards with `doudizhu_sort_card`
+
+    Args:
+        indices (list): The indices of the cards
+
+    Returns:
+        (list): The sorted indices
+    '''
+    return sorted(indices, key=_RANK_KEYS.__getitem__)
+
+def indices2str(indices):
+    ''' Get the string representation of cards given by their indices,
+        the same as `cards2str`
+    '''
+    return ''.join([_CARD_STRS[i] for i in indices])
 
 class DoudizhuDealer:
     ''' Dealer will shuffle, deal cards, and determine players' roles
@@ -16,14 +45,18 @@ class DoudizhuDealer:
             1. deck with 54 cards including black joker and red joker
         '''
         self.np_random = np_random
-        self.deck = init_54_deck()
-        self.deck.sort(key=functools.cmp_to_key(doudizhu_sort_card))
+        self.deck = list(SORTED_DECK)
+        self.order = list(range(len(SORTED_DECK)))
         self.landlord = None
 
     def shuffle(self):
-        ''' Randomly shuffle the deck
+        ''' Randomly shuffle the deck. The indices of the cards are shuffled,
+            which draws the same random numbers as shuffling the cards
         '''
-        self.np_random.shuffle(self.deck)
+        order = np.arange(len(SORTED_DECK))
+        self.np_random.shuffle(order)
+        self.order = order.tolist()
+        self.deck = [SORTED_DECK[i] for i in self.order]
 
     def deal_cards(self, players):
         ''' Deal cards to players
@@ -31,12 +64,13 @@ class DoudizhuDealer:
         Args:
             players (list): list of DoudizhuPlayer objects
         '''
-        hand_num = (len(self.deck) - 3) // len(players)
+        hand_num = (len(self.order) - 3) // len(players)
+        self.hands = []
         for index, player in enumerate(players):
-            current_hand = self.deck[index*hand_num:(index+1)*hand_num]
-            current_hand.sort(key=functools.cmp_to_key(doudizhu_sort_card))
-            player.set_current_hand(current_hand)
-            player.initial_hand = cards2str(player.current_hand)
+            hand = sort_indices(self.order[index*hand_num:(index+1)*hand_num])
+            self.hands.append(hand)
+            player.set_current_hand([SORTED_DECK[i] for i in hand])
+            player.initial_hand = indices2str(hand)
 
     def determine_role(self, players):
         ''' Determine landlord and peasants according to players' hand
@@ -70,7 +104,7 @@ class DoudizhuDealer:
         #self.landlord.role = 'landlord'
 
         # give the 'landlord' the  three cards
-        self.landlord.current_hand.extend(self.deck[-3:])
-        self.landlord.current_hand.sort(key=functools.cmp_to_key(doudizhu_sort_card))
-        self.landlord.initial_hand = cards2str(self.landlord.current_hand)
+        hand = sort_indices(self.hands[self.landlord.player_id] + self.order[-3:])
+        self.landlord.set_current_hand([SORTED_DECK[i] for i in hand])
+        self.landlord.initial_hand = indices2str(hand)
         return self.landlord.player_id
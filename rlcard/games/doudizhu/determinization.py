@@ -0,0 +1,134 @@
+''' Sampling the hidden hands of Doudizhu
+
+A player sees the own hand and the played cards, so the cards of the two
+opponents together are known, and so are their numbers of cards. The
+landlord also still holds the seen cards, as many of each rank as the
+landlord has not played. Only the split of the remaining cards between the
+opponents is hidden.
+
+Cards of the same rank are interchangeable, so a deal is given as the rank
+counts of the three hands, as for `EndgameSolver.solve`.
+'''
+import numpy as np
+
+from rlcard.envs.env import Env
+from rlcard.games.doudizhu.dealer import DECK_STR, indices2str
+from rlcard.games.doudizhu.utils import cards2counts
+from rlcard.utils.determinization import sample_deals
+
+DECK_COUNTS = cards2counts(DECK_STR)
+
+
+class DoudizhuDealSampler(object):
+    ''' Samples the hands of the opponents of a player of a game that is
+    not over, and restores the game with the sampled hands. Given an
+    environment, the sampler restores it with `Env.restore`, so that its
+    cached state follows the sampled hands
+    '''
+
+    def __init__(self, game, player_id=None, np_random=None):
+        ''' Read the public information of the current position
+
+        Args:
+            game (DoudizhuGame or DoudizhuEnv): The game, or the environment
+                of the game. A snapshot of it is taken
+            player_id (int): The player who sees the position, the current
+                player if None
+            np_random (numpy.random.RandomState): The random number generator
+        '''
+        self.env = game if isinstance(game, Env) else None
+        if self.env is not None:
+            game = self.env.game
+        self.game = game
+        self.player_id = game.round.current_player if player_id is None else player_id
+        self.np_random = np.random.RandomState() if np_random is None else np_random
+        self.opponents = [(self.player_id + 1) % 3, (self.player_id + 2) % 3]
+        self._snapshot = game.snapshot() if self.env is None else self.env.snapshot()
+
+        hand_counts = game.players[self.player_id].hand_counts.copy()
+        self.hand_counts = hand_counts
+        self.hidden_counts = DECK_COUNTS - hand_counts - np.sum(game.round.played_cards, axis=0).astype(np.int8)
+        self.sizes = [int(game.players[i].hand_counts.sum()) for i in self.opponents]
+
+        # The rank of every hidden card. The seen cards come first, and only
+        # the landlord may hold them. The landlord may have played any of
+        # the cards of a rank, so the seen ones are the rest at least
+        seen_counts = np.zeros_like(self.hidden_counts)
+        landlord_id = game.round.landlord_id
+        if landlord_id in self.opponents:
+            seen_counts = cards2counts(indices2str(game.round.dealer.order[-3:]))
+            seen_counts = np.maximum(seen_counts - game.round.played_cards[landlord_id], 0).astype(np.int8)
+        rank_ids = np.arange(len(DECK_COUNTS))
+        ranks = np.concatenate((np.repeat(rank_ids, seen_counts), np.repeat(rank_ids, self.hidden_counts - seen_counts)))
+        allowed = np.ones((2, len(ranks)), dtype=bool)
+        if seen_counts.any():
+            allowed[1 - self.opponents.index(landlord_id), :seen_counts.sum()] = False
+        self._allowed = allowed
+        self._rank_matrix = np.eye(len(DECK_COUNTS), dtype=np.int8)[ranks]
+
+        # The cards of the opponents of each rank, dealt again by `restore`
+        self._rank_cards = [[] for _ in DECK_COUNTS]
+        for player_id in self.opponents:
+            for rank, cards in enumerate(game.players[player_id]._rank_cards):
+                self._rank_cards[rank].extend(cards)
+
+    def sample(self, num_samples):
+        ''' Sample deals consistent with the public information
+
+        Args:
+            num_samples (int): The number of deals
+
+        Returns:
+            (numpy.array): The rank counts of the hands of the three players,
+                of shape (num_samples, 3, 15)
+        '''
+        owners = sample_deals(num_samples, self.sizes, self._allowed, np_random=self.np_random)
+        deals = np.empty((num_samples, 3, len(DECK_COUNTS)), dtype=np.int8)
+        deals[:, self.player_id] = self.hand_counts
+        for index, player_id in enumerate(self.opponents):
+            deals[:, player_id] = (owners == index).astype(np.int8) @ self._rank_matrix
+        return deals
+
+    def restore(self, deal=None):
+        ''' Restore the game to the position of the sampler, with the hands
+        of a sampled deal. The game can be played on and stepped back, also
+        past the position of the sampler
+
+        Args:
+            deal (numpy.array): The rank counts of the three hands, one of the
+                deals of `sample`. The actual hands if None
+
+        Returns:
+            (tuple): The state and the ID of the current player, if the
+                sampler was given an environment
+        '''
+        game = self.game
+        if self.env is None:
+            game.restore(self._snapshot)
+        else:
+            self.env.restore(self._snapshot)
+        if deal is not None:
+            self._deal(deal)
+        if self.env is not None:
+            # The cached state was computed from the hands of the snapshot
+            self.env._clear_cache()
+            player_id = self.env.get_player_id()
+            return self.env.get_state(player_id), player_id
+
+    def _deal(self, deal):
+        ''' Give the opponents the cards of a deal
+        '''
+        game = self.game
+        deal = np.asarray(deal)
+        if not np.array_equal(deal[self.opponents].sum(axis=0), self.hidden_counts):
+            raise ValueError('The deal does not hold the hidden cards')
+        rank_cards = [list(cards) for cards in self._rank_cards]
+        for player_id in self.opponents:
+            player = game.players[player_id]
+            cards = []
+            for rank, count in enumerate(deal[player_id].tolist()):
+                cards.extend(rank_cards[rank][:count])
+                del rank_cards[rank][:count]
+            player.set_current_hand(cards)
+            game.judger.reset_playable_cards(player)
+        game.state = game.get_state(game.round.current_player)
@@ -0,0 +1,223 @@
+''' Exact endgame search for Doudizhu
+
+When few cards are left and all the hands are known, the game can be solved
+exactly. The landlord plays against the two peasants, so there are only two
+outcomes, +1 if the landlord wins and -1 if the peasants win, and alpha-beta
+search reduces to stopping at the first winning move of the player to move.
+
+The hands are rank counts packed into integers (see `pack_counts`), so
+playing and undoing an action is one subtraction. The positions are hashed
+incrementally with Zobrist keys into a transposition table, and the legal
+actions come from `DoudizhuJudger.legal_action_ids`, memoized by hand and
+cards to beat.
+'''
+import time
+from collections import namedtuple
+
+import numpy as np
+
+from rlcard.games.doudizhu.judger import DoudizhuJudger
+from rlcard.games.doudizhu.utils import ACTION_2_ID, ID_2_ACTION, ACTION_COUNTS, PACKED_ACTION_COUNTS, PASS_ID
+from rlcard.games.doudizhu.utils import cards2counts, pack_counts, unpack_counts
+
+EndgameResult = namedtuple('EndgameResult', ['value', 'action', 'nodes', 'solved'])
+
+# The Zobrist keys of every count of every rank in each hand, of the player
+# to move, of the landlord, and of the cards to beat and who played them
+_rng = np.random.default_rng(0x5EED)
+_HAND_KEYS = _rng.integers(1, 2**63, size=(3, 15, 5), dtype=np.int64).tolist()
+_PLAYER_KEYS = _rng.integers(1, 2**63, size=3, dtype=np.int64).tolist()
+_LANDLORD_KEYS = _rng.integers(1, 2**63, size=3, dtype=np.int64).tolist()
+_TARGET_KEYS = _rng.integers(1, 2**63, size=len(ID_2_ACTION), dtype=np.int64).tolist()
+_GREATER_KEYS = _rng.integers(1, 2**63, size=3, dtype=np.int64).tolist()
+
+# The packed counts and the number of cards of every action
+_PACKED = PACKED_ACTION_COUNTS.tolist()
+_NUM_CARDS = ACTION_COUNTS.sum(axis=1).tolist()
+
+
+class BudgetExceeded(Exception):
+    ''' Raised inside the search when the node or time budget is spent
+    '''
+
+
+class EndgameSolver(object):
+    ''' Solves Doudizhu positions with all the hands known
+
+    The transposition table is kept across calls of `solve`, so the
+    positions of successive moves of one game are solved much faster. It is
+    cleared when it grows over `max_table_size` entries.
+    '''
+
+    def __init__(self, max_nodes=None, time_limit=None, max_table_size=1000000):
+        ''' Initialize the solver
+
+        Args:
+            max_nodes (int): The maximum number of nodes searched by one
+                call of `solve`, None for no limit
+            time_limit (float): The maximum seconds of one call of `solve`,
+                None for no limit
+            max_table_size (int): The maximum number of entries of the
+                transposition table
+        '''
+        self.max_nodes = max_nodes
+        self.time_limit = time_limit
+        self.max_table_size = max_table_size
+        self.table = {}
+        self.nodes = 0
+        self._moves = {}
+        self._action_ranks = {}
+
+    def solve(self, hands, current_player, landlord_id=0, target_cards=None, greater_player=None):
+        ''' Solve a position
+
+        Args:
+            hands (list): The cards of the three players, as strings or rank counts
+            current_player (int): The player to move
+            landlord_id (int): The landlord
+            target_cards (string): The cards to beat, None when leading
+            greater_player (int): The player who played target_cards
+
+        Returns:
+            (EndgameResult): The value, +1 if the landlord wins and -1 if the
+                peasants win, the best action of the player to move, the
+                number of nodes searched, and whether the position was
+                solved. Value and action are None if the budget ran out
+        '''
+        self._hands = [int(pack_counts(cards2counts(hand) if isinstance(hand, str) else hand)) for hand in hands]
+        if not all(self._hands):
+            raise ValueError('The game is over')
+        if greater_player == current_player:
+            target_cards = None
+        self._landlord = landlord_id
+        self._player = current_player
+        self._target = None if target_cards is None else ACTION_2_ID[target_cards]
+        self._greater = None if target_cards is None else greater_player
+        self._hash = self._hash_position()
+        self._stack = []
+
+        if len(self.table) > self.max_table_size:
+            self.table.clear()
+        self.nodes = 0
+        self._deadline = None if self.time_limit is None else time.perf_counter() + self.time_limit
+        try:
+            value, action = self._search()
+        except BudgetExceeded:
+            return EndgameResult(None, None, self.nodes, False)
+        return EndgameResult(value, ID_2_ACTION[action], self.nodes, True)
+
+    def solve_game(self, game):
+        ''' Solve the current position of a game
+
+        Args:
+            game (DoudizhuGame): The game, which must not be over
+
+        Returns:
+            (EndgameResult): The result, see `solve`
+        '''
+        game_round = game.round
+        target_cards, greater_id = None, None
+        if game_round.greater_player is not None:
+            target_cards = game_round.greater_player.played_cards
+            greater_id = game_round.greater_player.player_id
+        return self.solve([player.hand_counts for player in game.players], game_round.current_player,
+                          game_round.landlord_id, target_cards, greater_id)
+
+    def _hash_position(self):
+        key = _PLAYER_KEYS[self._player] ^ _LANDLORD_KEYS[self._landlord]
+        for player_id, hand in enumerate(self._hands):
+            for rank in range(15):
+                key ^= _HAND_KEYS[player_id][rank][(hand >> 4*rank) & 15]
+        if self._target is not None:
+            key ^= _TARGET_KEYS[self._target] ^ _GREATER_KEYS[self._greater]
+        return key
+
+    def _search(self):
+        ''' Search the position
+
+        Returns:
+            (tuple): The value and the best action of the player to move
+        '''
+        self.nodes += 1
+        if self.max_nodes is not None and self.nodes > self.max_nodes:
+            raise BudgetExceeded()
+        if self._deadline is not None and not self.nodes & 1023 and time.perf_counter() > self._deadline:
+            raise BudgetExceeded()
+        entry = self.table.get(self._hash)
+        if entry is not None:
+            return entry
+
+        player = self._player
+        win_value = 1 if player == self._landlord else -1
+        hand = self._hands[player]
+        moves = self._get_moves(hand, self._target)
+        if self._target is not None:
+            # Passing first lets a teammate's cards stand
+            if (player == self._landlord) == (self._greater == self._landlord):
+                moves = (PASS_ID, ) + moves
+            else:
+                moves = moves + (PASS_ID, )
+
+        result = (-win_value, moves[0])
+        for move in moves:
+            if move != PASS_ID and _PACKED[move] == hand:
+                # Playing the whole hand wins
+                result = (win_value, move)
+                break
+            self._play(move)
+            value, _ = self._search()
+            self._undo()
+            if value == win_value:
+                result = (win_value, move)
+                break
+        self.table[self._hash] = result
+        return result
+
+    def _get_moves(self, hand, target):
+        ''' Get the actions of a hand except 'pass', the most cards first
+        '''
+        key = (hand, target)
+        moves = self._moves.get(key)
+        if moves is None:
+            target_cards = None if target is None else ID_2_ACTION[target]
+            action_ids = DoudizhuJudger.legal_action_ids(unpack_counts(hand), target_cards).tolist()
+            moves = tuple(sorted((i for i in action_ids if i != PASS_ID), key=_NUM_CARDS.__getitem__, reverse=True))
+            self._moves[key] = moves
+        return moves
+
+    def _play(self, move):
+        player = self._player
+        next_player = (player + 1) % 3
+        self._stack.append((player, self._hands[player], self._target, self._greater, self._hash))
+        key = self._hash ^ _PLAYER_KEYS[player] ^ _PLAYER_KEYS[next_player]
+        if move == PASS_ID:
+            if next_player == self._greater:
+                # Both others passed, so the greater player leads
+                key ^= _TARGET_KEYS[self._target] ^ _GREATER_KEYS[self._greater]
+                self._target = self._greater = None
+        else:
+            hand = self._hands[player]
+            for rank, count in self._get_action_ranks(move):
+                old_count = (hand >> 4*rank) & 15
+                key ^= _HAND_KEYS[player][rank][old_count] ^ _HAND_KEYS[player][rank][old_count - count]
+            self._hands[player] = hand - _PACKED[move]
+            if self._target is not None:
+                key ^= _TARGET_KEYS[self._target] ^ _GREATER_KEYS[self._greater]
+            self._target, self._greater = move, player
+            key ^= _TARGET_KEYS[move] ^ _GREATER_KEYS[player]
+        self._hash = key
+        self._player = next_player
+
+    def _undo(self):
+        player, hand, self._target, self._greater, self._hash = self._stack.pop()
+        self._hands[player] = hand
+        self._player = player
+
+    def _get_action_ranks(self, action_id):
+        ''' Get the (rank, count) pairs of the cards of an action
+        '''
+        ranks = self._action_ranks.get(action_id)
+        if ranks is None:
+            counts = ACTION_COUNTS[action_id]
+            ranks = self._action_ranks[action_id] = [(rank, int(counts[rank])) for rank in np.flatnonzero(counts).tolist()]
+        return ranks
@@ -1,17 +1,16 @@
 # -*- coding: utf-8 -*-
 ''' Implement Doudizhu Game class
 '''
-import functools
-from heapq import merge
 import numpy as np
 
-from rlcard.games.doudizhu.utils import cards2str, doudizhu_sort_card, CARD_RANK_STR
+from rlcard.games.doudizhu.utils import counts2str, CARD_RANK_STR
 from rlcard.games.doudizhu import Player
 from rlcard.games.doudizhu import Round
 from rlcard.games.doudizhu import Judger
+from rlcard.games.base import SnapshotMixin
 
 
-class DoudizhuGame:
+class DoudizhuGame(SnapshotMixin):
     ''' Provide game APIs for env to run doudizhu and get corresponding state
     information.
     '''
@@ -31,18 +30,30 @@ class DoudizhuGame:
         self.winner_id = None
         self.history = []
 
-        # initialize players
-        self.players = [Player(num, self.np_random)
-                        for num in range(self.num_players)]
-
-        # initialize round to deal cards and determine landlord
+        # The played cards are new arrays since the states of the last
+        # game may refer to them
         self.played_cards = [np.zeros((len(CARD_RANK_STR), ), dtype=np.int32)
                                 for _ in range(self.num_players)]
-        self.round = Round(self.np_random, self.played_cards)
-        self.round.initiate(self.players)
 
-        # initialize judger
-        self.judger = Judger(self.players, self.np_random)
+        # Reuse the players, the dealer and the judger of the last game. They
+        # are created again after reseeding, since they hold the generator
+        if getattr(self, 'round', None) is not None and self.round.np_random is self.np_random:
+            for player in self.players:
+                player.reset()
+            self.round.reset(self.played_cards)
+            self.round.initiate(self.players)
+            self.judger.reset(self.players)
+        else:
+            # initialize players
+            self.players = [Player(num, self.np_random)
+                            for num in range(self.num_players)]
+
+            # initialize round to deal cards and determine landlord
+            self.round = Round(self.np_random, self.played_cards)
+            self.round.initiate(self.players)
+
+            # initialize judger
+            self.judger = Judger(self.players, self.np_random)
 
         # get state of first player
         player_id = self.round.current_player
@@ -50,6 +61,14 @@ class DoudizhuGame:
 
         return self.state, player_id
 
+    def _snapshot_objects(self):
+        ''' Return the objects that hold the mutable state of the game
+
+        Returns:
+            (list): A list of objects
+        '''
+        return [self, self.round, self.round.dealer, self.judger] + self.players
+
     def step(self, action):
         ''' Perform one draw of the game
 
@@ -96,13 +115,11 @@ class DoudizhuGame:
         player_id, cards = self.round.step_back(self.players)
 
         #reverse player
-        if (cards != 'pass'):
-            self.players[player_id].played_cards = self.round.find_last_played_cards_in_trace(player_id)
         self.players[player_id].play_back()
 
         #reverse judger.played_cards if needed
         if (cards != 'pass'):
-            self.judger.restore_playable_cards(player_id)
+            self.judger.restore_playable_cards(player_id, self.players[player_id].hand_counts)
 
         self.state = self.get_state(self.round.current_player)
         return True
@@ -118,7 +135,7 @@ class DoudizhuGame:
         '''
         player = self.players[player_id]
         others_hands = self._get_others_current_hand(player)
-        num_cards_left = [len(self.players[i].current_hand) for i in range(self.num_players)]
+        num_cards_left = [int(self.players[i].hand_counts.sum()) for i in range(self.num_players)]
         if self.is_over():
             actions = []
         else:
@@ -165,5 +182,4 @@ class DoudizhuGame:
     def _get_others_current_hand(self, player):
         player_up = self.players[(player.player_id+1) % len(self.players)]
         player_down = self.players[(player.player_id-1) % len(self.players)]
-        others_hand = merge(player_up.current_hand, player_down.current_hand, key=functools.cmp_to_key(doudizhu_sort_card))
-        return cards2str(others_hand)
+        return counts2str(player_up.hand_counts + player_down.hand_counts)
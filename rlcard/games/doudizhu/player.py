@@ -1,10 +1,12 @@
 # -*- coding: utf-8 -*-
 ''' Implement Doudizhu Player class
 '''
-import functools
+import numpy as np
 
 from rlcard.games.doudizhu.utils import get_gt_cards
-from rlcard.games.doudizhu.utils import cards2str, doudizhu_sort_card
+from rlcard.games.doudizhu.utils import counts2str, CARD_RANK, CARD_RANK_STR_INDEX
+
+CARD_RANK_INDEX = {rank: i for i, rank in enumerate(CARD_RANK)}
 
 
 class DoudizhuPlayer:
@@ -22,26 +24,46 @@ class DoudizhuPlayer:
             1. role: A player's temporary role in one game(landlord or peasant)
             2. played_cards: The cards played in one round
             3. hand: Initial cards
-            4. _current_hand: The rest of the cards after playing some of them
+            4. current_hand: The rest of the cards after playing some of them
+            5. hand_counts: The number of cards of each rank in current_hand
         '''
         self.np_random = np_random
         self.player_id = player_id
+        self.reset()
+
+    def reset(self):
+        ''' Clear the hand and the role for a new game
+        '''
         self.initial_hand = None
-        self._current_hand = []
         self.role = ''
         self.played_cards = None
-        self.singles = '3456789TJQKA2BR'
+        self.set_current_hand([])
 
-        #record cards removed from self._current_hand for each play()
-        # and restore cards back to self._current_hand when play_back()
+        #record cards removed from the hand and the last played cards for
+        # each play(), and restore them when play_back()
         self._recorded_played_cards = []
 
     @property
     def current_hand(self):
+        ''' The cards of the hand sorted by rank. The list is built from the
+        cards of each rank when the hand has changed
+        '''
+        if self._current_hand is None:
+            self._current_hand = [card for cards in self._rank_cards for card in cards]
         return self._current_hand
 
     def set_current_hand(self, value):
-        self._current_hand = value
+        ''' Set the hand
+
+        Args:
+            value (list): The cards, sorted by rank
+        '''
+        # The cards of each rank, and their numbers
+        self._rank_cards = [[] for _ in CARD_RANK]
+        for card in value:
+            self._rank_cards[CARD_RANK_INDEX[card.rank or card.suit]].append(card)
+        self.hand_counts = np.array([len(cards) for cards in self._rank_cards], dtype=np.int8)
+        self._current_hand = list(value)
 
     def get_state(self, public, others_hands, num_cards_left, actions):
         state = {}
@@ -50,7 +72,7 @@ class DoudizhuPlayer:
         state['trace'] = public['trace'].copy()
         state['played_cards'] = public['played_cards']
         state['self'] = self.player_id
-        state['current_hand'] = cards2str(self._current_hand)
+        state['current_hand'] = counts2str(self.hand_counts)
         state['others_hand'] = others_hands
         state['num_cards_left'] = num_cards_left
         state['actions'] = actions
@@ -66,7 +88,8 @@ class DoudizhuPlayer:
             judger (DoudizhuJudger object): object of DoudizhuJudger
 
         Returns:
-            list: list of string of actions. Eg: ['pass', '8', '9', 'T', 'J']
+            list or tuple: list of string of actions. Eg: ['pass', '8', '9', 'T', 'J'].
+                The actions of following plays are a cached tuple
         '''
         actions = []
         if greater_player is None or greater_player.player_id == self.player_id:
@@ -76,7 +99,8 @@ class DoudizhuPlayer:
         return actions
 
     def play(self, action, greater_player=None):
-        ''' Perfrom action
+        ''' Perfrom action. The first cards of each rank are removed, which
+        takes constant time per card
 
         Args:
             action (string): specific action
@@ -85,31 +109,29 @@ class DoudizhuPlayer:
         Returns:
             object of DoudizhuPlayer: If there is a new greater_player, return it, if not, return None
         '''
-        trans = {'B': 'BJ', 'R': 'RJ'}
         if action == 'pass':
-            self._recorded_played_cards.append([])
+            self._recorded_played_cards.append(([], self.played_cards))
             return greater_player
-        else:
-            removed_cards = []
-            self.played_cards = action
-            for play_card in action:
-                if play_card in trans:
-                    play_card = trans[play_card]
-                for _, remain_card in enumerate(self._current_hand):
-                    if remain_card.rank != '':
-                        remain_card = remain_card.rank
-                    else:
-                        remain_card = remain_card.suit
-                    if play_card == remain_card:
-                        removed_cards.append(self.current_hand[_])
-                        self._current_hand.remove(self._current_hand[_])
-                        break
-            self._recorded_played_cards.append(removed_cards)
-            return self
+        removed_cards = []
+        for card in action:
+            rank = CARD_RANK_STR_INDEX[card]
+            # Cards that are not in the hand are ignored
+            if self._rank_cards[rank]:
+                removed_cards.append(self._rank_cards[rank].pop(0))
+                self.hand_counts[rank] -= 1
+        self._recorded_played_cards.append((removed_cards, self.played_cards))
+        self.played_cards = action
+        self._current_hand = None
+        return self
 
     def play_back(self):
-        ''' Restore recorded cards back to self._current_hand
+        ''' Restore the cards and the played cards recorded by the last play().
+        The cards go after the remaining cards of their rank
         '''
-        removed_cards = self._recorded_played_cards.pop()
-        self._current_hand.extend(removed_cards)
-        self._current_hand.sort(key=functools.cmp_to_key(doudizhu_sort_card))
+        removed_cards, self.played_cards = self._recorded_played_cards.pop()
+        if removed_cards:
+            for card in removed_cards:
+                rank = CARD_RANK_INDEX[card.rank or card.suit]
+                self._rank_cards[rank].append(card)
+                self.hand_counts[rank] += 1
+            self._current_hand = None
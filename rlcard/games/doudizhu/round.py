@@ -2,12 +2,10 @@
 ''' Implement Doudizhu Round class
 '''
 
-import functools
-import numpy as np
-
 from rlcard.games.doudizhu import Dealer
-from rlcard.games.doudizhu.utils import cards2str, doudizhu_sort_card
-from rlcard.games.doudizhu.utils import CARD_RANK_STR, CARD_RANK_STR_INDEX
+from rlcard.games.doudizhu.dealer import DECK_STR, sort_indices, indices2str
+from rlcard.games.doudizhu.utils import counts2str
+from rlcard.games.doudizhu.utils import CARD_RANK_STR, CARD_RANK_STR_INDEX, ACTION_2_ID
 
 
 class DoudizhuRound:
@@ -15,12 +13,25 @@ class DoudizhuRound:
     '''
     def __init__(self, np_random, played_cards):
         self.np_random = np_random
+        self.dealer = Dealer(self.np_random)
+        self.deck_str = DECK_STR
+        self.reset(played_cards)
+
+    def reset(self, played_cards):
+        ''' Clear the round for a new game. The dealer is kept
+
+        Args:
+            played_cards (list): The arrays counting the cards played by each player
+        '''
         self.played_cards = played_cards
         self.trace = []
-
+        # The id of every action in the trace, for encoding observations
+        # without strings
+        self.action_ids = []
+        # The greater player, the seen cards and the strings of the played
+        # cards before every action in the trace, restored by step_back
+        self._undo = []
         self.greater_player = None
-        self.dealer = Dealer(self.np_random)
-        self.deck_str = cards2str(self.dealer.deck)
 
     def initiate(self, players):
         ''' Call dealer to deal cards and bid landlord.
@@ -29,9 +40,7 @@ class DoudizhuRound:
             players (list): list of DoudizhuPlayer objects
         '''
         landlord_id = self.dealer.determine_role(players)
-        seen_cards = self.dealer.deck[-3:]
-        seen_cards.sort(key=functools.cmp_to_key(doudizhu_sort_card))
-        self.seen_cards = cards2str(seen_cards)
+        self.seen_cards = indices2str(sort_indices(self.dealer.order[-3:]))
         self.landlord_id = landlord_id
         self.current_player = landlord_id
         self.public = {'deck': self.deck_str, 'seen_cards': self.seen_cards,
@@ -55,14 +64,19 @@ class DoudizhuRound:
         Args:
             action(str): string of legal specific action
         '''
+        self._undo.append((self.greater_player, self.seen_cards, self.public['played_cards']))
         self.trace.append((self.current_player, action))
+        self.action_ids.append(ACTION_2_ID[action])
         if action != 'pass':
             for c in action:
                 self.played_cards[self.current_player][CARD_RANK_STR_INDEX[c]] += 1
                 if self.current_player == 0 and c in self.seen_cards:
                     self.seen_cards = self.seen_cards.replace(c, '') 
                     self.public['seen_cards'] = self.seen_cards
-            self.public['played_cards'] = self.cards_ndarray_to_str(self.played_cards)
+            # A new list, since the states given out share the old one
+            played_cards = list(self.public['played_cards'])
+            played_cards[self.current_player] = counts2str(self.played_cards[self.current_player])
+            self.public['played_cards'] = played_cards
 
     def proceed_round(self, player, action):
         ''' Call other Classes's functions to keep one round running
@@ -79,7 +93,8 @@ class DoudizhuRound:
         return self.greater_player
 
     def step_back(self, players):
-        ''' Reverse the last action
+        ''' Reverse the last action. The values recorded by update_public are
+        restored, so it takes constant time
 
         Args:
             players (list): list of DoudizhuPlayer objects
@@ -87,19 +102,30 @@ class DoudizhuRound:
             The last player id and the cards played
         '''
         player_id, cards = self.trace.pop()
+        self.action_ids.pop()
+        self.greater_player, self.seen_cards, self.public['played_cards'] = self._undo.pop()
+        self.public['seen_cards'] = self.seen_cards
         self.current_player = player_id
         if (cards != 'pass'):
             for card in cards:
-                # self.played_cards.remove(card)
                 self.played_cards[player_id][CARD_RANK_STR_INDEX[card]] -= 1
-            self.public['played_cards'] = self.cards_ndarray_to_str(self.played_cards)
-        greater_player_id = self.find_last_greater_player_id_in_trace()
-        if (greater_player_id is not None):
-            self.greater_player = players[greater_player_id]
-        else:
-            self.greater_player = None
         return player_id, cards
 
+    def last_action_index(self, player_id):
+        ''' Find the index in trace of the last action of a player. The
+        players act in turn from the landlord, so it is computed directly
+
+        Args:
+            player_id (int): The id of the player
+
+        Returns:
+            (int): The index, -1 if the player has not acted yet
+        '''
+        num_players = len(self.played_cards)
+        num_actions = len(self.trace)
+        last_player = (self.landlord_id + num_actions - 1) % num_players
+        return max(num_actions - 1 - (last_player - player_id) % num_players, -1)
+
     def find_last_greater_player_id_in_trace(self):
         ''' Find the last greater_player's id in trace
 
@@ -0,0 +1,233 @@
+''' Precompiled Doudizhu tables
+
+The action space, the card type of every action and the actions of every
+card type are shipped as JSON in `jsondata.zip`, and the number of cards
+of each rank and the 54 features of every action are derived from them.
+Parsing them creates hundreds of thousands of Python objects in every
+process. This module compiles them once into flat numpy arrays saved as
+`.npy` files, which are then opened with `mmap_mode='r'` so that all the
+processes on a machine share one copy of the pages.
+
+The tables can be compiled ahead of time with
+
+    python -m rlcard.games.doudizhu.tables
+
+otherwise they are compiled on the first import.
+'''
+import os
+import re
+import json
+import zipfile
+import tempfile
+from collections import OrderedDict
+from collections.abc import Mapping
+
+import numpy as np
+
+import rlcard
+
+ZIP_PATH = os.path.join(rlcard.__path__[0], 'games/doudizhu/jsondata.zip')
+TABLE_DIR = os.path.join(rlcard.__path__[0], 'games/doudizhu/jsondata')
+
+# Bump when the layout of the compiled tables changes
+TABLE_VERSION = 3
+
+# The names of the arrays. `action_space` is written last and marks a
+# complete set of tables
+TABLE_NAMES = ['card_type_ids', 'card_type_offsets', 'card_type_types',
+               'card_type_ranks', 'types', 'type_card_ids',
+               'type_card_group_offsets', 'type_card_group_ranks',
+               'type_card_type_offsets', 'action_counts', 'action_features',
+               'action_space']
+
+# The ranks of the columns of `action_counts`
+RANKS = '3456789TJQKA2BR'
+
+def _table_path(directory, name):
+    return os.path.join(directory, '{}.v{}.npy'.format(name, TABLE_VERSION))
+
+def _remove_old_tables(directory):
+    ''' Remove the tables of other versions, which are left behind when
+        TABLE_VERSION is bumped
+    '''
+    for file_name in os.listdir(directory):
+        match = re.fullmatch(r'\w+\.v(\d+)\.npy', file_name)
+        if match and int(match.group(1)) != TABLE_VERSION:
+            try:
+                os.remove(os.path.join(directory, file_name))
+            except OSError:
+                # E.g., still opened by another process on Windows
+                pass
+
+def compile_tables(zip_path=ZIP_PATH):
+    ''' Compile the JSON tables of `jsondata.zip` into numpy arrays
+
+    Args:
+        zip_path (str): The path of the zip file with the JSON tables
+
+    Returns:
+        (dict): A dictionary of numpy arrays, see `TABLE_NAMES`
+    '''
+    with zipfile.ZipFile(zip_path, 'r') as zip_ref:
+        id_2_action = zip_ref.read('jsondata/action_space.txt').decode().strip().split()
+        card_type = json.loads(zip_ref.read('jsondata/card_type.json'), object_pairs_hook=OrderedDict)
+        type_card = json.loads(zip_ref.read('jsondata/type_card.json'), object_pairs_hook=OrderedDict)
+    action_2_id = {action: i for i, action in enumerate(id_2_action)}
+    types = list(type_card)
+
+    # The number of cards of each rank in every action, zeros for 'pass'
+    action_counts = np.zeros((len(id_2_action), len(RANKS)), dtype=np.int8)
+    for i, action in enumerate(id_2_action):
+        if action != 'pass':
+            for card in action:
+                action_counts[i, RANKS.index(card)] += 1
+
+    # The 54 features of every action that the agents see: 4 for each rank
+    # from '3' to '2', one for each copy of the card, then the two jokers
+    action_features = np.zeros((len(id_2_action), 54), dtype=np.int8)
+    action_features[:, :52] = (action_counts[:, :13, np.newaxis] > np.arange(4)).reshape(-1, 52)
+    action_features[:, 52:] = action_counts[:, 13:]
+    type_2_id = {t: i for i, t in enumerate(types)}
+
+    # The card types of action i are the entries offsets[i]:offsets[i+1]
+    entries = [[] for _ in id_2_action]
+    for cards, cards_types in card_type.items():
+        entries[action_2_id[cards]] = [(type_2_id[t], int(rank)) for t, rank in cards_types]
+    card_type_offsets = np.zeros(len(id_2_action) + 1, dtype=np.int32)
+    card_type_offsets[1:] = np.cumsum([len(e) for e in entries])
+    flat_entries = [entry for e in entries for entry in e]
+
+    # Type t owns the groups type_offsets[t]:type_offsets[t+1], and group g
+    # owns the actions group_offsets[g]:group_offsets[g+1]
+    type_card_ids, group_offsets, group_ranks, type_offsets = [], [0], [], [0]
+    for t in types:
+        for rank, cards_list in type_card[t].items():
+            type_card_ids.extend(action_2_id[cards] for cards in cards_list)
+            group_offsets.append(len(type_card_ids))
+            group_ranks.append(int(rank))
+        type_offsets.append(len(group_ranks))
+
+    return {
+        'action_space': np.array(id_2_action),
+        'card_type_ids': np.array([action_2_id[cards] for cards in card_type], dtype=np.int32),
+        'card_type_offsets': card_type_offsets,
+        'card_type_types': np.array([t for t, _ in flat_entries], dtype=np.int8),
+        'card_type_ranks': np.array([r for _, r in flat_entries], dtype=np.int16),
+        'types': np.array(types),
+        'type_card_ids': np.array(type_card_ids, dtype=np.int32),
+        'type_card_group_offsets': np.array(group_offsets, dtype=np.int32),
+        'type_card_group_ranks': np.array(group_ranks, dtype=np.int16),
+        'type_card_type_offsets': np.array(type_offsets, dtype=np.int32),
+        'action_counts': action_counts,
+        'action_features': action_features,
+    }
+
+def save_tables(tables, directory=TABLE_DIR):
+    ''' Save compiled tables. Every file is written to a temporary name and
+        renamed, so concurrent readers never see a partial table. The tables
+        of other versions are removed
+
+    Args:
+        tables (dict): The arrays returned by `compile_tables`
+        directory (str): The directory of the `.npy` files
+    '''
+    os.makedirs(directory, exist_ok=True)
+    for name in TABLE_NAMES:
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                np.save(f, tables[name])
+            os.replace(tmp_path, _table_path(directory, name))
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+    _remove_old_tables(directory)
+
+def load_tables(directory=TABLE_DIR):
+    ''' Load the compiled tables memory-mapped, compiling them first if
+        needed. If the directory is not writable, the tables are compiled
+        in memory instead
+
+    Args:
+        directory (str): The directory of the `.npy` files
+
+    Returns:
+        (dict): A dictionary of read-only numpy arrays
+    '''
+    if not os.path.isfile(_table_path(directory, 'action_space')):
+        tables = compile_tables()
+        try:
+            save_tables(tables, directory)
+        except OSError:
+            return tables
+    return {name: np.load(_table_path(directory, name), mmap_mode='r') for name in TABLE_NAMES}
+
+
+class CardTypeTable(Mapping):
+    ''' Read-only map from cards to their types, e.g., '33344' -> [['trio_solo', '0']]
+    '''
+
+    def __init__(self, tables, id_2_action, action_2_id):
+        self._offsets = tables['card_type_offsets']
+        self._types = tables['types'].tolist()
+        self._entry_types = tables['card_type_types']
+        self._entry_ranks = tables['card_type_ranks']
+        self._ids = tables['card_type_ids']
+        self._id_2_action = id_2_action
+        self._action_2_id = action_2_id
+
+    def __getitem__(self, cards):
+        action_id = self._action_2_id[cards]
+        start, stop = self._offsets[action_id], self._offsets[action_id + 1]
+        if start == stop:
+            raise KeyError(cards)
+        return [[self._types[t], str(r)] for t, r in zip(self._entry_types[start:stop].tolist(),
+                                                          self._entry_ranks[start:stop].tolist())]
+
+    def __contains__(self, cards):
+        action_id = self._action_2_id.get(cards)
+        return action_id is not None and self._offsets[action_id] != self._offsets[action_id + 1]
+
+    def __iter__(self):
+        return (self._id_2_action[i] for i in self._ids.tolist())
+
+    def __len__(self):
+        return len(self._ids)
+
+
+class TypeCardTable(Mapping):
+    ''' Read-only map from a card type to its actions grouped by rank,
+        e.g., 'solo' -> {'0': ['3'], '1': ['4'], ...}. The map of a type is
+        built on its first access
+    '''
+
+    def __init__(self, tables, id_2_action):
+        self._types = tables['types'].tolist()
+        self._type_2_id = {t: i for i, t in enumerate(self._types)}
+        self._tables = tables
+        self._id_2_action = id_2_action
+        self._cache = {}
+
+    def __getitem__(self, card_type):
+        if card_type not in self._cache:
+            t = self._type_2_id[card_type]
+            type_offsets = self._tables['type_card_type_offsets']
+            group_offsets = self._tables['type_card_group_offsets'][type_offsets[t]:type_offsets[t + 1] + 1].tolist()
+            ranks = self._tables['type_card_group_ranks'][type_offsets[t]:type_offsets[t + 1]].tolist()
+            ids = self._tables['type_card_ids'][group_offsets[0]:group_offsets[-1]].tolist()
+            start = group_offsets[0]
+            self._cache[card_type] = OrderedDict(
+                (str(rank), [self._id_2_action[i] for i in ids[begin - start:end - start]])
+                for rank, begin, end in zip(ranks, group_offsets[:-1], group_offsets[1:]))
+        return self._cache[card_type]
+
+    def __iter__(self):
+        return iter(self._types)
+
+    def __len__(self):
+        return len(self._types)
+
+
+if __name__ == '__main__':
+    save_tables(compile_tables())
+    print('Compiled Doudizhu tables into {}'.format(TABLE_DIR))
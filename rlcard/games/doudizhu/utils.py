@@ -1,41 +1,49 @@
 ''' Doudizhu utils
 '''
-import os
-import json
 from collections import OrderedDict
 import threading
 import collections
 
-import rlcard
+import numpy as np
 
-# Read required docs
-ROOT_PATH = rlcard.__path__[0]
+from rlcard.games.doudizhu.tables import load_tables, CardTypeTable, TypeCardTable
 
-if not os.path.isfile(os.path.join(ROOT_PATH, 'games/doudizhu/jsondata/action_space.txt')) \
-        or not os.path.isfile(os.path.join(ROOT_PATH, 'games/doudizhu/jsondata/card_type.json')) \
-        or not os.path.isfile(os.path.join(ROOT_PATH, 'games/doudizhu/jsondata/type_card.json')):
-    import zipfile
-    with zipfile.ZipFile(os.path.join(ROOT_PATH, 'games/doudizhu/jsondata.zip'),"r") as zip_ref:
-        zip_ref.extractall(os.path.join(ROOT_PATH, 'games/doudizhu/'))
+# Read the precompiled, memory-mapped tables
+TABLES = load_tables()
 
 # Action space
-action_space_path = os.path.join(ROOT_PATH, 'games/doudizhu/jsondata/action_space.txt')
-with open(action_space_path, 'r') as f:
-    ID_2_ACTION = f.readline().strip().split()
-    ACTION_2_ID = {}
-    for i, action in enumerate(ID_2_ACTION):
-        ACTION_2_ID[action] = i
+ID_2_ACTION = TABLES['action_space'].tolist()
+ACTION_2_ID = {action: i for i, action in enumerate(ID_2_ACTION)}
 
 # a map of card to its type. Also return both dict and list to accelerate
-card_type_path = os.path.join(ROOT_PATH, 'games/doudizhu/jsondata/card_type.json')
-with open(card_type_path, 'r') as f:
-    data = json.load(f, object_pairs_hook=OrderedDict)
-    CARD_TYPE = (data, list(data), set(data))
+_card_type = CardTypeTable(TABLES, ID_2_ACTION, ACTION_2_ID)
+CARD_TYPE = (_card_type, list(_card_type), set(_card_type))
 
 # a map of type to its cards
-type_card_path = os.path.join(ROOT_PATH, 'games/doudizhu/jsondata/type_card.json')
-with open(type_card_path, 'r') as f:
-    TYPE_CARD = json.load(f, object_pairs_hook=OrderedDict)
+TYPE_CARD = TypeCardTable(TABLES, ID_2_ACTION)
+
+# The number of cards of each rank, in the order of CARD_RANK_STR, in every
+# action. The counts are also packed into the 4-bit fields of an unsigned
+# 64-bit integer. Setting bit 3 of every field of a hand and subtracting the
+# packed counts of an action leaves all these bits set if and only if the
+# action fits in the hand, so all the actions are tested at once
+ACTION_COUNTS = TABLES['action_counts']
+_FIELD_SHIFTS = np.arange(0, 60, 4, dtype=np.uint64)
+_GUARD_BITS = np.bitwise_or.reduce(np.uint64(8) << _FIELD_SHIFTS)
+PACKED_ACTION_COUNTS = np.bitwise_or.reduce(ACTION_COUNTS.astype(np.uint64) << _FIELD_SHIFTS, axis=1)
+PASS_ID = ACTION_2_ID['pass']
+
+# The features of every action, e.g., ACTION_FEATURES[ids] for the features
+# of a list of legal actions. Read-only and shared by all the processes
+ACTION_FEATURES = TABLES['action_features']
+
+# The actions of every card type as in TYPE_CARD, and the rank of each
+_group_offsets = TABLES['type_card_group_offsets']
+_type_offsets = TABLES['type_card_type_offsets']
+_TYPE_ACTION_IDS = np.asarray(TABLES['type_card_ids'], dtype=np.int64)
+_TYPE_ACTION_RANKS = np.repeat(TABLES['type_card_group_ranks'], np.diff(_group_offsets))
+_TYPE_SLICES = {card_type: (int(_group_offsets[_type_offsets[t]]), int(_group_offsets[_type_offsets[t+1]]))
+                for t, card_type in enumerate(TABLES['types'].tolist())}
 
 # rank list of solo character of cards
 CARD_RANK_STR = ['3', '4', '5', '6', '7', '8', '9', 'T', 'J', 'Q', 'K',
@@ -150,11 +158,74 @@ def cards2str(cards):
             response += card.rank
     return response
 
+CacheInfo = collections.namedtuple('CacheInfo', ['hits', 'misses', 'maxsize', 'currsize'])
+
+class LegalActionCache:
+    ''' A bounded LRU cache of the legal actions of following plays, keyed by
+    the packed rank counts of the hand and the id of the cards to beat. The
+    actions only depend on these two, not on the history of the game, so the
+    entries stay valid across games and `step_back`.
+    '''
+    def __init__(self, maxsize=65536):
+        ''' Initialize the cache
+
+        Args:
+            maxsize (int): The maximum number of entries, 0 to disable the cache
+        '''
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+
+    def get(self, key):
+        ''' Get the actions of a key, None if they are not cached
+        '''
+        actions = self._entries.get(key)
+        if actions is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+            self._entries.move_to_end(key)
+        return actions
+
+    def put(self, key, actions):
+        ''' Cache the actions of a key, evicting the least recently used entry
+        '''
+        if self.maxsize <= 0:
+            return
+        self._entries[key] = actions
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def info(self):
+        ''' Get the statistics of the cache
+
+        Returns:
+            (CacheInfo): hits, misses, maxsize and currsize, as functools.lru_cache
+        '''
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self._entries))
+
+    def clear(self):
+        ''' Remove all the entries and reset the statistics
+        '''
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
 class LocalObjs(threading.local):
     def __init__(self):
         self.cached_candidate_cards = None
+        self.legal_action_cache = LegalActionCache()
 _local_objs = LocalObjs()
 
+def get_legal_action_cache():
+    ''' Get the legal action cache of the current thread
+
+    Returns:
+        (LegalActionCache): The cache used by get_gt_cards in this thread
+    '''
+    return _local_objs.legal_action_cache
+
 def contains_cards(candidate, target):
     ''' Check if cards of candidate contains cards of target.
 
@@ -222,41 +293,151 @@ def encode_cards(plane, cards):
         plane[0][rank] = 0
 
 
-def get_gt_cards(player, greater_player):
-    ''' Provide player's cards which are greater than the ones played by
-    previous player in one round
+def cards2counts(cards):
+    ''' Count the cards of each rank
 
     Args:
-        player (DoudizhuPlayer object): the player waiting to play cards
-        greater_player (DoudizhuPlayer object): the player who played current biggest cards.
+        cards (string): string of cards. Eg: '33444BR'
 
     Returns:
-        list: list of string of greater cards
+        numpy.array: the 15 counts in the order of CARD_RANK_STR
+    '''
+    counts = np.zeros(len(CARD_RANK_STR), dtype=np.int8)
+    for card in cards:
+        counts[CARD_RANK_STR_INDEX[card]] += 1
+    return counts
 
-    Note:
-        1. return value contains 'pass'
+def pack_counts(counts):
+    ''' Pack the rank counts of a hand into the 4-bit fields of an integer
+
+    Args:
+        counts (numpy.array): the rank counts of the hand, see cards2counts
+
+    Returns:
+        numpy.uint64: the packed counts
+    '''
+    return np.bitwise_or.reduce(np.asarray(counts).astype(np.uint64) << _FIELD_SHIFTS)
+
+def unpack_counts(packed):
+    ''' Unpack the rank counts packed by pack_counts
+
+    Args:
+        packed (int): the packed counts
+
+    Returns:
+        numpy.array: the 15 rank counts
+    '''
+    return ((np.uint64(packed) >> _FIELD_SHIFTS) & np.uint64(15)).astype(np.int8)
+
+def actions_fit(counts, action_ids=None):
+    ''' Test whether the cards of actions are all in a hand
+
+    Args:
+        counts (numpy.array): the rank counts of the hand, see cards2counts
+        action_ids (numpy.array): the action ids, all the actions (including
+            'pass') if None
+
+    Returns:
+        numpy.array: a boolean for every action
+    '''
+    packed_hand = pack_counts(counts) | _GUARD_BITS
+    packed_actions = PACKED_ACTION_COUNTS if action_ids is None else PACKED_ACTION_COUNTS[action_ids]
+    return ((packed_hand - packed_actions) & _GUARD_BITS) == _GUARD_BITS
+
+def counts2str(counts):
+    ''' Get the string of cards given by their rank counts
+
+    Args:
+        counts (numpy.array): the rank counts, see cards2counts
+
+    Returns:
+        string: string of cards sorted by rank. Eg: '33444BR'
+    '''
+    return ''.join([CARD_RANK_STR[i] * n for i, n in enumerate(counts.tolist()) if n])
+
+def fitting_action_ids(counts, action_ids=None):
+    ''' Find the actions whose cards are all in a hand
+
+    Args:
+        counts (numpy.array): the rank counts of the hand, see cards2counts
+        action_ids (numpy.array): the candidate action ids, all the actions
+            (including 'pass') if None
+
+    Returns:
+        numpy.array: the candidate ids that fit in the hand, in order
+    '''
+    fits = actions_fit(counts, action_ids)
+    if action_ids is None:
+        return np.flatnonzero(fits)
+    return action_ids[fits]
+
+def playable_action_ids(counts):
+    ''' Find the actions that a player can lead with a hand
+
+    Args:
+        counts (numpy.array): the rank counts of the hand, see cards2counts
+
+    Returns:
+        numpy.array: the sorted ids of the actions, without 'pass'
+    '''
+    action_ids = fitting_action_ids(counts)
+    return action_ids[action_ids != PASS_ID]
+
+def get_gt_action_ids(counts, target_cards):
+    ''' Find the actions of a hand that beat the cards played before
+
+    Args:
+        counts (numpy.array): the rank counts of the hand, see cards2counts
+        target_cards (string): the current biggest cards
+
+    Returns:
+        numpy.array: the ids of the actions, without 'pass'. They are ordered
+            by card type (the types of target_cards, then rocket and bomb),
+            then as in TYPE_CARD
     '''
-    # add 'pass' to legal actions
-    gt_cards = ['pass']
-    current_hand = cards2str(player.current_hand)
-    target_cards = greater_player.played_cards
-    target_types = CARD_TYPE[0][target_cards]
     type_dict = {}
-    for card_type, weight in target_types:
+    for card_type, weight in CARD_TYPE[0][target_cards]:
         if card_type not in type_dict:
             type_dict[card_type] = weight
     if 'rocket' in type_dict:
-        return gt_cards
+        return np.zeros(0, dtype=np.int64)
     type_dict['rocket'] = -1
     if 'bomb' not in type_dict:
         type_dict['bomb'] = -1
+    candidates = []
     for card_type, weight in type_dict.items():
-        candidate = TYPE_CARD[card_type]
-        for can_weight, cards_list in candidate.items():
-            if int(can_weight) > int(weight):
-                for cards in cards_list:
-                    # TODO: improve efficiency
-                    if cards not in gt_cards and contains_cards(current_hand, cards):
-                        # if self.contains_cards(current_hand, cards):
-                        gt_cards.append(cards)
+        start, stop = _TYPE_SLICES[card_type]
+        ranks = _TYPE_ACTION_RANKS[start:stop]
+        candidates.append(_TYPE_ACTION_IDS[start:stop][ranks > int(weight)])
+    action_ids = fitting_action_ids(counts, np.concatenate(candidates))
+    # Keep the first of the actions with several types
+    _, first = np.unique(action_ids, return_index=True)
+    return action_ids[np.sort(first)]
+
+def get_gt_cards(player, greater_player):
+    ''' Provide player's cards which are greater than the ones played by
+    previous player in one round
+
+    Args:
+        player (DoudizhuPlayer object): the player waiting to play cards
+        greater_player (DoudizhuPlayer object): the player who played current biggest cards.
+
+    Returns:
+        tuple: tuple of string of greater cards
+
+    Note:
+        1. return value contains 'pass'
+        2. the results are cached in the legal action cache of the thread,
+           see get_legal_action_cache
+    '''
+    counts = player.hand_counts
+    target_cards = greater_player.played_cards
+    cache = _local_objs.legal_action_cache
+    key = (int(pack_counts(counts)), ACTION_2_ID[target_cards])
+    gt_cards = cache.get(key)
+    if gt_cards is None:
+        # add 'pass' to legal actions
+        action_ids = get_gt_action_ids(counts, target_cards)
+        gt_cards = ('pass', ) + tuple([ID_2_ACTION[i] for i in action_ids.tolist()])
+        cache.put(key, gt_cards)
     return gt_cards
@@ -12,9 +12,10 @@ from .judge import GinRummyJudge
 from .utils.settings import Settings, DealerForRound
 
 from .utils.action_event import *
+from rlcard.games.base import SnapshotMixin
 
 
-class GinRummyGame:
+class GinRummyGame(SnapshotMixin):
     ''' Game class. This class will interact with outer environment.
     '''
 
@@ -47,6 +48,15 @@ class GinRummyGame:
         state = self.get_state(player_id=current_player_id)
         return state, current_player_id
 
+    def _snapshot_objects(self):
+        ''' Return the objects that hold the mutable state of the game
+
+        Returns:
+            (list): A list of objects
+        '''
+        # The moves refer to the players, so they are kept for `clone`
+        return [self, self.judge, self.round, self.round.dealer] + self.round.players + self.round.move_sheet
+
     def step(self, action: ActionEvent):
         ''' Perform game action and return next player number, and the state for next player
         '''
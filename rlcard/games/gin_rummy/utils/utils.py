@@ -99,8 +99,11 @@ def decode_cards(env_cards: np.ndarray) -> List[Card]:
     return result
 
 
-def encode_cards(cards: List[Card]) -> np.ndarray:
-    plane = np.zeros(52, dtype=int)
+def encode_cards(cards: List[Card], plane: np.ndarray = None) -> np.ndarray:
+    if plane is None:
+        plane = np.zeros(52, dtype=int)
+    else:
+        plane[:] = 0
     for card in cards:
         card_id = get_card_id(card)
         plane[card_id] = 1
@@ -2,11 +2,10 @@ from rlcard.games.base import Card
 from rlcard.games.limitholdem import Dealer
 
 class LeducholdemDealer(Dealer):
+    cards = [Card('S', 'J'), Card('H', 'J'), Card('S', 'Q'), Card('H', 'Q'), Card('S', 'K'), Card('H', 'K')]
 
     def __init__(self, np_random):
         ''' Initialize a leducholdem dealer class
         '''
         self.np_random = np_random
-        self.deck = [Card('S', 'J'), Card('H', 'J'), Card('S', 'Q'), Card('H', 'Q'), Card('S', 'K'), Card('H', 'K')]
-        self.shuffle()
-        self.pot = 0
+        self.reset()
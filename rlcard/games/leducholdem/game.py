@@ -54,14 +54,22 @@ class LeducholdemGame(Game):
                 (dict): The first state of the game
                 (int): Current player's id
         '''
-        # Initilize a dealer that can deal cards
-        self.dealer = Dealer(self.np_random)
-
-        # Initilize two players to play the game
-        self.players = [Player(i, self.np_random) for i in range(self.num_players)]
-
-        # Initialize a judger class which will decide who wins in the end
-        self.judger = Judger(self.np_random)
+        # Reuse the dealer, players and judger of the last game. They are
+        # created again after reseeding or configuring the game
+        if getattr(self, 'dealer', None) is not None and self.dealer.np_random is self.np_random \
+                and len(self.players) == self.num_players:
+            self.dealer.reset()
+            for player in self.players:
+                player.reset()
+        else:
+            # Initilize a dealer that can deal cards
+            self.dealer = Dealer(self.np_random)
+
+            # Initilize two players to play the game
+            self.players = [Player(i, self.np_random) for i in range(self.num_players)]
+
+            # Initialize a judger class which will decide who wins in the end
+            self.judger = Judger(self.np_random)
 
         # Prepare for the first round
         for i in range(self.num_players):
@@ -8,6 +8,11 @@ class LeducholdemPlayer:
         '''
         self.np_random = np_random
         self.player_id = player_id
+        self.reset()
+
+    def reset(self):
+        ''' Clear the hand and the chips for a new game
+        '''
         self.status = 'alive'
         self.hand = None
 
@@ -1,10 +1,21 @@
 from rlcard.utils.utils import init_standard_deck
 
+# The cards are never modified, so all the games share them
+STANDARD_DECK = init_standard_deck()
+
 
 class LimitHoldemDealer:
+    cards = STANDARD_DECK
+
     def __init__(self, np_random):
         self.np_random = np_random
-        self.deck = init_standard_deck()
+        self.reset()
+
+    def reset(self):
+        """
+        Shuffle the full deck and empty the pot for a new game
+        """
+        self.deck = list(self.cards)
         self.shuffle()
         self.pot = 0
 
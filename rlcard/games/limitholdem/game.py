@@ -5,9 +5,10 @@ from rlcard.games.limitholdem import Dealer
 from rlcard.games.limitholdem import Player, PlayerStatus
 from rlcard.games.limitholdem import Judger
 from rlcard.games.limitholdem import Round
+from rlcard.games.base import SnapshotMixin
 
 
-class LimitHoldemGame:
+class LimitHoldemGame(SnapshotMixin):
     def __init__(self, allow_step_back=False, num_players=2):
         """Initialize the class limit holdem game"""
         self.allow_step_back = allow_step_back
@@ -57,14 +58,22 @@ class LimitHoldemGame:
                 (dict): The first state of the game
                 (int): Current player's id
         """
-        # Initialize a dealer that can deal cards
-        self.dealer = Dealer(self.np_random)
-
-        # Initialize two players to play the game
-        self.players = [Player(i, self.np_random) for i in range(self.num_players)]
-
-        # Initialize a judger class which will decide who wins in the end
-        self.judger = Judger(self.np_random)
+        # Reuse the dealer, players and judger of the last game. They are
+        # created again after reseeding or configuring the game
+        if getattr(self, 'dealer', None) is not None and self.dealer.np_random is self.np_random \
+                and len(self.players) == self.num_players:
+            self.dealer.reset()
+            for player in self.players:
+                player.reset()
+        else:
+            # Initialize a dealer that can deal cards
+            self.dealer = Dealer(self.np_random)
+
+            # Initialize two players to play the game
+            self.players = [Player(i, self.np_random) for i in range(self.num_players)]
+
+            # Initialize a judger class which will decide who wins in the end
+            self.judger = Judger(self.np_random)
 
         # Deal cards to each  player to prepare for the first round
         for i in range(2 * self.num_players):
@@ -110,6 +119,14 @@ class LimitHoldemGame:
 
         return state, self.game_pointer
 
+    def _snapshot_objects(self):
+        ''' Return the objects that hold the mutable state of the game
+
+        Returns:
+            (list): A list of objects
+        '''
+        return [self, self.dealer, self.judger, self.round] + self.players
+
     def step(self, action_pack):
         """
         Get the next state
@@ -18,6 +18,12 @@ class LimitHoldemPlayer:
         """
         self.np_random = np_random
         self.player_id = player_id
+        self.reset()
+
+    def reset(self):
+        """
+        Clear the hand and the chips for a new game
+        """
         self.hand = []
         self.status = PlayerStatus.ALIVE
 
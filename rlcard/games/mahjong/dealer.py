@@ -1,12 +1,15 @@
 from rlcard.games.mahjong.utils import init_deck
 
+# The cards are never modified, so all the games share them
+DECK = init_deck()
+
 
 class MahjongDealer:
     ''' Initialize a mahjong dealer class
     '''
     def __init__(self, np_random):
         self.np_random = np_random
-        self.deck = init_deck()
+        self.deck = list(DECK)
         self.shuffle()
         self.table = []
 
@@ -5,8 +5,9 @@ from rlcard.games.mahjong import Dealer
 from rlcard.games.mahjong import Player
 from rlcard.games.mahjong import Round
 from rlcard.games.mahjong import Judger
+from rlcard.games.base import SnapshotMixin
 
-class MahjongGame:
+class MahjongGame(SnapshotMixin):
 
     def __init__(self, allow_step_back=False):
         '''Initialize the class MajongGame
@@ -47,6 +48,14 @@ class MahjongGame:
         self.cur_state = state
         return state, self.round.current_player
 
+    def _snapshot_objects(self):
+        ''' Return the objects that hold the mutable state of the game
+
+        Returns:
+            (list): A list of objects
+        '''
+        return [self, self.dealer, self.judger, self.round] + self.players
+
     def step(self, action):
         ''' Get the next state
 
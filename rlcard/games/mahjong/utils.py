@@ -65,8 +65,11 @@ def cards2list(cards):
     return cards_list
 
 
-def encode_cards(cards):
-    plane = np.zeros((34,4), dtype=int)
+def encode_cards(cards, plane=None):
+    if plane is None:
+        plane = np.zeros((34,4), dtype=int)
+    else:
+        plane[:] = 0
     cards = cards2list(cards)
     for card in list(set(cards)):
         index = card_encoding_dict[card]
@@ -62,14 +62,23 @@ class NolimitholdemGame(Game):
         if self.dealer_id is None:
             self.dealer_id = self.np_random.randint(0, self.num_players)
 
-        # Initialize a dealer that can deal cards
-        self.dealer = Dealer(self.np_random)
-
-        # Initialize players to play the game
-        self.players = [Player(i, self.init_chips[i], self.np_random) for i in range(self.num_players)]
-
-        # Initialize a judger class which will decide who wins in the end
-        self.judger = Judger(self.np_random)
+        # Reuse the dealer, players and judger of the last game. They are
+        # created again after reseeding or configuring the game
+        if getattr(self, 'dealer', None) is not None and self.dealer.np_random is self.np_random \
+                and len(self.players) == self.num_players:
+            self.dealer.reset()
+            for player, init_chips in zip(self.players, self.init_chips):
+                player.init_chips = init_chips
+                player.reset()
+        else:
+            # Initialize a dealer that can deal cards
+            self.dealer = Dealer(self.np_random)
+
+            # Initialize players to play the game
+            self.players = [Player(i, self.init_chips[i], self.np_random) for i in range(self.num_players)]
+
+            # Initialize a judger class which will decide who wins in the end
+            self.judger = Judger(self.np_random)
 
         # Deal cards to each  player to prepare for the first round
         for i in range(2 * self.num_players):
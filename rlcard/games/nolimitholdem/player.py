@@ -10,8 +10,15 @@ class NolimitholdemPlayer(Player):
             player_id (int): The id of the player
             init_chips (int): The number of chips the player has initially
         """
+        self.init_chips = init_chips
         super().__init__(player_id, np_random)
-        self.remained_chips = init_chips
+
+    def reset(self):
+        """
+        Clear the hand and restore the initial chips for a new game
+        """
+        super().reset()
+        self.remained_chips = self.init_chips
 
     def bet(self, chips):
         quantity = chips if chips <= self.remained_chips else self.remained_chips
@@ -4,9 +4,10 @@ import numpy as np
 from rlcard.games.uno import Dealer
 from rlcard.games.uno import Player
 from rlcard.games.uno import Round
+from rlcard.games.base import SnapshotMixin
 
 
-class UnoGame:
+class UnoGame(SnapshotMixin):
 
     def __init__(self, allow_step_back=False, num_players=2):
         self.allow_step_back = allow_step_back
@@ -33,6 +34,8 @@ class UnoGame:
 
         # Initialize a dealer that can deal cards
         self.dealer = Dealer(self.np_random)
+        # The wild cards take a colour when played, so they are snapshotted
+        self.wild_cards = [card for card in self.dealer.deck if card.type == 'wild']
 
         # Initialize four players to play the game
         self.players = [Player(i, self.np_random) for i in range(self.num_players)]
@@ -55,6 +58,14 @@ class UnoGame:
         state = self.get_state(player_id)
         return state, player_id
 
+    def _snapshot_objects(self):
+        ''' Return the objects that hold the mutable state of the game
+
+        Returns:
+            (list): A list of objects
+        '''
+        return [self, self.dealer, self.round] + self.players + self.wild_cards
+
     def step(self, action):
         ''' Get the next state
 
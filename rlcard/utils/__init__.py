@@ -1,4 +1,8 @@
 from rlcard.utils.logger import Logger
 from rlcard.utils import seeding
 from rlcard.utils.utils import *
+from rlcard.utils.lazy_state import LazyState
 from rlcard.utils.pettingzoo_utils import *
+from rlcard.utils.game_log import GameLogWriter, GameLogReader
+from rlcard.utils.batch_scheduler import BatchScheduler
+from rlcard.utils.obs_encoding import encode_obs, decode_obs, decode_obs_batch
@@ -0,0 +1,94 @@
+''' Batch the decisions of many concurrent games
+'''
+
+
+class BatchScheduler(object):
+    ''' Keeps several games in flight and batches the pending decisions by
+    agent. In every tick, each agent is called once with the states of all
+    the games that wait on it, e.g., one forward pass of a DMC or DQN agent
+    for hundreds of decisions, and the actions are scattered back to the
+    games.
+
+    Agents with `eval_step_batch(states)` and `step_batch(states)`, which
+    return a list of action ids, are called in batch. Other agents are
+    called with `eval_step` / `step` once per state.
+    '''
+
+    def __init__(self, envs, agents):
+        ''' Initialize the scheduler
+
+        Args:
+            envs (list): The environments, all of the same game
+            agents (list): The agent of each player, shared by all the
+                environments. An agent can play several seats
+        '''
+        if len(agents) != envs[0].num_players:
+            raise ValueError('Expected {} agents, got {}'.format(envs[0].num_players, len(agents)))
+        self.envs = envs
+        self.agents = agents
+
+    def run(self, num_games, is_training=False):
+        ''' Play complete games until num_games are finished
+
+        Args:
+            num_games (int): The number of games
+            is_training (boolean): True if for training purpose
+
+        Returns:
+            (list): A (trajectories, payoffs) pair for every game in the order
+                they finish, in the format of `Env.run`
+        '''
+        results = []
+        active = {}
+        num_started = 0
+        for i, env in enumerate(self.envs[:num_games]):
+            active[i] = self._start(env)
+            num_started += 1
+
+        while active:
+            # Group the pending decisions by agent
+            groups = {}
+            for i, (trajectories, state, player_id) in active.items():
+                agent = self.agents[player_id]
+                groups.setdefault(id(agent), (agent, []))[1].append(i)
+
+            for agent, indices in groups.values():
+                states = [active[i][1] for i in indices]
+                actions = self._act(agent, states, is_training)
+                for i, action in zip(indices, actions):
+                    env = self.envs[i]
+                    trajectories, _, acting_id = active[i]
+                    state, player_id = env.step(action, agent.use_raw)
+                    trajectories[acting_id].append(action)
+                    if not env.is_over():
+                        trajectories[player_id].append(state)
+                        active[i] = (trajectories, state, player_id)
+                        continue
+
+                    # Add a final state to all the players
+                    for p in range(env.num_players):
+                        trajectories[p].append(env.get_state(p))
+                    results.append((trajectories, env.get_payoffs()))
+                    if num_started < num_games:
+                        active[i] = self._start(env)
+                        num_started += 1
+                    else:
+                        del active[i]
+        return results
+
+    @staticmethod
+    def _start(env):
+        state, player_id = env.reset()
+        trajectories = [[] for _ in range(env.num_players)]
+        trajectories[player_id].append(state)
+        return trajectories, state, player_id
+
+    @staticmethod
+    def _act(agent, states, is_training):
+        if is_training:
+            if hasattr(agent, 'step_batch'):
+                return agent.step_batch(states)
+            return [agent.step(state) for state in states]
+        if hasattr(agent, 'eval_step_batch'):
+            return agent.eval_step_batch(states)
+        return [agent.eval_step(state)[0] for state in states]
@@ -0,0 +1,115 @@
+''' Sampling of hidden hands consistent with public information
+
+Searching or evaluating a position of an imperfect information game needs
+many deals of the hidden cards (determinizations). The hidden cards are given
+as integers, e.g., card ids or ranks, together with the number of cards of
+every hidden hand and the hands that may hold each card (a player who did
+not follow suit holds no card of that suit). `sample_deals` draws many deals
+at once as an array of owners, one row per deal.
+
+The deals are uniform over all the consistent deals. The cards that the same
+hands may hold are interchangeable, so they form a group. The numbers of
+cards of every group in every hand are drawn first, weighted by the number
+of deals with these numbers, and then the cards of each group are dealt by a
+random permutation per deal. There are few groups, e.g., one with two hidden
+hands and no voids, so the numbers are simply enumerated.
+'''
+from math import factorial
+
+import numpy as np
+
+def sample_deals(num_samples, sizes, allowed=None, num_cards=None, np_random=None):
+    ''' Deal hidden cards to hidden hands
+
+    Args:
+        num_samples (int): The number of deals
+        sizes (list): The number of cards of every hidden hand, which sum up
+            to the number of hidden cards
+        allowed (numpy.array): A boolean array of shape (len(sizes),
+            num_cards), whether a hand may hold a card. None if any hand may
+            hold any card
+        num_cards (int): The number of hidden cards, only needed if allowed
+            is None
+        np_random (numpy.random.RandomState): The random number generator
+
+    Returns:
+        (numpy.array): The index in sizes of the hand of every card in every
+            deal, of shape (num_samples, num_cards) and dtype int8
+
+    Raises:
+        ValueError: If no deal is consistent
+    '''
+    if np_random is None:
+        np_random = np.random
+    sizes = [int(size) for size in sizes]
+    if allowed is None:
+        allowed = np.ones((len(sizes), num_cards), dtype=bool)
+    allowed = np.asarray(allowed, dtype=bool)
+    num_cards = allowed.shape[1]
+    if sum(sizes) != num_cards:
+        raise ValueError('{} hidden cards can not be dealt into hands of {}'.format(num_cards, sizes))
+
+    patterns, groups = np.unique(allowed.T, axis=0, return_inverse=True)
+    groups = groups.ravel()
+    group_cards = [np.flatnonzero(groups == group) for group in range(len(patterns))]
+    tables, weights = _enumerate_tables([len(cards) for cards in group_cards],
+                                        [np.flatnonzero(pattern).tolist() for pattern in patterns], sizes)
+    if not tables:
+        raise ValueError('No deal of the hidden cards is consistent')
+    weights = np.array(weights, dtype=np.float64)
+    tables = np.array(tables, dtype=np.int64)[np_random.choice(len(tables), size=num_samples, p=weights / weights.sum())]
+
+    owners = np.empty((num_samples, num_cards), dtype=np.int8)
+    for group, cards in enumerate(group_cards):
+        # The hand of every position of a random permutation of the cards
+        bounds = np.cumsum(tables[:, group], axis=1)
+        slots = (np.arange(len(cards))[np.newaxis, :, np.newaxis] >= bounds[:, np.newaxis, :]).sum(axis=2)
+        order = np.argsort(np_random.random_sample((num_samples, len(cards))), axis=1)
+        dealt = np.empty((num_samples, len(cards)), dtype=np.int8)
+        np.put_along_axis(dealt, order, slots.astype(np.int8), axis=1)
+        owners[:, cards] = dealt
+    return owners
+
+def _enumerate_tables(group_sizes, group_hands, sizes):
+    ''' Enumerate the numbers of cards of every group in every hand
+
+    Args:
+        group_sizes (list): The number of cards of every group
+        group_hands (list): The hands that may hold the cards of every group
+        sizes (list): The number of cards of every hand
+
+    Returns:
+        tables (list): The numbers, one list of shape (groups, hands) each
+        weights (list): The number of deals of each table
+    '''
+    tables, weights = [], []
+
+    def deal(group, remaining, table, weight):
+        if group == len(group_sizes):
+            if not any(remaining):
+                tables.append(table)
+                weights.append(weight)
+            return
+        for counts in _split(group_sizes[group], group_hands[group], remaining):
+            row = [0] * len(sizes)
+            ways = factorial(group_sizes[group])
+            for hand, count in zip(group_hands[group], counts):
+                row[hand] = count
+                ways //= factorial(count)
+            deal(group + 1, [left - count for left, count in zip(remaining, row)], table + [row], weight * ways)
+
+    deal(0, list(sizes), [], 1)
+    return tables, weights
+
+def _split(num_cards, hands, remaining):
+    ''' Split cards among hands without exceeding the remaining sizes
+    '''
+    if not hands:
+        return
+    if len(hands) == 1:
+        if num_cards <= remaining[hands[0]]:
+            yield (num_cards, )
+        return
+    for count in range(min(num_cards, remaining[hands[0]]) + 1):
+        for counts in _split(num_cards - count, hands[1:], remaining):
+            yield (count, ) + counts
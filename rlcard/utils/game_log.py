@@ -0,0 +1,235 @@
+''' Compact logs of finished games
+
+A game is fully determined by the environment, its config, the seed of the
+game random number generator and the sequence of action ids. A game log
+stores only these, together with the payoffs for auditing, in an
+append-only binary file. Any state of a logged game is reconstructed by
+seeding a new environment and stepping the actions again.
+
+File layout (little-endian): the magic bytes b'RLCL' and a version byte,
+followed by records. Every record starts with its length in bytes (u32)
+and contains
+
+    env id          u16 length + utf-8
+    config          u32 length + utf-8 JSON
+    seed            u64
+    payoffs         u8 number of players + float64 each
+    actions         u8 bytes per action id + u32 count + action ids
+'''
+import json
+import mmap
+import struct
+from collections import namedtuple
+
+import numpy as np
+
+MAGIC = b'RLCL'
+VERSION = 1
+_ACTION_DTYPES = {1: np.uint8, 2: np.uint16, 4: np.uint32}
+
+GameRecord = namedtuple('GameRecord', ['env_id', 'config', 'seed', 'actions', 'payoffs'])
+
+def encode_record(record):
+    ''' Encode a game record into bytes, without the length prefix
+
+    Args:
+        record (GameRecord): The game record
+
+    Returns:
+        (bytes): The encoded record
+    '''
+    env_id = record.env_id.encode('utf8')
+    config = json.dumps(record.config, sort_keys=True).encode('utf8')
+    payoffs = np.asarray(record.payoffs, dtype='<f8')
+    actions = np.asarray(record.actions, dtype=np.int64)
+    if len(actions) and actions.min() < 0:
+        raise ValueError('Action ids must be non-negative')
+    max_action = actions.max() if len(actions) else 0
+    itemsize = 1 if max_action < 2**8 else 2 if max_action < 2**16 else 4
+    return b''.join([
+        struct.pack('<H', len(env_id)), env_id,
+        struct.pack('<I', len(config)), config,
+        struct.pack('<QB', record.seed, len(payoffs)), payoffs.tobytes(),
+        struct.pack('<BI', itemsize, len(actions)),
+        actions.astype(np.dtype(_ACTION_DTYPES[itemsize]).newbyteorder('<')).tobytes(),
+    ])
+
+def decode_record(data):
+    ''' Decode the bytes of a game record
+
+    Args:
+        data (bytes): The encoded record, without the length prefix
+
+    Returns:
+        (GameRecord): The game record
+    '''
+    offset = 0
+    length, = struct.unpack_from('<H', data, offset)
+    offset += 2
+    env_id = bytes(data[offset:offset+length]).decode('utf8')
+    offset += length
+    length, = struct.unpack_from('<I', data, offset)
+    offset += 4
+    config = json.loads(bytes(data[offset:offset+length]).decode('utf8'))
+    offset += length
+    seed, num_players = struct.unpack_from('<QB', data, offset)
+    offset += 9
+    payoffs = np.frombuffer(data, dtype='<f8', count=num_players, offset=offset).copy()
+    offset += 8 * num_players
+    itemsize, num_actions = struct.unpack_from('<BI', data, offset)
+    offset += 5
+    dtype = np.dtype(_ACTION_DTYPES[itemsize]).newbyteorder('<')
+    actions = np.frombuffer(data, dtype=dtype, count=num_actions, offset=offset).astype(np.int64)
+    return GameRecord(env_id, config, seed, actions, payoffs)
+
+
+class GameLogWriter(object):
+    ''' Append finished games to a game log
+    '''
+
+    def __init__(self, path):
+        ''' Open the log for appending. A new file gets the header
+
+        Args:
+            path (str): The path of the log file
+        '''
+        self.path = path
+        self.file = open(path, 'ab')
+        if self.file.tell() == 0:
+            self.file.write(MAGIC + bytes([VERSION]))
+            self.file.flush()
+
+    def write(self, record):
+        ''' Append a game record
+
+        Args:
+            record (GameRecord): The game record
+        '''
+        data = encode_record(record)
+        self.file.write(struct.pack('<I', len(data)) + data)
+        self.file.flush()
+
+    def record(self, env, seed):
+        ''' Append the finished game of an environment. The game must have
+            been started with `env.seed(seed)` followed by `env.reset()`
+
+        Args:
+            env (Env): The environment with a finished game
+            seed (int): The seed of the game
+        '''
+        if not env.is_over():
+            raise ValueError('The game is not over')
+        if None in env.action_id_recorder:
+            raise ValueError('Games with raw actions can not be logged')
+        self.write(GameRecord(env.name, env.config, seed, env.action_id_recorder, env.get_payoffs()))
+
+    def run(self, env, seed=None, is_training=False):
+        ''' Seed the environment, run a game with `env.run` and log it
+
+        Args:
+            env (Env): The environment with the agents set
+            seed (int): The seed of the game, random if None
+            is_training (boolean): True if for training purpose
+
+        Returns:
+            (tuple): The trajectories and payoffs returned by `env.run`
+        '''
+        seed = env.seed(seed)
+        trajectories, payoffs = env.run(is_training=is_training)
+        self.record(env, seed)
+        return trajectories, payoffs
+
+    def close(self):
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+class GameLogReader(object):
+    ''' Random access to the records of a game log. The file is memory
+    mapped, so a record is only read from disk when it is accessed
+    '''
+
+    def __init__(self, path):
+        ''' Map the log and index its records
+
+        Args:
+            path (str): The path of the log file
+        '''
+        self.path = path
+        with open(path, 'rb') as f:
+            if len(f.read(len(MAGIC) + 1)) < len(MAGIC) + 1:
+                raise ValueError('Not a game log of version {}: {}'.format(VERSION, path))
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self.data = memoryview(self._mmap)
+        if bytes(self.data[:len(MAGIC)]) != MAGIC or self.data[len(MAGIC)] != VERSION:
+            self.close()
+            raise ValueError('Not a game log of version {}: {}'.format(VERSION, path))
+        self.offsets = []
+        offset = len(MAGIC) + 1
+        while offset + 4 <= len(self.data):
+            length, = struct.unpack_from('<I', self.data, offset)
+            if offset + 4 + length > len(self.data):
+                # A partially written last record
+                break
+            self.offsets.append((offset + 4, length))
+            offset += 4 + length
+
+    def __len__(self):
+        return len(self.offsets)
+
+    def __getitem__(self, index):
+        offset, length = self.offsets[index]
+        return decode_record(self.data[offset:offset+length])
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+
+    def close(self):
+        if self._mmap.closed:
+            return
+        self.data.release()
+        self._mmap.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+def replay(record, num_steps=None):
+    ''' Reconstruct a state of a logged game by stepping the engine again
+
+    Args:
+        record (GameRecord): The game record
+        num_steps (int): The number of actions to replay, all if None
+
+    Returns:
+        (Env): The environment after the actions
+    '''
+    from rlcard.envs import make
+
+    env = make(record.env_id, config=record.config)
+    env.seed(record.seed)
+    env.reset()
+    for action in record.actions[:num_steps].tolist():
+        env.step(action)
+    return env
+
+def verify(record):
+    ''' Check that replaying a logged game gives the logged payoffs
+
+    Args:
+        record (GameRecord): The game record
+
+    Returns:
+        (boolean): True if the replay ends with the same payoffs
+    '''
+    env = replay(record)
+    return env.is_over() and np.array_equal(np.asarray(env.get_payoffs(), dtype=np.float64), record.payoffs)
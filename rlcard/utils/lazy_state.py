@@ -0,0 +1,91 @@
+class LazyState(dict):
+    ''' A state dictionary whose fields can be computed on first access.
+
+    Fields registered with `set_lazy` are not stored until they are read,
+    so the raw fields that only human agents and rule models use cost
+    nothing for RL agents. The object behaves like a plain dict: lookups,
+    `in`, `get`, iteration, copying and pickling all see the lazy fields,
+    and iterating over the whole dictionary computes all of them.
+    '''
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._lazy = {}
+
+    def set_lazy(self, key, func):
+        ''' Register a field that is computed by calling `func()` when read
+
+        Args:
+            key (str): The name of the field
+            func (callable): A function without arguments returning the value
+        '''
+        super().pop(key, None)
+        self._lazy[key] = func
+
+    def materialize(self):
+        ''' Compute all the pending lazy fields
+
+        Returns:
+            (LazyState): The state itself
+        '''
+        for key in list(self._lazy):
+            self[key]
+        return self
+
+    def __missing__(self, key):
+        if key not in self._lazy:
+            raise KeyError(key)
+        value = self._lazy.pop(key)()
+        super().__setitem__(key, value)
+        return value
+
+    def __setitem__(self, key, value):
+        self._lazy.pop(key, None)
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key):
+        if self._lazy.pop(key, None) is None:
+            super().__delitem__(key)
+
+    def __contains__(self, key):
+        return super().__contains__(key) or key in self._lazy
+
+    def get(self, key, default=None):
+        if key in self:
+            return self[key]
+        return default
+
+    def pop(self, key, *args):
+        if key in self._lazy:
+            self[key]
+        return super().pop(key, *args)
+
+    def __iter__(self):
+        return super(LazyState, self.materialize()).__iter__()
+
+    def __len__(self):
+        return super().__len__() + len(self._lazy)
+
+    def __eq__(self, other):
+        return super(LazyState, self.materialize()).__eq__(other)
+
+    def __ne__(self, other):
+        return not self == other
+
+    def keys(self):
+        return super(LazyState, self.materialize()).keys()
+
+    def values(self):
+        return super(LazyState, self.materialize()).values()
+
+    def items(self):
+        return super(LazyState, self.materialize()).items()
+
+    def copy(self):
+        return LazyState(self.items())
+
+    def __repr__(self):
+        return super(LazyState, self.materialize()).__repr__()
+
+    def __reduce_ex__(self, protocol):
+        return (LazyState, (dict(self.items()), ))
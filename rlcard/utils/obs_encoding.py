@@ -0,0 +1,80 @@
+''' Compact encodings of 0/1 observations for replay buffers and trajectories
+
+Most observations are planes of zeros and ones. Instead of the dense array, a
+buffer can store
+
+    'packed'    the flattened observation as bits (np.packbits), 1 byte for
+                8 features, always of the same length
+    'sparse'    the indices of the ones (int16, or int32 for more than 32768
+                features), whose length varies
+
+and decode a whole batch at once when it is assembled for training.
+'''
+import numpy as np
+
+OBS_ENCODINGS = ('dense', 'packed', 'sparse')
+
+def encode_obs(obs, encoding):
+    ''' Encode a 0/1 observation
+
+    Args:
+        obs (numpy.array): The observation
+        encoding (str): 'dense', 'packed' or 'sparse'
+
+    Returns:
+        (numpy.array): The encoded observation. 'dense' returns obs unchanged
+    '''
+    if encoding == 'dense':
+        return obs
+    obs = np.asarray(obs).ravel()
+    if encoding == 'packed':
+        return np.packbits(obs != 0)
+    if encoding == 'sparse':
+        return np.flatnonzero(obs).astype(_index_dtype(obs.size))
+    raise ValueError('Unknown observation encoding: {}'.format(encoding))
+
+def decode_obs(encoded, shape, encoding, dtype=np.int8):
+    ''' Decode an observation encoded by `encode_obs`
+
+    Args:
+        encoded (numpy.array): The encoded observation
+        shape (tuple): The shape of the observation
+        encoding (str): 'dense', 'packed' or 'sparse'
+        dtype (numpy.dtype): The dtype of the decoded observation
+
+    Returns:
+        (numpy.array): The observation
+    '''
+    return decode_obs_batch([encoded], shape, encoding, dtype)[0]
+
+def decode_obs_batch(batch, shape, encoding, dtype=np.int8):
+    ''' Decode a batch of observations encoded by `encode_obs` at once
+
+    Args:
+        batch (list or numpy.array): The encoded observations. Packed
+            observations can also be given as a 2-D array
+        shape (tuple): The shape of one observation
+        encoding (str): 'dense', 'packed' or 'sparse'
+        dtype (numpy.dtype): The dtype of the decoded observations
+
+    Returns:
+        (numpy.array): The observations, of shape (len(batch), *shape)
+    '''
+    shape = tuple(shape)
+    size = int(np.prod(shape))
+    if encoding == 'dense':
+        return np.asarray(batch, dtype=dtype).reshape((len(batch), ) + shape)
+    if encoding == 'packed':
+        packed = np.asarray(batch, dtype=np.uint8).reshape(len(batch), (size + 7) // 8)
+        obs = np.unpackbits(packed, axis=1, count=size).astype(dtype, copy=False)
+        return obs.reshape((len(batch), ) + shape)
+    if encoding == 'sparse':
+        obs = np.zeros((len(batch), size), dtype=dtype)
+        if len(batch):
+            rows = np.repeat(np.arange(len(batch)), [len(indices) for indices in batch])
+            obs[rows, np.concatenate(batch)] = 1
+        return obs.reshape((len(batch), ) + shape)
+    raise ValueError('Unknown observation encoding: {}'.format(encoding))
+
+def _index_dtype(size):
+    return np.int16 if size <= 2**15 else np.int32
@@ -30,16 +30,86 @@ def colorize(string, color, bold=False, highlight = False):
 def error(msg, *args):
     print(colorize('%s: %s'%('ERROR', msg % args), 'red'))
 
-def np_random(seed=None):
+def np_random(seed=None, backend='random_state'):
+    """Create a seeded random number generator.
+
+    Args:
+        seed (Optional[int]): None seeds from an operating system specific randomness source.
+        backend (str): 'random_state' for a legacy np.random.RandomState seeded
+            with the hashed seed, 'generator' for a np.random.Generator (PCG64)
+            seeded through np.random.SeedSequence
+
+    Returns:
+        (tuple): The generator and the seed
+    """
     if seed is not None and not (isinstance(seed, int) and 0 <= seed):
         raise error.Error('Seed must be a non-negative integer or omitted, not {}'.format(seed))
 
     seed = create_seed(seed)
 
-    rng = np.random.RandomState()
-    rng.seed(_int_list_from_bigint(hash_seed(seed)))
+    if backend == 'random_state':
+        rng = np.random.RandomState()
+        rng.seed(_int_list_from_bigint(hash_seed(seed)))
+    elif backend == 'generator':
+        rng = GeneratorRandomState(np.random.Generator(np.random.PCG64(seed)))
+    else:
+        raise ValueError('Unknown random number generator backend: {}'.format(backend))
     return rng, seed
 
+def spawn_seeds(seed, num):
+    """Derive independent seeds, e.g., for the environments of different
+    workers and devices, with np.random.SeedSequence.spawn. The seeds are
+    plain integers so they can be passed to `Env.seed` and logged, and a
+    derived seed can be spawned again.
+
+    Args:
+        seed (Optional[int]): The root seed. None uses fresh entropy.
+        num (int): The number of seeds
+
+    Returns:
+        (list): A list of `num` 64-bit integer seeds
+    """
+    children = np.random.SeedSequence(seed).spawn(num)
+    return [int(child.generate_state(1, np.uint64)[0]) for child in children]
+
+class GeneratorRandomState(object):
+    """Wrap a np.random.Generator with the np.random.RandomState methods
+    used by the games, so that both backends can be used as `np_random`.
+    Other attributes are looked up on the generator.
+    """
+
+    def __init__(self, generator):
+        self.generator = generator
+
+    def shuffle(self, x):
+        self.generator.shuffle(x)
+
+    def permutation(self, x):
+        return self.generator.permutation(x)
+
+    def randint(self, low, high=None, size=None, dtype=int):
+        if high is None:
+            low, high = 0, low
+        return self.generator.integers(low, high, size=size, dtype=dtype)
+
+    def choice(self, a, size=None, replace=True, p=None):
+        return self.generator.choice(a, size=size, replace=replace, p=p)
+
+    def random_sample(self, size=None):
+        return self.generator.random(size)
+
+    def get_state(self, legacy=False):
+        return self.generator.bit_generator.state
+
+    def set_state(self, state):
+        self.generator.bit_generator.state = state
+
+    def __getattr__(self, name):
+        # Not called for `generator` itself unless it is missing, e.g., while unpickling
+        if name == 'generator':
+            raise AttributeError(name)
+        return getattr(self.generator, name)
+
 def hash_seed(seed=None, max_bytes=8):
     """Any given evaluation is likely to have many PRNG's active at
     once. (Most commonly, because the environment is running in
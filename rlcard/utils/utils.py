@@ -1,15 +1,22 @@
+import importlib.util
+from functools import lru_cache
+
 import numpy as np
 
 from rlcard.games.base import Card
 
+@lru_cache(maxsize=None)
+def is_torch_available():
+    ''' Check whether torch can be imported, without importing it
+
+    Returns:
+        (boolean): True if torch is installed
+    '''
+    return importlib.util.find_spec('torch') is not None
+
 def set_seed(seed):
     if seed is not None:
-        import subprocess
-        import sys
-
-        reqs = subprocess.check_output([sys.executable, '-m', 'pip', 'freeze'])
-        installed_packages = [r.decode().split('==')[0] for r in reqs.split()]
-        if 'torch' in installed_packages:
+        if is_torch_available():
             import torch
             torch.backends.cudnn.deterministic = True
             torch.manual_seed(seed)
@@ -184,19 +191,43 @@ def remove_illegal(action_probs, legal_actions):
 
     Args:
         action_probs (numpy.array): A 1 dimention numpy array.
-        legal_actions (list): A list of indices of legal actions.
+        legal_actions (list or numpy.array): A list of indices of legal actions,
+            or a legal mask from the state, i.e., a boolean array or an array
+            of legal action ids.
 
     Returns:
         probd (numpy.array): A normalized vector without legal actions.
     '''
     probs = np.zeros(action_probs.shape[0])
     probs[legal_actions] = action_probs[legal_actions]
-    if np.sum(probs) == 0:
-        probs[legal_actions] = 1 / len(legal_actions)
+    total = np.sum(probs)
+    if total == 0:
+        if isinstance(legal_actions, np.ndarray) and legal_actions.dtype == bool:
+            num_legal_actions = np.count_nonzero(legal_actions)
+        else:
+            num_legal_actions = len(legal_actions)
+        probs[legal_actions] = 1 / num_legal_actions
     else:
-        probs /= sum(probs)
+        probs /= total
     return probs
 
+def legal_action_ids(state):
+    ''' Get the ids of the legal actions of a state. The legal mask of the
+        state is used if the environment provides it
+
+    Args:
+        state (dict): A state returned by the environment
+
+    Returns:
+        (list or numpy.array): The legal action ids
+    '''
+    legal_mask = state.get('legal_mask')
+    if legal_mask is None:
+        return list(state['legal_actions'].keys())
+    if legal_mask.dtype == bool:
+        return np.flatnonzero(legal_mask)
+    return legal_mask
+
 def tournament(env, num):
     ''' Evaluate he performance of the agents in the environment
 
@@ -38,7 +38,7 @@ setuptools.setup(
                    'games/uno/jsondata/*',
                    ]},
     install_requires=[
-        'numpy>=1.16.3',
+        'numpy>=1.17.0',
         'termcolor'
     ],
     extras_require=extras,
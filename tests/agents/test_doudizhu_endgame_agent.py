@@ -0,0 +1,61 @@
+import unittest
+import numpy as np
+
+import rlcard
+from rlcard.agents import DoudizhuEndgameAgent
+
+
+class RandomLegalAgent(object):
+    ''' Plays a random legal action with its own generator
+    '''
+    use_raw = False
+
+    def __init__(self, seed):
+        self.np_random = np.random.RandomState(seed)
+
+    def step(self, state):
+        action_ids = list(state['legal_actions'].keys())
+        return action_ids[self.np_random.randint(len(action_ids))]
+
+    def eval_step(self, state):
+        return self.step(state), {}
+
+
+class TestDoudizhuEndgameAgent(unittest.TestCase):
+
+    def test_eval_step(self):
+        env = rlcard.make('doudizhu', config={'seed': 0})
+        agent = DoudizhuEndgameAgent(RandomLegalAgent(0), env, card_threshold=16, max_nodes=20000)
+        num_solved = 0
+        for _ in range(10):
+            state, player_id = env.reset()
+            while not env.is_over():
+                action, info = agent.eval_step(state)
+                self.assertIn(action, state['legal_actions'])
+                if info['endgame'] is not None:
+                    self.assertLessEqual(sum(state['raw_obs']['num_cards_left']), 16)
+                    num_solved += info['endgame'].solved
+                state, player_id = env.step(action)
+        self.assertGreater(num_solved, 0)
+
+    def test_wins_solved_positions(self):
+        env = rlcard.make('doudizhu', config={'seed': 1})
+        agent = DoudizhuEndgameAgent(RandomLegalAgent(0), env, card_threshold=16, max_nodes=20000)
+        env.set_agents([agent, RandomLegalAgent(1), RandomLegalAgent(2)])
+        for _ in range(10):
+            state, player_id = env.reset()
+            winning = False
+            while not env.is_over():
+                if player_id == 0:
+                    action, info = agent.eval_step(state)
+                    result = info['endgame']
+                    winning = winning or (result is not None and result.value == 1)
+                else:
+                    action, _ = env.agents[player_id].eval_step(state)
+                state, player_id = env.step(action)
+            # Once the landlord has a won position, it stays won
+            if winning:
+                self.assertEqual(env.get_payoffs()[0], 1)
+
+if __name__ == '__main__':
+    unittest.main()
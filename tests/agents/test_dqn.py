@@ -51,3 +51,45 @@ class TestDQN(unittest.TestCase):
         predicted_action = agent.step({'obs': np.random.random_sample((2,)), 'legal_actions': {0: None, 1: None}})
         self.assertGreaterEqual(predicted_action, 0)
         self.assertLessEqual(predicted_action, 1)
+
+        legal_mask = np.array([False, True])
+        for _ in range(10):
+            predicted_action = agent.step({'obs': np.random.random_sample((2,)), 'legal_actions': {1: None}, 'legal_mask': legal_mask})
+            self.assertEqual(predicted_action, 1)
+
+    def test_train_encoded_obs(self):
+        agent = DQNAgent(replay_memory_size=200,
+                         replay_memory_init_size=50,
+                         update_target_estimator_every=100,
+                         batch_size=16,
+                         state_shape=[2, 4],
+                         mlp_layers=[10,10],
+                         device=torch.device('cpu'),
+                         obs_encoding='packed')
+        for _ in range(100):
+            obs, next_obs = np.random.randint(2, size=(2, 2, 4))
+            ts = [{'obs': obs, 'encoded_obs': np.packbits(obs), 'legal_actions': {0: None, 1: None}}, np.random.randint(2), 0,
+                  {'obs': next_obs, 'encoded_obs': np.packbits(next_obs), 'legal_actions': {0: None, 1: None}}, True]
+            agent.feed(ts)
+        self.assertEqual(agent.memory.memory[0].state.dtype, np.uint8)
+        state_batch, _, _, next_state_batch, _, _ = agent.memory.sample()
+        self.assertEqual(state_batch.shape, (16, 2, 4))
+        self.assertEqual(next_state_batch.dtype, np.float32)
+
+    def test_batch(self):
+        agent = DQNAgent(num_actions=3,
+                         state_shape=[2],
+                         mlp_layers=[10,10],
+                         epsilon_start=0,
+                         epsilon_end=0,
+                         device=torch.device('cpu'))
+        states = [{'obs': np.random.random_sample((2,)), 'legal_actions': {0: None, 2: None}, 'raw_legal_actions': ['a', 'c']},
+                  {'obs': np.random.random_sample((2,)), 'legal_actions': {1: None}, 'raw_legal_actions': ['b']},
+                  {'obs': np.random.random_sample((2,)), 'legal_actions': {0: None, 1: None, 2: None}, 'raw_legal_actions': ['a', 'b', 'c']}]
+        q_values = agent.predict_batch(states)
+        self.assertEqual(q_values.shape, (3, 3))
+        for state, values in zip(states, q_values):
+            self.assertTrue(np.allclose(agent.predict(state), values))
+        self.assertEqual(agent.eval_step_batch(states), [agent.eval_step(state)[0] for state in states])
+        self.assertEqual(agent.step_batch(states), [agent.step(state) for state in states])
+        self.assertEqual(agent.eval_step_batch(states)[1], 1)
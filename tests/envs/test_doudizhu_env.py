@@ -1,4 +1,6 @@
 import unittest
+from collections import Counter
+import numpy as np
 
 import rlcard
 from rlcard.agents.random_agent import RandomAgent
@@ -68,9 +70,79 @@ class TestDoudizhuEnv(unittest.TestCase):
         decoded = env._decode_action(29)
         self.assertEqual(decoded, '444')
 
+    def test_legal_action_features(self):
+        env = rlcard.make('doudizhu')
+        state, _ = env.reset()
+        features = state['legal_action_features']
+        self.assertEqual(features.shape, (len(state['legal_actions']), 54))
+        for row, (action_id, feature) in enumerate(state['legal_actions'].items()):
+            cards = env._decode_action(action_id)
+            # 4 features for each rank, one for each copy, then the jokers
+            expected = np.zeros(54, dtype=np.int8)
+            for rank, column in zip('3456789TJQKA2', range(0, 52, 4)):
+                expected[column:column+cards.count(rank)] = 1
+            expected[52:] = ['B' in cards, 'R' in cards]
+            self.assertTrue(np.array_equal(feature, expected))
+            self.assertTrue(np.array_equal(features[row], expected))
+            self.assertTrue(np.array_equal(env.get_action_feature(action_id), expected))
+        action_ids = list(state['legal_actions'])
+        self.assertTrue(np.array_equal(env.get_action_features(action_ids), features))
+
+    def test_encode_obs_with_step_back(self):
+        env = rlcard.make('doudizhu', config={'allow_step_back': True, 'seed': 1})
+        state, player_id = env.reset()
+        np_random = np.random.RandomState(1)
+        while not env.is_over():
+            for p in range(env.num_players):
+                self.assertTrue(np.array_equal(env.get_state(p)['obs'],
+                                               _reference_obs(env.game.get_state(p))))
+            action_ids = list(state['legal_actions'])
+            state, player_id = env.step(action_ids[np_random.randint(len(action_ids))])
+            if np_random.rand() < 0.2:
+                env.step_back()
+                state = env.get_state(env.get_player_id())
+
     def test_get_perfect_information(self):
         env = rlcard.make('doudizhu')
         _, player_id = env.reset()
         self.assertEqual(player_id, env.get_perfect_information()['current_player'])
+
+def _cards2array(cards):
+    # The string-based encoding of cards
+    array = np.zeros(54, dtype=np.int8)
+    if cards == 'pass':
+        return array
+    for card, num_times in Counter(cards).items():
+        if card in 'BR':
+            array[52 + 'BR'.index(card)] = 1
+        else:
+            column = '3456789TJQKA2'.index(card) * 4
+            array[column:column+num_times] = 1
+    return array
+
+def _reference_obs(state):
+    # Encode an observation from the strings of the raw state
+    def one_hot(num, size):
+        array = np.zeros(size, dtype=np.int8)
+        array[num - 1] = 1
+        return array
+    trace = state['trace']
+    last_action = ''
+    if trace:
+        last_action = trace[-2][1] if trace[-1][1] == 'pass' else trace[-1][1]
+    sequence = [''] * (9 - len(trace[-9:])) + [action for _, action in trace[-9:]]
+    features = [_cards2array(state['current_hand']), _cards2array(state['others_hand']),
+                _cards2array(last_action)] + [_cards2array(cards) for cards in sequence]
+    if state['self'] == 0:
+        features += [_cards2array(state['played_cards'][2]), _cards2array(state['played_cards'][1]),
+                     one_hot(state['num_cards_left'][2], 17), one_hot(state['num_cards_left'][1], 17)]
+    else:
+        teammate_id = 3 - state['self']
+        last_actions = {i: action for i, action in trace}
+        features += [_cards2array(state['played_cards'][0]), _cards2array(state['played_cards'][teammate_id]),
+                     _cards2array(last_actions.get(0, 'pass')), _cards2array(last_actions.get(teammate_id, 'pass')),
+                     one_hot(state['num_cards_left'][0], 20), one_hot(state['num_cards_left'][teammate_id], 17)]
+    return np.concatenate(features)
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,149 @@
+import unittest
+import numpy as np
+
+import rlcard
+from rlcard.utils import decode_obs, decode_obs_batch
+
+
+class FirstLegalAgent(object):
+
+    def __init__(self):
+        self.use_raw = False
+
+    @staticmethod
+    def step(state):
+        return list(state['legal_actions'].keys())[0]
+
+    def eval_step(self, state):
+        return self.step(state), {}
+
+class TestEnv(unittest.TestCase):
+
+    def test_run_columnar(self):
+        env = rlcard.make('uno', config={'seed': 0})
+        env.set_agents([FirstLegalAgent() for _ in range(env.num_players)])
+        trajectories, payoffs = env.run(is_training=False, mode='columnar')
+        self.assertEqual(len(trajectories), env.num_players)
+        self.assertEqual(payoffs.shape, (env.num_players, ))
+        steps = np.sort(np.concatenate([t['step'] for t in trajectories]))
+        self.assertTrue(np.array_equal(steps, np.arange(len(env.action_recorder))))
+        for trajectory in trajectories:
+            num = len(trajectory['action'])
+            self.assertEqual(trajectory['obs'].shape, (num, 4, 4, 15))
+            self.assertEqual(trajectory['legal_mask'].shape, (num, env.num_actions))
+            self.assertTrue(trajectory['legal_mask'][np.arange(num), trajectory['action']].all())
+
+    def test_run_columnar_matches_trajectory(self):
+        env = rlcard.make('doudizhu', config={'seed': 3})
+        env.set_agents([FirstLegalAgent() for _ in range(env.num_players)])
+        trajectories, payoffs = env.run(mode='columnar')
+        env.seed(3)
+        full_trajectories, full_payoffs = env.run()
+        self.assertTrue(np.array_equal(payoffs, full_payoffs))
+        for player_id in range(env.num_players):
+            states = full_trajectories[player_id][:-1:2]
+            actions = full_trajectories[player_id][1::2]
+            self.assertEqual(list(trajectories[player_id]['action']), actions)
+            offsets = trajectories[player_id]['legal_offsets']
+            self.assertEqual(len(offsets), len(states) + 1)
+            for i, state in enumerate(states):
+                self.assertTrue(np.array_equal(trajectories[player_id]['obs'][i], state['obs']))
+                legal_ids = trajectories[player_id]['legal_ids'][offsets[i]:offsets[i+1]]
+                self.assertEqual(list(legal_ids), sorted(state['legal_actions']))
+            self.assertNotIn('legal_mask', trajectories[player_id])
+
+    def test_run_many(self):
+        env = rlcard.make('blackjack', config={'seed': 0})
+        env.set_agents([FirstLegalAgent()])
+        trajectories, payoffs = env.run_many(100, is_training=True)
+        self.assertEqual(payoffs.shape, (100, 1))
+        self.assertEqual(set(trajectories[0]['episode']), set(range(100)))
+        self.assertTrue((trajectories[0]['action'] == 0).all())
+        _, payoffs = env.run_many(1)
+        self.assertEqual(payoffs.shape, (1, 1))
+
+    def test_legal_mask(self):
+        env = rlcard.make('uno', config={'legal_mask': True})
+        state, _ = env.reset()
+        self.assertEqual(state['legal_mask'].dtype, bool)
+        self.assertEqual(state['legal_mask'].shape, (env.num_actions, ))
+        self.assertEqual(set(np.flatnonzero(state['legal_mask'])), set(state['legal_actions']))
+
+        env = rlcard.make('uno')
+        state, _ = env.reset()
+        self.assertNotIn('legal_mask', state)
+
+    def test_packed_legal_mask(self):
+        env = rlcard.make('doudizhu', config={'legal_mask': True, 'seed': 0})
+        state, _ = env.reset()
+        for _ in range(20):
+            self.assertTrue(np.array_equal(state['legal_mask'], sorted(state['legal_actions'])))
+            self.assertTrue(all(type(action_id) is int for action_id in state['legal_actions']))
+            state, _ = env.step(list(state['legal_actions'])[-1])
+
+    def test_extract_obs_into(self):
+        for env_id in ['blackjack', 'no-limit-holdem', 'doudizhu', 'uno', 'mahjong', 'gin-rummy', 'bridge']:
+            env = rlcard.make(env_id, config={'seed': 1})
+            agent = FirstLegalAgent()
+            state, player_id = env.reset()
+            for _ in range(30):
+                obs = np.asarray(state['obs'])
+                out = np.full(obs.shape, 7, dtype=obs.dtype)
+                self.assertIs(env.extract_obs_into(out, player_id), out)
+                self.assertTrue(np.array_equal(out, obs), env_id)
+                if env.is_over():
+                    break
+                state, player_id = env.step(agent.step(state))
+
+        # A flat row of a larger buffer
+        env = rlcard.make('doudizhu', config={'seed': 1})
+        state, player_id = env.reset()
+        buffer = np.ones((2, 901), dtype=np.int8)
+        env.extract_obs_into(buffer[1, :790], player_id)
+        self.assertTrue(np.array_equal(buffer[1, :790], state['obs']))
+        self.assertTrue(np.all(buffer[1, 790:] == 1))
+
+    def test_compact_obs_dtype(self):
+        for env_id in ['blackjack', 'no-limit-holdem', 'doudizhu', 'uno', 'mahjong', 'gin-rummy', 'bridge']:
+            env = rlcard.make(env_id, config={'seed': 1})
+            compact_env = rlcard.make(env_id, config={'seed': 1, 'obs_dtype': 'compact'})
+            obs = env.reset()[0]['obs']
+            compact_obs = compact_env.reset()[0]['obs']
+            self.assertEqual(compact_obs.dtype, compact_env.compact_obs_dtype)
+            self.assertLessEqual(compact_obs.itemsize, 4)
+            self.assertTrue(np.array_equal(obs, compact_obs))
+
+        env = rlcard.make('uno', config={'obs_dtype': 'bool'})
+        self.assertEqual(env.reset()[0]['obs'].dtype, bool)
+
+    def test_obs_encoding(self):
+        for encoding in ['packed', 'sparse']:
+            env = rlcard.make('doudizhu', config={'seed': 1, 'obs_encoding': encoding})
+            env.set_agents([FirstLegalAgent() for _ in range(env.num_players)])
+            state, player_id = env.reset()
+            decoded = decode_obs(state['encoded_obs'], state['obs'].shape, encoding)
+            self.assertTrue(np.array_equal(decoded, state['obs']))
+
+            env.seed(2)
+            trajectories, _ = env.run(mode='columnar')
+            dense_env = rlcard.make('doudizhu', config={'seed': 2})
+            dense_env.set_agents(env.agents)
+            dense_trajectories, _ = dense_env.run(mode='columnar')
+            for player_id in range(env.num_players):
+                obs = dense_trajectories[player_id]['obs']
+                decoded = decode_obs_batch(trajectories[player_id]['obs'], obs.shape[1:], encoding)
+                self.assertTrue(np.array_equal(decoded, obs))
+
+        with self.assertRaises(ValueError):
+            rlcard.make('blackjack', config={'obs_encoding': 'packed'})
+        with self.assertRaises(ValueError):
+            rlcard.make('uno', config={'obs_encoding': 'zip'})
+
+    def test_run_mode(self):
+        env = rlcard.make('blackjack')
+        env.set_agents([FirstLegalAgent()])
+        with self.assertRaises(ValueError):
+            env.run(mode='unknown')
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,92 @@
+import asyncio
+import unittest
+
+import numpy as np
+
+import rlcard
+from rlcard.envs.game_host import GameHost, LocalAgent, AsyncAgent, TableTimeoutError
+
+
+class FirstActionAgent(object):
+    ''' Always plays the first legal action
+    '''
+    use_raw = False
+
+    def eval_step(self, state):
+        return list(state['legal_actions'].keys())[0], {}
+
+
+class SlowAgent(AsyncAgent):
+
+    async def act(self, state):
+        await asyncio.sleep(10)
+
+
+class TestGameHost(unittest.TestCase):
+
+    def test_run(self):
+        np_random = np.random.RandomState(0)
+        def tables():
+            for seed in range(50):
+                env = rlcard.make('uno', config={'seed': seed})
+                yield env, [LocalAgent(FirstActionAgent(), delay=lambda: np_random.rand() * 0.001)
+                            for _ in range(env.num_players)]
+        host = GameHost(max_tables=8)
+        results = asyncio.run(host.run(tables()))
+        self.assertEqual(len(results), 50)
+        self.assertEqual([result.table_id for result in results], list(range(50)))
+        self.assertEqual(host.num_active, 0)
+        for seed, result in enumerate(results):
+            self.assertIsNone(result.error)
+            self.assertTrue(result.env.is_over())
+            # The same game played synchronously gives the same payoffs
+            env = rlcard.make('uno', config={'seed': seed})
+            env.set_agents([FirstActionAgent() for _ in range(env.num_players)])
+            _, payoffs = env.run()
+            self.assertEqual(list(result.payoffs), list(payoffs))
+
+    def test_backpressure(self):
+        host = GameHost(max_tables=3)
+        num_active = []
+        async def tables():
+            for _ in range(20):
+                num_active.append(host.num_active)
+                env = rlcard.make('blackjack')
+                yield env, [LocalAgent(FirstActionAgent(), delay=0.001)]
+        results = asyncio.run(host.run(tables()))
+        self.assertEqual(len(results), 20)
+        self.assertLessEqual(max(num_active), 3)
+        self.assertTrue(all(result.error is None for result in results))
+
+    def test_timeouts(self):
+        env = rlcard.make('blackjack')
+        host = GameHost(action_timeout=0.01)
+        result = asyncio.run(host.play(env, [SlowAgent()]))
+        self.assertIsInstance(result.error, TableTimeoutError)
+        self.assertIsNone(result.payoffs)
+
+        host = GameHost(table_timeout=0.05)
+        async def play():
+            slow = host.submit(rlcard.make('blackjack'), [SlowAgent()])
+            fast = host.submit(rlcard.make('blackjack'), [LocalAgent(FirstActionAgent())])
+            return await asyncio.gather(*(await asyncio.gather(slow, fast)))
+        slow, fast = asyncio.run(play())
+        self.assertIsInstance(slow.error, TableTimeoutError)
+        self.assertIsNone(fast.error)
+
+        with self.assertRaises(ValueError):
+            asyncio.run(host.play(rlcard.make('uno'), [SlowAgent()]))
+
+    def test_cancel(self):
+        host = GameHost()
+        async def play():
+            task = await host.submit(rlcard.make('blackjack'), [SlowAgent()])
+            await asyncio.sleep(0.01)
+            task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+        asyncio.run(play())
+        self.assertEqual(host.num_active, 0)
+
+if __name__ == '__main__':
+    unittest.main()
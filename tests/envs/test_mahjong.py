@@ -45,6 +45,28 @@ class TestMahjongEnv(unittest.TestCase):
         # env.step_back()
         self.assertRaises(Exception, env.step_back)
 
+    def test_step_cache(self):
+        env = rlcard.make('mahjong', config={'allow_step_back':True, 'seed':3})
+        calls = []
+        get_legal_actions = env.game.get_legal_actions
+        def counted(state):
+            calls.append(1)
+            return get_legal_actions(state)
+        env.game.get_legal_actions = counted
+
+        state, _ = env.reset()
+        self.assertEqual(len(calls), 1)
+        action = list(state['legal_actions'].keys())[0]
+        next_state, player_id = env.step(action)
+        # Decoding the action reuses the legal actions of the state
+        self.assertEqual(len(calls), 2)
+        self.assertEqual(list(env._get_legal_actions().keys()), list(next_state['legal_actions'].keys()))
+        self.assertEqual(len(calls), 2)
+
+        state, _ = env.step_back()
+        self.assertEqual(len(calls), 3)
+        self.assertIn(action, state['legal_actions'])
+
     def test_run(self):
         env = rlcard.make('mahjong')
         env.set_agents([RandomAgent(env.num_actions) for _ in range(env.num_players)])
@@ -1,10 +1,19 @@
+import pickle
+import subprocess
+import sys
 import unittest
 
 import rlcard
-from rlcard.envs.registration import register, make
+from rlcard.envs.registration import register, make, EnvFactory
+from rlcard.envs.blackjack import BlackjackEnv
 from .determism_util import is_deterministic
 
 
+class CustomBlackjackEnv(BlackjackEnv):
+    ''' A custom environment that is not registered under its name
+    '''
+
+
 class TestRegistration(unittest.TestCase):
 
     def test_register(self):
@@ -20,6 +29,39 @@ class TestRegistration(unittest.TestCase):
         with self.assertRaises(ValueError):
             make('test_random_make')
 
+    def test_lazy_entry_point(self):
+        register(env_id='test_lazy', entry_point='rlcard.envs.not_a_module:NotAnEnv')
+        with self.assertRaises(ModuleNotFoundError):
+            make('test_lazy')
+        code = 'import sys, rlcard; rlcard.make("blackjack"); print("rlcard.envs.doudizhu" in sys.modules)'
+        output = subprocess.check_output([sys.executable, '-c', code])
+        self.assertEqual(output.split()[-1], b'False')
+
+    def test_env_factory(self):
+        env = rlcard.make('doudizhu', config={'seed': 5, 'rng': 'generator'})
+        factory = EnvFactory.from_env(env)
+        self.assertEqual(factory.modules, ['rlcard.envs.doudizhu', 'rlcard.games.doudizhu.game'])
+        self.assertLess(len(pickle.dumps(factory)), 1000)
+
+        new_env = pickle.loads(pickle.dumps(factory))()
+        self.assertEqual(new_env.config, env.config)
+        self.assertEqual(new_env.reset()[0]['raw_obs'], env.reset()[0]['raw_obs'])
+
+        self.assertEqual(EnvFactory('uno').modules, ['rlcard.envs.uno'])
+        with self.assertRaises(ValueError):
+            EnvFactory('test_random_make')
+
+    def test_env_factory_custom_env(self):
+        self.assertTrue(EnvFactory.can_make(rlcard.make('blackjack')))
+        env = CustomBlackjackEnv({'seed': 1, 'allow_step_back': False})
+        self.assertFalse(EnvFactory.can_make(env))
+        env.name = 'custom-blackjack'
+        self.assertFalse(EnvFactory.can_make(env))
+        # Custom environments go to the workers pickled, as before
+        new_env = pickle.loads(pickle.dumps(env))
+        self.assertIs(type(new_env), CustomBlackjackEnv)
+        self.assertEqual(new_env.reset()[0]['raw_obs'], env.reset()[0]['raw_obs'])
+
     def test_make_modes(self):
         register(env_id='test_env', entry_point='rlcard.envs.blackjack:BlackjackEnv')
 
@@ -0,0 +1,120 @@
+import unittest
+import numpy as np
+
+import rlcard
+from rlcard.games.doudizhu.utils import counts2str
+from rlcard.games.doudizhu.determinization import DoudizhuDealSampler
+from rlcard.games.bridge.determinization import BridgeDealSampler
+
+ENV_IDS = ['blackjack', 'no-limit-holdem', 'doudizhu', 'uno', 'mahjong', 'gin-rummy', 'bridge']
+
+def play(env, seed, max_steps=30):
+    ''' Play random legal actions and record the trajectory
+    '''
+    np_random = np.random.RandomState(seed)
+    trajectory = []
+    for _ in range(max_steps):
+        if env.is_over():
+            trajectory.append(list(env.get_payoffs()))
+            break
+        state = env.get_state(env.get_player_id())
+        legal_actions = list(state['legal_actions'])
+        action = legal_actions[np_random.randint(len(legal_actions))]
+        state, player_id = env.step(action)
+        trajectory.append((action, player_id, state['obs'].tobytes()))
+    return trajectory
+
+class TestSnapshot(unittest.TestCase):
+
+    def test_restore(self):
+        for env_id in ENV_IDS:
+            env = rlcard.make(env_id, config={'seed': 0})
+            env.reset()
+            play(env, 1, max_steps=2)
+            snapshot = env.snapshot()
+            num_actions = len(env.action_recorder)
+            trajectory = play(env, 2)
+            for _ in range(2):
+                state, player_id = env.restore(snapshot)
+                self.assertEqual(player_id, env.get_player_id())
+                self.assertEqual(len(env.action_recorder), num_actions)
+                self.assertEqual(play(env, 2), trajectory, env_id)
+
+    def test_restore_after_reset(self):
+        env = rlcard.make('doudizhu', config={'seed': 0})
+        env.reset()
+        snapshot = env.snapshot()
+        trajectory = play(env, 3, max_steps=100)
+        env.reset()
+        env.restore(snapshot)
+        self.assertEqual(play(env, 3, max_steps=100), trajectory)
+
+    def test_clone(self):
+        for env_id in ENV_IDS:
+            env = rlcard.make(env_id, config={'seed': 0})
+            env.reset()
+            play(env, 1, max_steps=2)
+            clone = env.clone()
+            self.assertIsNot(clone.game, env.game)
+            self.assertIsNot(clone.np_random, env.np_random)
+            trajectory = play(clone, 4)
+            obs = env.get_state(env.get_player_id())['obs']
+            clone.reset()
+            self.assertTrue(np.array_equal(env.get_state(env.get_player_id())['obs'], obs))
+            self.assertEqual(play(env, 4), trajectory, env_id)
+
+    def test_uno_wild_card(self):
+        env = rlcard.make('uno', config={'seed': 0})
+        env.reset()
+        np_random = np.random.RandomState(0)
+        while True:
+            state = env.get_state(env.get_player_id())
+            wild_actions = [action_id for action_id in state['legal_actions']
+                            if 'wild' in env._decode_action(action_id)]
+            if wild_actions:
+                break
+            legal_actions = list(state['legal_actions'])
+            env.step(legal_actions[np_random.randint(len(legal_actions))])
+        hand = list(state['raw_obs']['hand'])
+        snapshot = env.snapshot()
+
+        # Playing a wild card on a clone or after a snapshot takes a colour
+        for action_id in wild_actions:
+            clone = env.clone()
+            clone.step(action_id)
+            self.assertEqual(env.get_state(env.get_player_id())['raw_obs']['hand'], hand)
+            env.step(action_id)
+            state, _ = env.restore(snapshot)
+            self.assertEqual(state['raw_obs']['hand'], hand)
+
+    def test_deal_sampler_restores_env(self):
+        for env_id, sampler_class, num_steps in [('doudizhu', DoudizhuDealSampler, 10), ('bridge', BridgeDealSampler, 30)]:
+            env = rlcard.make(env_id, config={'seed': 0})
+            env.reset()
+            play(env, 1, max_steps=num_steps)
+            player_id = env.get_player_id()
+            sampler = sampler_class(env, np_random=np.random.RandomState(0))
+            deals = sampler.sample(10)
+            trajectory = play(env, 2, max_steps=1000)
+            self.assertTrue(env.is_over(), env_id)
+
+            # The cached state of the finished game is not kept
+            state, next_player_id = sampler.restore(deals[0])
+            self.assertFalse(env.is_over(), env_id)
+            self.assertEqual(next_player_id, player_id)
+            self.assertEqual(len(env.action_recorder), num_steps)
+            if env_id == 'doudizhu':
+                opponent_id = (player_id + 1) % 3
+                raw_obs = env.get_state(opponent_id)['raw_obs']
+                self.assertEqual(raw_obs['current_hand'], counts2str(deals[0][opponent_id]))
+            for deal in deals[1:]:
+                sampler.restore(deal)
+                play(env, 3, max_steps=1000)
+                self.assertTrue(env.is_over(), env_id)
+
+            # The actual hands replay the same game
+            sampler.restore()
+            self.assertEqual(play(env, 2, max_steps=1000), trajectory, env_id)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,101 @@
+import unittest
+from unittest import mock
+import numpy as np
+
+import rlcard
+from rlcard.envs.vec_env import VectorEnv, SubprocVectorEnv
+
+
+def random_actions(legal_mask):
+    return [np.random.choice(np.flatnonzero(mask)) for mask in legal_mask]
+
+class TestVectorEnv(unittest.TestCase):
+
+    def test_make_vec(self):
+        env = rlcard.make_vec('uno', 4)
+        self.assertIsInstance(env, VectorEnv)
+        self.assertEqual(len(env), 4)
+        obs, legal_mask, player_ids = env.reset()
+        self.assertEqual(obs.shape, (4, 4, 4, 15))
+        self.assertEqual(legal_mask.shape, (4, env.num_actions))
+        self.assertEqual(legal_mask.dtype, bool)
+        self.assertEqual(player_ids.shape, (4, ))
+        for i in range(4):
+            self.assertTrue(np.array_equal(obs[i], env.envs[i].get_state(player_ids[i])['obs']))
+            self.assertEqual(set(np.flatnonzero(legal_mask[i])), set(env.states[i]['legal_actions']))
+
+    def test_step_and_auto_reset(self):
+        env = rlcard.make_vec('blackjack', 3)
+        _, legal_mask, _ = env.reset()
+        # Standing ends every single player blackjack game
+        obs, legal_mask, player_ids, payoffs, dones = env.step([1, 1, 1])
+        self.assertTrue(dones.all())
+        for payoff in payoffs[:, 0]:
+            self.assertIn(payoff, [-1, 0, 1])
+        for e in env.envs:
+            self.assertFalse(e.is_over())
+
+    def test_padded_obs(self):
+        env = rlcard.make_vec('doudizhu', 2, config={'seed': 1})
+        obs, legal_mask, player_ids = env.reset()
+        self.assertEqual(obs.shape, (2, 901))
+        num_dones = 0
+        for _ in range(200):
+            obs, legal_mask, player_ids, payoffs, dones = env.step(random_actions(legal_mask))
+            for i in range(2):
+                state_obs = env.states[i]['obs']
+                self.assertTrue(np.array_equal(obs[i, :state_obs.size], state_obs))
+                self.assertFalse(obs[i, state_obs.size:].any())
+                if dones[i]:
+                    self.assertIn(payoffs[i].sum(), [1, 2])
+            num_dones += dones.sum()
+        self.assertGreater(num_dones, 0)
+
+    def test_seeding(self):
+        env_1 = rlcard.make_vec('uno', 2, config={'seed': 7})
+        env_2 = rlcard.make_vec('uno', 2, config={'seed': 7})
+        obs_1, _, _ = env_1.reset()
+        obs_2, _, _ = env_2.reset()
+        self.assertTrue(np.array_equal(obs_1, obs_2))
+
+    def test_subproc_matches_sync(self):
+        env = rlcard.make_vec('doudizhu', 5, config={'seed': 3}, num_workers=2)
+        self.assertIsInstance(env, SubprocVectorEnv)
+        sync_env = rlcard.make_vec('doudizhu', 5, config={'seed': 3})
+        with env:
+            obs, legal_mask, player_ids = env.reset()
+            sync_obs, sync_legal_mask, sync_player_ids = sync_env.reset()
+            self.assertTrue(np.array_equal(obs, sync_obs))
+            for _ in range(100):
+                actions = [np.flatnonzero(mask)[-1] for mask in legal_mask]
+                results = env.step(actions)
+                sync_results = sync_env.step(actions)
+                for result, sync_result in zip(results, sync_results):
+                    self.assertTrue(np.array_equal(result, sync_result))
+                legal_mask = results[1]
+        self.assertTrue(env.closed)
+
+    def test_subproc_without_shared_memory(self):
+        with mock.patch('rlcard.envs.vec_env.shared_memory', None):
+            env = rlcard.make_vec('doudizhu', 3, config={'seed': 3}, num_workers=2)
+        sync_env = rlcard.make_vec('doudizhu', 3, config={'seed': 3})
+        with env:
+            self.assertEqual(env._shms, {})
+            obs, legal_mask, player_ids = env.reset()
+            self.assertTrue(np.array_equal(obs, sync_env.reset()[0]))
+            for _ in range(50):
+                actions = [np.flatnonzero(mask)[0] for mask in legal_mask]
+                results = env.step(actions)
+                sync_results = sync_env.step(actions)
+                for result, sync_result in zip(results, sync_results):
+                    self.assertTrue(np.array_equal(result, sync_result))
+                legal_mask = results[1]
+
+    def test_subproc_forkserver(self):
+        with rlcard.make_vec('uno', 2, config={'seed': 3}, num_workers=2, context='forkserver') as env:
+            obs, _, _ = env.reset()
+            sync_obs, _, _ = rlcard.make_vec('uno', 2, config={'seed': 3}).reset()
+            self.assertTrue(np.array_equal(obs, sync_obs))
+
+if __name__ == '__main__':
+    unittest.main()
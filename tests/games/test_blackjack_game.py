@@ -27,6 +27,21 @@ class TestBlackjackGame(unittest.TestCase):
         self.assertEqual(game.winner['dealer'], 0)
         self.assertEqual(len(state['state'][0]), len(state['state'][1])+1)
 
+    def test_reset_reuses_objects(self):
+        game = Game()
+        game.configure(DEFAULT_GAME_CONFIG)
+        game.init_game()
+        dealer, players = game.dealer, game.players
+        while not game.is_over():
+            game.step('hit')
+        state, _ = game.init_game()
+        self.assertIs(game.dealer, dealer)
+        self.assertIs(game.players, players)
+        self.assertEqual(len(game.players[0].hand), 2)
+        self.assertEqual(len(game.dealer.hand), 2)
+        self.assertEqual(len(game.dealer.deck), 48)
+        self.assertEqual(game.players[0].status, 'alive')
+
     def test_step(self):
         game = Game()
         game.configure(DEFAULT_GAME_CONFIG)
@@ -9,10 +9,11 @@ import numpy as np
 
 from rlcard.games.bridge.game import BridgeGame as Game
 from rlcard.games.bridge.dealer import BridgeDealer
+from rlcard.games.bridge.determinization import BridgeDealSampler
 from rlcard.games.bridge.player import BridgePlayer
 from rlcard.games.bridge.utils.action_event import PassAction
 from rlcard.games.bridge.utils.bridge_card import BridgeCard
-from rlcard.games.bridge.utils.move import DealHandMove
+from rlcard.games.bridge.utils.move import DealHandMove, PlayCardMove
 
 
 class TestBridgeGame(unittest.TestCase):
@@ -115,6 +116,40 @@ class TestBridgeGame(unittest.TestCase):
             hand = player.hand
             self.assertTrue(not hand)
 
+    def test_deal_sampler(self):
+        # The current player is the dummy in the second game, so three hands are hidden
+        for seed, num_hidden in [(4, 2), (11, 3)]:
+            game = Game()
+            game.np_random = np.random.RandomState(seed)
+            game.init_game()
+            while game.round.play_card_count < 26:
+                legal_actions = game.judger.get_legal_actions()
+                game.step(legal_actions[game.np_random.randint(len(legal_actions))])
+            hands = [list(player.hand) for player in game.round.players]
+            sampler = BridgeDealSampler(game, np_random=np.random.RandomState(0))
+            self.assertEqual(len(sampler.hidden_ids), num_hidden)
+            deals = sampler.sample(100)
+            self.assertEqual(deals.shape, (100, 52))
+            visible = ~np.isin(sampler.owners, sampler.hidden_ids)
+            self.assertTrue((deals[:, visible] == sampler.owners[visible]).all())
+            for player_id, hand in enumerate(hands):
+                self.assertTrue(((deals == player_id).sum(axis=1) == len(hand)).all())
+            # The players who did not follow suit hold no card of the led suit
+            play_card_moves = [move for move in game.round.move_sheet if isinstance(move, PlayCardMove)]
+            for trick_start in range(0, 24, 4):
+                led_suit = play_card_moves[trick_start].card.suit
+                suit_cards = [card.card_id for card in BridgeCard.get_deck() if card.suit == led_suit]
+                for move in play_card_moves[trick_start + 1:trick_start + 4]:
+                    if move.card.suit != led_suit:
+                        self.assertFalse((deals[:, suit_cards] == move.player.player_id).any())
+
+            sampler.restore(deals[0])
+            for player_id, player in enumerate(game.round.players):
+                self.assertEqual(sorted(card.card_id for card in player.hand), np.flatnonzero(deals[0] == player_id).tolist())
+            self.assertTrue(game.judger.get_legal_actions())
+            sampler.restore()
+            self.assertEqual([player.hand for player in game.round.players], hands)
+
     def test_print_scene(self):
         game = Game()
         next_state, next_player_id = game.init_game()
@@ -0,0 +1,67 @@
+import unittest
+import numpy as np
+
+from rlcard.games.doudizhu.game import DoudizhuGame as Game
+from rlcard.games.doudizhu.endgame import EndgameSolver
+
+
+def _minimax(game):
+    # Solve the game by searching all the moves with step_back
+    player_id = game.round.current_player
+    win_value = 1 if player_id == game.round.landlord_id else -1
+    for action in list(game.state['actions']):
+        game.step(action)
+        if game.is_over():
+            value = 1 if game.winner_id == game.round.landlord_id else -1
+        else:
+            value = _minimax(game)
+        game.step_back()
+        if value == win_value:
+            return win_value
+    return -win_value
+
+
+class TestDoudizhuEndgame(unittest.TestCase):
+
+    def test_solve(self):
+        solver = EndgameSolver()
+        result = solver.solve(['33', '4', '5'], 0)
+        self.assertEqual((result.value, result.action, result.solved), (1, '33', True))
+        # Singles can not get past the pairs of the peasants
+        self.assertEqual(solver.solve(['345', 'TT', 'KK'], 0).value, -1)
+        # The peasant passes over the landlord's 2 and the teammate wins
+        result = solver.solve(['2', '3', '4'], 1, target_cards='2', greater_player=0)
+        self.assertEqual(result.value, 1)
+        # Passing over the teammate's 3 lets the landlord in with a 2
+        result = solver.solve(['22', '5', '4'], 2, target_cards='3', greater_player=1)
+        self.assertEqual((result.value, result.action), (-1, '4'))
+
+    def test_solve_game(self):
+        np_random = np.random.RandomState(0)
+        game = Game(allow_step_back=True)
+        game.np_random = np_random
+        solver = EndgameSolver()
+        for _ in range(10):
+            state, _ = game.init_game()
+            while not game.is_over() and sum(int(player.hand_counts.sum()) for player in game.players) > 8:
+                state, _ = game.step(state['actions'][np_random.randint(len(state['actions']))])
+            if game.is_over():
+                continue
+            result = solver.solve_game(game)
+            self.assertTrue(result.solved)
+            self.assertEqual(result.value, _minimax(game))
+            # The best action keeps the value
+            game.step(result.action)
+            if not game.is_over():
+                self.assertEqual(_minimax(game), result.value)
+            game.step_back()
+
+    def test_budget(self):
+        hands = ['3579JK', '4468TQ', '55779A']
+        self.assertFalse(EndgameSolver(max_nodes=2).solve(hands, 0).solved)
+        result = EndgameSolver(max_nodes=2).solve(['3', '4', '5'], 0)
+        self.assertEqual(result.nodes, 1)
+        self.assertTrue(result.solved)
+
+if __name__ == '__main__':
+    unittest.main()
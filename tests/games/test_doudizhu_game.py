@@ -4,8 +4,10 @@ import functools
 
 from rlcard.games.doudizhu.game import DoudizhuGame as Game
 from rlcard.games.doudizhu.utils import get_landlord_score, encode_cards
-from rlcard.games.doudizhu.utils import doudizhu_sort_str
+from rlcard.games.doudizhu.utils import doudizhu_sort_str, get_legal_action_cache, LegalActionCache
 from rlcard.games.doudizhu.judger import DoudizhuJudger as Judger
+from rlcard.games.doudizhu.utils import cards2counts, playable_action_ids
+from rlcard.games.doudizhu.determinization import DoudizhuDealSampler
 
 
 class TestDoudizhuGame(unittest.TestCase):
@@ -31,6 +33,28 @@ class TestDoudizhuGame(unittest.TestCase):
         self.assertEqual(len(total_cards), 54)
         self.assertListEqual(total_cards, deck)
 
+    def test_reset_reuses_objects(self):
+        game = Game()
+        game.init_game()
+        players, dealer, judger = game.players, game.round.dealer, game.judger
+        for player in players:
+            while player.current_hand:
+                player.current_hand.pop()
+        state, current_player = game.init_game()
+        self.assertIs(game.players, players)
+        self.assertIs(game.round.dealer, dealer)
+        self.assertIs(game.judger, judger)
+        self.assertEqual(len(state['trace']), 0)
+        self.assertEqual(sorted(state['current_hand'] + state['others_hand']), sorted(game.round.deck_str))
+        self.assertEqual(len(game.players[current_player].current_hand), 20)
+        self.assertEqual(game.players[current_player].role, 'landlord')
+
+        # The objects hold the generator and are created again after reseeding
+        game.np_random = np.random.RandomState(0)
+        game.init_game()
+        self.assertIsNot(game.players, players)
+        self.assertIs(game.round.dealer.np_random, game.np_random)
+
     def test_step(self):
         game = Game()
         state, _ = game.init_game()
@@ -124,6 +148,102 @@ class TestDoudizhuGame(unittest.TestCase):
         #greater_player should be the same
         self.assertEqual(game.round.greater_player.player_id, 0)
 
+    def test_step_back_restores_round(self):
+        game = Game(allow_step_back=True)
+        game.np_random = np.random.RandomState(2)
+        state, player_id = game.init_game()
+        landlord = game.players[player_id]
+        hand, hand_counts = list(landlord.current_hand), landlord.hand_counts.copy()
+        seen_cards, played_cards = game.round.seen_cards, game.round.public['played_cards']
+        # Play the seen cards that the landlord can lead with
+        action = max((cards for cards in state['actions'] if cards in seen_cards), key=len)
+        game.step(action)
+        self.assertEqual(landlord.played_cards, action)
+        self.assertEqual(landlord.hand_counts.sum(), 20 - len(action))
+        self.assertNotEqual(game.round.seen_cards, seen_cards)
+        game.step_back()
+        # The cards return after the remaining ones of their rank
+        self.assertEqual(set(landlord.current_hand), set(hand))
+        self.assertTrue(np.array_equal(landlord.hand_counts, hand_counts))
+        self.assertIsNone(landlord.played_cards)
+        self.assertEqual(game.round.seen_cards, seen_cards)
+        self.assertEqual(game.state['seen_cards'], seen_cards)
+        self.assertEqual(game.round.public['played_cards'], played_cards)
+        self.assertIsNone(game.round.greater_player)
+
+    def test_legal_action_cache(self):
+        cache = get_legal_action_cache()
+        cache.clear()
+        game = Game(allow_step_back=True)
+        state, _ = game.init_game()
+        action = state['actions'][0]
+        state, _ = game.step(action)
+        # The next player follows, which misses the cache
+        actions = state['actions']
+        self.assertEqual(cache.info(), (0, 1, cache.maxsize, 1))
+        game.step('pass')
+        misses = cache.info().misses
+        game.step_back()
+        game.step_back()
+        state, _ = game.step(action)
+        self.assertEqual(state['actions'], actions)
+        # Both the state restored by step_back and the replayed one hit
+        self.assertEqual(cache.info().hits, 2)
+        self.assertEqual(cache.info().misses, misses)
+
+        cache = LegalActionCache(maxsize=2)
+        cache.put(1, ('pass', ))
+        cache.put(2, ('pass', ))
+        cache.get(1)
+        cache.put(3, ('pass', ))
+        self.assertIsNone(cache.get(2))
+        self.assertEqual(cache.info(), (1, 1, 2, 2))
+
+    def test_deal_sampler(self):
+        game = Game(allow_step_back=True)
+        game.np_random = np.random.RandomState(1)
+        state, _ = game.init_game()
+        for _ in range(10):
+            state, player_id = game.step(state['actions'][game.np_random.randint(len(state['actions']))])
+        self.assertNotEqual(player_id, game.round.landlord_id)
+        hands = [player.hand_counts.copy() for player in game.players]
+        sampler = DoudizhuDealSampler(game, np_random=np.random.RandomState(0))
+        deals = sampler.sample(200)
+        self.assertEqual(deals.shape, (200, 3, 15))
+        self.assertTrue((deals[:, player_id] == hands[player_id]).all())
+        self.assertTrue((deals.sum(axis=1) == sum(hands)).all())
+        self.assertEqual(deals.sum(axis=2).tolist(), [state['num_cards_left']] * 200)
+        # The landlord still holds the seen cards that have not been played
+        self.assertTrue((deals[:, 0] >= cards2counts(game.round.seen_cards)).all())
+        self.assertGreater(len(np.unique(deals.reshape(200, -1), axis=0)), 100)
+
+        deal = deals[next(i for i in range(200) if not (deals[i] == hands).all())]
+        sampler.restore(deal)
+        self.assertTrue(np.array_equal([player.hand_counts for player in game.players], deal))
+        self.assertEqual(sorted(len(player.current_hand) for player in game.players), sorted(state['num_cards_left']))
+        self.assertEqual(game.state['self'], player_id)
+        # The playable cards of the new hands are right after stepping back
+        while game.step_back():
+            for player in game.players:
+                expected = Judger._sort_ids(playable_action_ids(player.hand_counts))
+                self.assertTrue(np.array_equal(game.judger.playable_ids[player.player_id], expected))
+        self.assertEqual(sum(len(player.current_hand) for player in game.players), 54)
+        sampler.restore()
+        self.assertTrue(np.array_equal([player.hand_counts for player in game.players], hands))
+
+    def test_deal_sampler_seen_cards(self):
+        game = Game()
+        game.np_random = np.random.RandomState(6)
+        game.init_game()
+        # Both fives of the landlord are seen cards, and one is played
+        self.assertEqual(game.round.seen_cards, '55J')
+        self.assertEqual(game.players[0].hand_counts[2], 2)
+        game.step('5')
+        self.assertEqual(game.round.seen_cards, 'J')
+        deals = DoudizhuDealSampler(game, np_random=np.random.RandomState(0)).sample(200)
+        self.assertTrue((deals[:, 0, 2] >= 1).all())
+        self.assertTrue((deals[:, 0, 8] >= 1).all())
+
     def test_get_landlord_score(self):
         score_1 = get_landlord_score('56888TTQKKKAA222R')
         self.assertEqual(score_1, 12)
@@ -1,6 +1,8 @@
 import unittest
+import numpy as np
 
-from rlcard.games.doudizhu.utils import CARD_TYPE
+from rlcard.games.doudizhu.utils import CARD_TYPE, TYPE_CARD, ID_2_ACTION
+from rlcard.games.doudizhu.utils import contains_cards, cards2counts, get_gt_action_ids
 from rlcard.games.doudizhu.judger import DoudizhuJudger as Judger
 
 class TestDoudizhuGame(unittest.TestCase):
@@ -155,5 +157,32 @@ class TestDoudizhuGame(unittest.TestCase):
             self.assertIn(c, playable_cards)
         self.assertEqual(len(playable_cards), len(all_cards_list))
 
+    def test_playable_cards_from_random_hands(self):
+        deck = '3333444455556666777788889999TTTTJJJJQQQQKKKKAAAA2222BR'
+        np_random = np.random.RandomState(0)
+        for size in (1, 5, 17, 20):
+            hand = ''.join(sorted(np_random.choice(list(deck), size, replace=False), key='3456789TJQKA2BR'.index))
+            expected = {cards for cards in ID_2_ACTION if cards != 'pass' and contains_cards(hand, cards)}
+            self.assertEqual(Judger.playable_cards_from_hand(hand), expected)
+
+    def test_get_gt_action_ids(self):
+        hand = '3344455566789TJQKA2BR'
+        for target in ('5', '33', '33344', '3456789', '5555', 'BR'):
+            # The original enumeration with strings
+            expected = []
+            type_dict = {}
+            for card_type, weight in CARD_TYPE[0][target]:
+                type_dict.setdefault(card_type, weight)
+            if 'rocket' not in type_dict:
+                type_dict['rocket'] = -1
+                type_dict.setdefault('bomb', -1)
+                for card_type, weight in type_dict.items():
+                    for can_weight, cards_list in TYPE_CARD[card_type].items():
+                        if int(can_weight) > int(weight):
+                            expected.extend(cards for cards in cards_list
+                                            if cards not in expected and contains_cards(hand, cards))
+            action_ids = get_gt_action_ids(cards2counts(hand), target)
+            self.assertEqual([ID_2_ACTION[i] for i in action_ids], expected)
+
 if __name__ == '__main__':
     unittest.main()
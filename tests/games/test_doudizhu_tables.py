@@ -0,0 +1,54 @@
+import os
+import json
+import tempfile
+import unittest
+import zipfile
+from collections import OrderedDict
+
+import numpy as np
+
+from rlcard.games.doudizhu.tables import ZIP_PATH, TABLE_VERSION, compile_tables, save_tables, load_tables
+from rlcard.games.doudizhu.utils import ID_2_ACTION, ACTION_2_ID, CARD_TYPE, TYPE_CARD
+
+
+class TestDoudizhuTables(unittest.TestCase):
+
+    def test_save_and_load(self):
+        tables = compile_tables()
+        with tempfile.TemporaryDirectory() as directory:
+            save_tables(tables, directory)
+            loaded = load_tables(directory)
+            for name, array in tables.items():
+                self.assertIsInstance(loaded[name], np.memmap)
+                self.assertTrue(np.array_equal(loaded[name], array))
+            del loaded
+
+    def test_save_removes_old_versions(self):
+        tables = compile_tables()
+        with tempfile.TemporaryDirectory() as directory:
+            old_path = os.path.join(directory, 'action_space.v{}.npy'.format(TABLE_VERSION - 1))
+            np.save(old_path, tables['action_space'])
+            save_tables(tables, directory)
+            self.assertFalse(os.path.exists(old_path))
+            self.assertEqual(len(os.listdir(directory)), len(tables))
+
+    def test_tables_match_json(self):
+        with zipfile.ZipFile(ZIP_PATH, 'r') as zip_ref:
+            action_space = zip_ref.read('jsondata/action_space.txt').decode().split()
+            card_type = json.loads(zip_ref.read('jsondata/card_type.json'), object_pairs_hook=OrderedDict)
+            type_card = json.loads(zip_ref.read('jsondata/type_card.json'), object_pairs_hook=OrderedDict)
+        self.assertEqual(ID_2_ACTION, action_space)
+        self.assertEqual(ACTION_2_ID['pass'], len(action_space) - 1)
+        self.assertEqual(CARD_TYPE[1], list(card_type))
+        self.assertEqual(CARD_TYPE[2], set(card_type))
+        for cards, types in card_type.items():
+            self.assertEqual(CARD_TYPE[0][cards], types)
+        self.assertNotIn('pass', CARD_TYPE[0])
+        with self.assertRaises(KeyError):
+            CARD_TYPE[0]['pass']
+        self.assertEqual(list(TYPE_CARD), list(type_card))
+        for t, ranks in type_card.items():
+            self.assertEqual(list(TYPE_CARD[t].items()), list(ranks.items()))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -17,5 +17,10 @@ class TestRegistration(unittest.TestCase):
         with self.assertRaises(ValueError):
             load('test_random_make')
 
+    def test_lazy_entry_point(self):
+        register(model_id='test_lazy', entry_point='rlcard.models.not_a_module:NotAModel')
+        with self.assertRaises(ModuleNotFoundError):
+            load('test_lazy')
+
 if __name__ == '__main__':
     unittest.main()
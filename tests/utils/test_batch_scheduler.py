@@ -0,0 +1,64 @@
+import unittest
+
+import rlcard
+from rlcard.utils import BatchScheduler
+
+
+class FirstActionAgent(object):
+    ''' Always plays the first legal action
+    '''
+    use_raw = False
+
+    def step(self, state):
+        return list(state['legal_actions'].keys())[0]
+
+    def eval_step(self, state):
+        return self.step(state), {}
+
+
+class BatchFirstActionAgent(FirstActionAgent):
+    ''' Counts the batched calls
+    '''
+
+    def __init__(self):
+        self.batch_sizes = []
+
+    def eval_step_batch(self, states):
+        self.batch_sizes.append(len(states))
+        return [self.step(state) for state in states]
+
+
+class TestBatchScheduler(unittest.TestCase):
+
+    def test_run(self):
+        for env_id in ['uno', 'doudizhu', 'mahjong']:
+            env = rlcard.make(env_id)
+            envs = [rlcard.make(env_id, config={'seed': seed}) for seed in range(4)]
+            agents = [FirstActionAgent() for _ in range(env.num_players)]
+            results = BatchScheduler(envs, agents).run(4, is_training=True)
+            self.assertEqual(len(results), 4)
+
+            # The games are the same as the sequential ones
+            expected = []
+            for seed in range(4):
+                env = rlcard.make(env_id, config={'seed': seed})
+                env.set_agents(agents)
+                expected.append(env.run(is_training=True))
+            expected_payoffs = sorted(tuple(payoffs) for _, payoffs in expected)
+            self.assertEqual(sorted(tuple(payoffs) for _, payoffs in results), expected_payoffs)
+            for trajectories, _ in results:
+                for player_trajectory in trajectories:
+                    self.assertEqual(len(player_trajectory) % 2, 1)
+
+    def test_batching(self):
+        agent = BatchFirstActionAgent()
+        envs = [rlcard.make('uno', config={'seed': seed}) for seed in range(8)]
+        results = BatchScheduler(envs, [agent, agent]).run(20)
+        self.assertEqual(len(results), 20)
+        # Both seats share the agent, so all the games are batched together
+        self.assertEqual(agent.batch_sizes[0], 8)
+        self.assertEqual(max(agent.batch_sizes), 8)
+        self.assertLess(len(agent.batch_sizes), sum(agent.batch_sizes))
+
+if __name__ == '__main__':
+    unittest.main()
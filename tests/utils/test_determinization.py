@@ -0,0 +1,38 @@
+import unittest
+import numpy as np
+
+from rlcard.utils.determinization import sample_deals
+
+
+class TestDeterminization(unittest.TestCase):
+
+    def test_sample_deals(self):
+        np_random = np.random.RandomState(0)
+        owners = sample_deals(1000, [3, 5], num_cards=8, np_random=np_random)
+        self.assertEqual(owners.shape, (1000, 8))
+        self.assertTrue(((owners == 0).sum(axis=1) == 3).all())
+        # Every card is as likely in the first hand
+        self.assertTrue(np.allclose((owners == 0).mean(axis=0), 3 / 8, atol=0.06))
+
+    def test_allowed(self):
+        np_random = np.random.RandomState(0)
+        allowed = np.ones((3, 9), dtype=bool)
+        allowed[0, :3] = False
+        allowed[1, 3:6] = False
+        allowed[[1, 2], 8] = False
+        owners = sample_deals(500, [3, 3, 3], allowed, np_random=np_random)
+        self.assertTrue((owners[:, 8] == 0).all())
+        self.assertTrue(allowed[owners, np.arange(9)].all())
+        for hand in range(3):
+            self.assertTrue(((owners == hand).sum(axis=1) == 3).all())
+
+    def test_inconsistent(self):
+        allowed = np.ones((2, 4), dtype=bool)
+        allowed[1, :3] = False
+        with self.assertRaises(ValueError):
+            sample_deals(10, [2, 2], allowed)
+        with self.assertRaises(ValueError):
+            sample_deals(10, [2, 3], num_cards=4)
+
+if __name__ == '__main__':
+    unittest.main()
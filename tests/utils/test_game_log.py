@@ -0,0 +1,121 @@
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+import rlcard
+from rlcard.utils import GameLogWriter, GameLogReader
+from rlcard.utils.game_log import GameRecord, encode_record, decode_record, replay, verify
+
+ENV_IDS = ['blackjack', 'doudizhu', 'uno']
+
+def play(env, seed):
+    ''' Play a random game, choosing the actions with numpy
+    '''
+    rng = np.random.RandomState(seed)
+    env.seed(seed)
+    state, _ = env.reset()
+    observations = [state['obs']]
+    while not env.is_over():
+        legal_actions = list(state['legal_actions'].keys())
+        state, _ = env.step(legal_actions[rng.randint(len(legal_actions))])
+        observations.append(state['obs'])
+    return observations
+
+
+class FirstActionAgent(object):
+    ''' Always plays the first legal action
+    '''
+    use_raw = False
+
+    def eval_step(self, state):
+        return list(state['legal_actions'].keys())[0], {}
+
+
+class TestGameLog(unittest.TestCase):
+
+    def setUp(self):
+        fd, self.path = tempfile.mkstemp(suffix='.log')
+        os.close(fd)
+        os.remove(self.path)
+
+    def tearDown(self):
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+    def test_encode_record(self):
+        record = GameRecord('uno', {'seed': 1}, 2**40, [0, 3, 60], [1.0, -1.0])
+        decoded = decode_record(encode_record(record))
+        self.assertEqual(decoded.env_id, 'uno')
+        self.assertEqual(decoded.config, {'seed': 1})
+        self.assertEqual(decoded.seed, 2**40)
+        self.assertEqual(decoded.actions.tolist(), [0, 3, 60])
+        self.assertEqual(decoded.payoffs.tolist(), [1.0, -1.0])
+        # Large action ids need wider integers
+        record = record._replace(actions=[27471, 0])
+        self.assertEqual(decode_record(encode_record(record)).actions.tolist(), [27471, 0])
+        self.assertGreater(len(encode_record(record)), len(encode_record(record._replace(actions=[1, 0]))))
+
+    def test_replay(self):
+        observations = {}
+        with GameLogWriter(self.path) as writer:
+            for env_id in ENV_IDS:
+                env = rlcard.make(env_id)
+                for seed in range(3):
+                    observations[(env_id, seed)] = play(env, seed)
+                    writer.record(env, seed)
+
+        with GameLogReader(self.path) as reader:
+            records = list(reader)
+        self.assertEqual(len(records), len(ENV_IDS) * 3)
+        for i, record in enumerate(records):
+            self.assertEqual(record.env_id, ENV_IDS[i // 3])
+            self.assertTrue(verify(record))
+            expected = observations[(record.env_id, record.seed)]
+            self.assertEqual(len(record.actions), len(expected) - 1)
+            num_steps = len(record.actions) // 2
+            env = replay(record, num_steps)
+            state = env.get_state(env.get_player_id())
+            self.assertTrue(np.array_equal(state['obs'], expected[num_steps]))
+
+    def test_append(self):
+        env = rlcard.make('blackjack')
+        env.set_agents([FirstActionAgent()])
+        with GameLogWriter(self.path) as writer:
+            writer.run(env, seed=5)
+        with GameLogWriter(self.path) as writer:
+            writer.run(env)
+        with GameLogReader(self.path) as reader:
+            self.assertEqual(len(reader), 2)
+            self.assertEqual(reader[0].seed, 5)
+            for record in reader:
+                self.assertTrue(verify(record))
+        # Closing again does nothing
+        reader.close()
+
+        # A partially written record is ignored
+        with open(self.path, 'ab') as f:
+            f.write(b'\xff\x00\x00\x00\x01')
+        with GameLogReader(self.path) as reader:
+            self.assertEqual(len(reader), 2)
+
+    def test_not_a_log(self):
+        for data in [b'', b'RLC', b'XXXX\x01']:
+            with open(self.path, 'wb') as f:
+                f.write(data)
+            with self.assertRaises(ValueError):
+                GameLogReader(self.path)
+
+    def test_raw_actions(self):
+        env = rlcard.make('blackjack')
+        env.seed(0)
+        state, _ = env.reset()
+        while not env.is_over():
+            state, _ = env.step(state['raw_legal_actions'][0], raw_action=True)
+        with GameLogWriter(self.path) as writer:
+            with self.assertRaises(ValueError):
+                writer.record(env, 0)
+
+if __name__ == '__main__':
+    unittest.main()
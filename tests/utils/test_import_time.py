@@ -0,0 +1,36 @@
+import subprocess
+import sys
+import unittest
+
+from rlcard.utils.utils import is_torch_available
+
+# Seconds that `import rlcard` and `import rlcard.agents` may take on top of
+# importing numpy
+IMPORT_TIME_BUDGET = 1.0
+
+def run_python(code):
+    return subprocess.check_output([sys.executable, '-c', code]).decode().split()
+
+class TestImportTime(unittest.TestCase):
+
+    def test_import_time(self):
+        code = ('import time, numpy; start = time.perf_counter(); '
+                'import rlcard, rlcard.agents; print(time.perf_counter() - start)')
+        elapsed = min(float(run_python(code)[-1]) for _ in range(3))
+        self.assertLess(elapsed, IMPORT_TIME_BUDGET)
+
+    def test_lazy_agents(self):
+        code = ('import sys, rlcard.agents; print("torch" in sys.modules); '
+                'from rlcard.agents import RandomAgent; print("rlcard.agents.cfr_agent" in sys.modules)')
+        self.assertEqual(run_python(code)[-2:], ['False', 'False'])
+
+    def test_is_torch_available(self):
+        try:
+            import torch
+            available = True
+        except ImportError:
+            available = False
+        self.assertEqual(is_torch_available(), available)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,54 @@
+import copy
+import pickle
+import unittest
+
+import rlcard
+from rlcard.utils import LazyState
+
+
+class TestLazyState(unittest.TestCase):
+
+    def test_lazy_field(self):
+        calls = []
+        def build():
+            calls.append(1)
+            return [1, 2]
+        state = LazyState({'obs': 0})
+        state.set_lazy('raw', build)
+        self.assertIn('raw', state)
+        self.assertEqual(len(state), 2)
+        self.assertEqual(calls, [])
+        self.assertEqual(state['raw'], [1, 2])
+        self.assertEqual(state.get('raw'), [1, 2])
+        self.assertEqual(calls, [1])
+        self.assertIsNone(state.get('missing'))
+        with self.assertRaises(KeyError):
+            state['missing']
+
+    def test_dict_compatible(self):
+        state = LazyState({'obs': 0})
+        state.set_lazy('raw', lambda: 'a')
+        self.assertEqual(state, {'obs': 0, 'raw': 'a'})
+        state = LazyState({'obs': 0})
+        state.set_lazy('raw', lambda: 'a')
+        self.assertEqual(dict(state), {'obs': 0, 'raw': 'a'})
+        state = LazyState({'obs': 0})
+        state.set_lazy('raw', lambda: 'a')
+        self.assertEqual(list(state.items()), [('obs', 0), ('raw', 'a')])
+        state = LazyState({'obs': 0})
+        state.set_lazy('raw', lambda: 'a')
+        self.assertEqual(pickle.loads(pickle.dumps(state)), {'obs': 0, 'raw': 'a'})
+        self.assertEqual(copy.deepcopy(state)['raw'], 'a')
+        state['raw'] = 'b'
+        self.assertEqual(state['raw'], 'b')
+
+    def test_env_state(self):
+        for env_id in ['blackjack', 'doudizhu', 'uno', 'gin-rummy']:
+            env = rlcard.make(env_id)
+            state, _ = env.reset()
+            self.assertIsInstance(state, LazyState)
+            self.assertNotIn('raw_legal_actions', dict.keys(state))
+            self.assertEqual(len(set(state['raw_legal_actions'])), len(state['legal_actions']))
+
+if __name__ == '__main__':
+    unittest.main()
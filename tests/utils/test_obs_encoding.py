@@ -0,0 +1,36 @@
+import unittest
+import numpy as np
+
+from rlcard.utils.obs_encoding import encode_obs, decode_obs, decode_obs_batch
+
+
+class TestObsEncoding(unittest.TestCase):
+
+    def test_round_trip(self):
+        np_random = np.random.RandomState(0)
+        batch = [np_random.randint(2, size=(5, 52)) for _ in range(4)]
+        for encoding in ['dense', 'packed', 'sparse']:
+            encoded = [encode_obs(obs, encoding) for obs in batch]
+            self.assertTrue(np.array_equal(decode_obs(encoded[0], (5, 52), encoding), batch[0]))
+            decoded = decode_obs_batch(encoded, (5, 52), encoding, dtype=np.float32)
+            self.assertEqual(decoded.dtype, np.float32)
+            self.assertTrue(np.array_equal(decoded, np.array(batch)))
+
+    def test_sizes(self):
+        obs = np.zeros(901, dtype=np.int8)
+        obs[[0, 5, 900]] = 1
+        packed = encode_obs(obs, 'packed')
+        self.assertEqual(packed.dtype, np.uint8)
+        self.assertEqual(packed.shape, (113, ))
+        sparse = encode_obs(obs, 'sparse')
+        self.assertEqual(sparse.dtype, np.int16)
+        self.assertEqual(sparse.tolist(), [0, 5, 900])
+        self.assertEqual(decode_obs_batch(np.array([packed]), (901, ), 'packed').shape, (1, 901))
+        self.assertEqual(decode_obs_batch([], (901, ), 'sparse').shape, (0, 901))
+
+    def test_unknown_encoding(self):
+        with self.assertRaises(ValueError):
+            encode_obs(np.zeros(4), 'zip')
+
+if __name__ == '__main__':
+    unittest.main()
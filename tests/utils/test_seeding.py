@@ -0,0 +1,74 @@
+import pickle
+import unittest
+
+import numpy as np
+
+import rlcard
+from rlcard.utils import seeding
+
+ENV_IDS = ['blackjack', 'no-limit-holdem', 'doudizhu', 'uno', 'mahjong', 'gin-rummy', 'bridge']
+
+def play(env, seed):
+    ''' Play the current game to the end and return the actions and payoffs
+    '''
+    np_random = np.random.RandomState(seed)
+    state = env.get_state(env.get_player_id())
+    actions = []
+    while not env.is_over():
+        legal_actions = list(state['legal_actions'])
+        actions.append(legal_actions[np_random.randint(len(legal_actions))])
+        state, _ = env.step(actions[-1])
+    return actions, list(env.get_payoffs())
+
+class TestSeeding(unittest.TestCase):
+
+    def test_np_random(self):
+        rng, seed = seeding.np_random(3, 'generator')
+        self.assertEqual(seed, 3)
+        self.assertIsInstance(rng.generator, np.random.Generator)
+        state = rng.get_state()
+        values = [rng.randint(10), rng.randint(2, 5), rng.choice([1, 2, 3])]
+        deck = list(range(10))
+        rng.shuffle(deck)
+        self.assertEqual(sorted(deck), list(range(10)))
+        self.assertTrue(0 <= values[0] < 10 and 2 <= values[1] < 5)
+
+        rng.set_state(state)
+        self.assertEqual([rng.randint(10), rng.randint(2, 5), rng.choice([1, 2, 3])], values)
+        copy = pickle.loads(pickle.dumps(rng))
+        self.assertEqual(copy.randint(1000), rng.randint(1000))
+        self.assertEqual(seeding.np_random(3, 'generator')[0].randint(1000), seeding.np_random(3, 'generator')[0].randint(1000))
+        with self.assertRaises(ValueError):
+            seeding.np_random(3, 'unknown')
+
+    def test_spawn_seeds(self):
+        seeds = seeding.spawn_seeds(0, 8)
+        self.assertEqual(len(set(seeds)), 8)
+        self.assertEqual(seeds, seeding.spawn_seeds(0, 8))
+        self.assertNotEqual(seeds, seeding.spawn_seeds(1, 8))
+        self.assertTrue(all(isinstance(seed, int) and 0 <= seed < 2**64 for seed in seeds))
+        # Spawned seeds can be spawned again, e.g., for the actors of a device
+        self.assertEqual(len(set(seeding.spawn_seeds(seeds[0], 4)) | set(seeds)), 12)
+        self.assertEqual(len(set(seeding.spawn_seeds(None, 4))), 4)
+
+    def test_generator_env(self):
+        for env_id in ENV_IDS:
+            env = rlcard.make(env_id, config={'rng': 'generator'})
+            self.assertIsInstance(env.game.np_random, seeding.GeneratorRandomState)
+            seed = env.seed(5)
+            env.reset()
+            trajectory = play(env, 0)
+            env.seed(seed)
+            env.reset()
+            self.assertEqual(play(env, 0), trajectory, env_id)
+
+            env.seed(seed)
+            env.reset()
+            snapshot = env.snapshot()
+            clone = env.clone()
+            self.assertEqual(play(clone, 1), play(env, 1), env_id)
+            env.restore(snapshot)
+            self.assertEqual(play(env, 0), trajectory, env_id)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,6 +1,6 @@
 import unittest
 import numpy as np
-from rlcard.utils.utils import init_54_deck, init_standard_deck, rank2int, print_card, elegent_form, reorganize, tournament
+from rlcard.utils.utils import init_54_deck, init_standard_deck, rank2int, print_card, elegent_form, reorganize, tournament, remove_illegal, legal_action_ids
 import rlcard
 from rlcard.agents.random_agent import RandomAgent
 
@@ -37,6 +37,19 @@ class TestUtils(unittest.TestCase):
         self.assertEqual(len(trajectories[0]), 1)
         self.assertEqual(len(trajectories[0][0]), 5)
 
+    def test_remove_illegal(self):
+        action_probs = np.array([0.1, 0.2, 0.3, 0.4])
+        expected = np.array([0.0, 1 / 3, 0.0, 2 / 3])
+        self.assertTrue(np.allclose(remove_illegal(action_probs, [1, 3]), expected))
+        self.assertTrue(np.allclose(remove_illegal(action_probs, np.array([False, True, False, True])), expected))
+        self.assertTrue(np.allclose(remove_illegal(action_probs, np.array([1, 3])), expected))
+        self.assertTrue(np.allclose(remove_illegal(np.zeros(4), np.array([False, True, False, True])), [0, 0.5, 0, 0.5]))
+
+    def test_legal_action_ids(self):
+        self.assertEqual(list(legal_action_ids({'legal_actions': {2: None, 0: None}})), [2, 0])
+        self.assertEqual(list(legal_action_ids({'legal_actions': {}, 'legal_mask': np.array([True, False, True])})), [0, 2])
+        self.assertEqual(list(legal_action_ids({'legal_actions': {}, 'legal_mask': np.array([4, 7])})), [4, 7])
+
     def test_tournament(self):
         env = rlcard.make('leduc-holdem')
         env.set_agents([RandomAgent(env.num_actions), RandomAgent(env.num_actions)])